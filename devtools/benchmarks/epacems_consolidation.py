@@ -0,0 +1,104 @@
+#! /usr/bin/env python
+r"""Compare filtered per-state rereads with single-pass EPA CEMS consolidation.
+
+Synthetic quarterly EPA CEMS partitions are written for several years, and then
+consolidated into a single parquet file twice: once with year-state row groups, by
+reading every quarter once per state with a pushdown filter, as
+``consolidate_partitions`` used to, and once with quarter-state row groups, using
+:func:`pudl.etl.epacems_assets.split_quarter_by_state`, which reads each quarter once.
+
+Example:
+    python devtools/benchmarks/epacems_consolidation.py \\
+        --years 3 --rows-per-quarter 2000000
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+import click
+import pyarrow as pa
+import pyarrow.parquet as pq
+from synthetic import synthetic_table
+
+from pudl.etl.epacems_assets import split_quarter_by_state
+from pudl.metadata.classes import Resource
+from pudl.metadata.enums import EPACEMS_STATES
+
+TABLE_NAME = "core_epacems__hourly_emissions"
+
+
+def _write_partitions(
+    path: Path, years: list[int], rows_per_quarter: int, schema: pa.Schema
+) -> dict[int, list[str]]:
+    """Write synthetic quarterly partitions and return the quarters in each year."""
+    year_quarters = {}
+    for year in years:
+        year_quarters[year] = [f"{year}q{quarter}" for quarter in range(1, 5)]
+        for seed, year_quarter in enumerate(year_quarters[year]):
+            df = synthetic_table(TABLE_NAME, rows_per_quarter, seed=seed).assign(
+                year=year
+            )
+            pq.write_table(
+                pa.Table.from_pandas(df, schema=schema, preserve_index=False),
+                path / f"epacems-{year_quarter}.parquet",
+                compression="snappy",
+            )
+    return year_quarters
+
+
+def _filtered_rereads(path: Path, year_quarters: list[str], schema: pa.Schema):
+    """Split a year by state by rereading every quarter once per state."""
+    for state in EPACEMS_STATES:
+        yield pa.concat_tables(
+            [
+                pq.read_table(
+                    source=path / f"epacems-{year_quarter}.parquet",
+                    filters=[[("state", "=", state.upper())]],
+                    schema=schema,
+                )
+                for year_quarter in year_quarters
+            ]
+        )
+
+
+def _single_pass(path: Path, year_quarters: list[str], schema: pa.Schema):
+    """Split each quarter of a year by state, reading every quarter once."""
+    for year_quarter in sorted(year_quarters):
+        yield from split_quarter_by_state(
+            path / f"epacems-{year_quarter}.parquet", schema
+        )
+
+
+@click.command()
+@click.option("--years", type=int, default=2, show_default=True)
+@click.option("--rows-per-quarter", type=int, default=1_000_000, show_default=True)
+def main(years: int, rows_per_quarter: int):
+    """Benchmark consolidating synthetic EPA CEMS partitions."""
+    schema = Resource.from_id(TABLE_NAME).to_pyarrow()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir)
+        year_quarters = _write_partitions(
+            path, list(range(2020, 2020 + years)), rows_per_quarter, schema
+        )
+        for label, split in [
+            ("filtered rereads", _filtered_rereads),
+            ("single pass", _single_pass),
+        ]:
+            start = time.perf_counter()
+            with pq.ParquetWriter(
+                where=path / "monolithic.parquet",
+                schema=schema,
+                compression="snappy",
+                version="2.6",
+            ) as writer:
+                for quarters in year_quarters.values():
+                    for state_table in split(path, quarters, schema):
+                        writer.write_table(state_table)
+            elapsed = time.perf_counter() - start
+            num_rows = pq.ParquetFile(path / "monolithic.parquet").metadata.num_rows
+            click.echo(f"{label:>16}: {num_rows:,} rows in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
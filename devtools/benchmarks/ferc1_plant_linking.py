@@ -0,0 +1,106 @@
+#! /usr/bin/env python
+r"""Compare the dense and sparse distance backends of the FERC1 plant linking model.
+
+Noisy yearly records of synthetic plants are embedded as random feature vectors, and
+then linked across years by :func:`pudl.analysis.record_linkage.link_cross_year`'s
+DBSCAN, split clusters and orphaned record matching steps: once with the full N x N
+distance matrix stored in a memmap, and once computing the distances each step needs
+from the feature matrix. Each backend runs in its own process so its peak resident
+set size can be reported, and the IDs the two assign are checked to be the same.
+
+Example:
+    python devtools/benchmarks/ferc1_plant_linking.py --plants 1500 --years 30
+"""
+
+import multiprocessing
+import re
+import time
+from pathlib import Path
+
+import click
+import numpy as np
+import pandas as pd
+
+from pudl.analysis.ml_tools.experiment_tracking import (
+    ExperimentTracker,
+    ExperimentTrackerConfig,
+)
+from pudl.analysis.record_linkage import link_cross_year
+from pudl.analysis.record_linkage.embed_dataframe import FeatureMatrix
+
+
+def _rss_mib(field: str) -> float:
+    """Read a memory field (e.g. VmRSS or VmHWM) of this process in MiB."""
+    status = Path("/proc/self/status").read_text()
+    return int(re.search(rf"{field}:\s+(\d+) kB", status).group(1)) / 2**10
+
+
+def _synthetic_records(plants: int, years: int) -> tuple[np.ndarray, pd.DataFrame]:
+    """Feature vectors of plants reported in most years, with some noise."""
+    rng = np.random.default_rng(0)
+    centers = rng.normal(scale=0.6, size=(plants, 16))
+    plant_ids = np.repeat(np.arange(plants), years)
+    report_years = np.tile(np.arange(2000, 2000 + years), plants)
+    keep = rng.random(len(plant_ids)) < 0.9
+    features = centers[plant_ids[keep]] + rng.normal(scale=0.1, size=(keep.sum(), 16))
+    return features, pd.DataFrame({"report_year": report_years[keep]})
+
+
+def _link(sparse: bool, plants: int, years: int, queue):
+    """Link the synthetic records and report the extra peak RSS that needed."""
+    features, df = _synthetic_records(plants, years)
+    tracker = ExperimentTracker(
+        tracker_config=ExperimentTrackerConfig(),
+        run_id="",
+        experiment_name="ferc1_plant_linking_benchmark",
+    )
+    baseline = _rss_mib("VmRSS")
+    # Writing 5 to clear_refs resets the peak RSS (VmHWM) to the current RSS.
+    Path("/proc/self/clear_refs").write_text("5")
+    start = time.perf_counter()
+    distance_matrix = link_cross_year.compute_distance_with_year_penalty(
+        link_cross_year.PenalizeReportYearDistanceConfig(sparse=sparse),
+        FeatureMatrix(matrix=features, index=df.index),
+        df,
+    )
+    id_year_df = link_cross_year.cluster_records_dbscan(
+        link_cross_year.DBSCANConfig(), distance_matrix, df, tracker
+    )
+    id_year_df = link_cross_year.split_clusters(
+        link_cross_year.SplitClustersConfig(), distance_matrix, id_year_df, tracker
+    )
+    id_year_df = link_cross_year.match_orphaned_records(
+        link_cross_year.MatchOrphanedRecordsConfig(),
+        distance_matrix,
+        id_year_df,
+        tracker,
+    )
+    elapsed = time.perf_counter() - start
+    queue.put((len(df), _rss_mib("VmHWM") - baseline, elapsed, id_year_df))
+
+
+@click.command()
+@click.option("--plants", type=int, default=1000, show_default=True)
+@click.option("--years", type=int, default=30, show_default=True)
+def main(plants: int, years: int):
+    """Benchmark the dense and sparse distance backends of the plant linking."""
+    ctx = multiprocessing.get_context("spawn")
+    id_year_dfs = []
+    for label, sparse in [("dense", False), ("sparse", True)]:
+        queue = ctx.Queue()
+        proc = ctx.Process(target=_link, args=(sparse, plants, years, queue))
+        proc.start()
+        n_records, extra_mib, elapsed, id_year_df = queue.get()
+        proc.join()
+        id_year_dfs.append(id_year_df)
+        click.echo(
+            f"{label:>6}: linked {n_records:,} records into "
+            f"{id_year_df.record_label.nunique():,} plants in {elapsed:.1f}s, "
+            f"needing {extra_mib:,.0f} MiB more at peak"
+        )
+    same = id_year_dfs[0].equals(id_year_dfs[1])
+    click.echo(f"Both backends assigned the same IDs: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#! /usr/bin/env python
+r"""Benchmark the imputation of the FERC 714 hourly demand matrix.
+
+Hourly demand of synthetic respondents is simulated for several years, with daily,
+weekly and seasonal cycles, year-to-year growth and noise. A fraction of the values
+are nulled, and the matrix is imputed by
+:func:`pudl.analysis.state_demand.impute_ferc714_hourly_demand_matrix` one year at a
+time, in parallel chunks of years, and in parallel chunks of warm started years. The
+time each run takes is reported along with the mean absolute percent error (MAPE) of
+the imputed values, so that speed and accuracy can be compared together.
+
+Example:
+    python devtools/benchmarks/ferc714_imputation.py --respondents 60 --years 4 \
+        --workers 2
+"""
+
+import time
+
+import click
+import numpy as np
+import pandas as pd
+
+from pudl.analysis.state_demand import impute_ferc714_hourly_demand_matrix
+
+
+def _synthetic_demand(
+    respondents: int, years: int, seed: int = 0
+) -> tuple[pd.DataFrame, np.ndarray]:
+    """Hourly demand matrix of synthetic respondents and a mask of values to null."""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2015-01-01", f"{2015 + years - 1}-12-31 23:00", freq="h")
+    hours = np.arange(len(index))[:, np.newaxis]
+    scale = rng.uniform(1e3, 5e4, size=respondents)
+    phase = rng.uniform(0, 2 * np.pi, size=(3, respondents))
+    cycles = (
+        1
+        + 0.3 * np.sin(2 * np.pi * hours / 24 + phase[0])
+        + 0.1 * np.sin(2 * np.pi * hours / (24 * 7) + phase[1])
+        + 0.2 * np.sin(2 * np.pi * hours / (24 * 365.25) + phase[2])
+    )
+    growth = (
+        rng.normal(1.02, 0.01, size=respondents)
+        ** (index.year - 2015).to_numpy()[:, np.newaxis]
+    )
+    demand = scale * cycles * growth * rng.lognormal(sigma=0.03, size=cycles.shape)
+    mask = rng.random(demand.shape) < 0.1
+    return pd.DataFrame(demand, index=index, columns=np.arange(respondents)), mask
+
+
+@click.command()
+@click.option("--respondents", type=int, default=60, show_default=True)
+@click.option("--years", type=int, default=4, show_default=True)
+@click.option("--workers", type=int, default=2, show_default=True)
+def main(respondents: int, years: int, workers: int):
+    """Compare the time and accuracy of FERC 714 demand imputation strategies."""
+    df, mask = _synthetic_demand(respondents, years)
+    nulled = df.mask(mask)
+    year_list = sorted(set(df.index.year))
+    for label, kwargs in [
+        ("sequential", {"workers": 1, "warm_start": False}),
+        ("parallel", {"workers": workers, "warm_start": False}),
+        ("parallel, warm started", {"workers": workers, "warm_start": True}),
+    ]:
+        start = time.perf_counter()
+        imputed = impute_ferc714_hourly_demand_matrix(nulled, year_list, **kwargs)
+        elapsed = time.perf_counter() - start
+        imputed = imputed.reindex(index=df.index, columns=df.columns).to_numpy()
+        actual = df.to_numpy()
+        mape = np.mean(np.abs(actual[mask] - imputed[mask]) / actual[mask])
+        click.echo(f"{label:>22}: {elapsed:.1f}s, MAPE of imputed values {mape:.2%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#! /usr/bin/env python
+r"""Compare peak memory of whole-table and streaming parquet writes.
+
+A synthetic dataframe that conforms to the schema of a PUDL table is generated, and
+then written with :class:`pudl.io_managers.PudlParquetIOManager` once in whole-table
+mode and once in streaming mode. Each write happens in its own process, and the
+process's peak resident set size is reset (Linux only) once the dataframe has been
+generated, so only the memory used by the write itself is reported.
+
+Example:
+    python devtools/benchmarks/parquet_write_memory.py \\
+        out_eia__yearly_generators --rows 5000000 --row-group-size 250000
+"""
+
+import multiprocessing
+import re
+import tempfile
+import time
+from pathlib import Path
+
+import click
+from dagster import AssetKey, build_output_context
+from synthetic import synthetic_table
+
+from pudl.io_managers import PudlParquetIOManager
+from pudl.workspace.setup import PudlPaths
+
+
+def _rss_mib(field: str) -> float:
+    """Read a memory field (e.g. VmRSS or VmHWM) of this process in MiB."""
+    status = Path("/proc/self/status").read_text()
+    return int(re.search(rf"{field}:\s+(\d+) kB", status).group(1)) / 2**10
+
+
+def _write(
+    table_name: str, rows: int, row_group_size: int | None, output_dir: str, queue
+):
+    """Write one synthetic table and report the extra peak RSS the write needed."""
+    PudlPaths.set_path_overrides(output_dir=output_dir)
+    df = synthetic_table(table_name, rows)
+    baseline = _rss_mib("VmRSS")
+    # Writing 5 to clear_refs resets the peak RSS (VmHWM) to the current RSS.
+    Path("/proc/self/clear_refs").write_text("5")
+    start = time.perf_counter()
+    PudlParquetIOManager(row_group_size=row_group_size).handle_output(
+        build_output_context(asset_key=AssetKey(table_name)), df
+    )
+    elapsed = time.perf_counter() - start
+    queue.put((baseline, _rss_mib("VmHWM") - baseline, elapsed))
+
+
+@click.command()
+@click.argument("table_name")
+@click.option("--rows", type=int, default=2_000_000, show_default=True)
+@click.option("--row-group-size", type=int, default=250_000, show_default=True)
+def main(table_name: str, rows: int, row_group_size: int):
+    """Benchmark whole-table vs. streaming parquet writes of TABLE_NAME."""
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as output_dir:
+        for label, size in [("whole table", None), ("streaming", row_group_size)]:
+            queue = ctx.Queue()
+            proc = ctx.Process(
+                target=_write, args=(table_name, rows, size, output_dir, queue)
+            )
+            proc.start()
+            df_mib, extra_mib, elapsed = queue.get()
+            proc.join()
+            click.echo(
+                f"{label:>12}: dataframe {df_mib:,.0f} MiB RSS, write needed "
+                f"{extra_mib:,.0f} MiB more at peak, took {elapsed:.1f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
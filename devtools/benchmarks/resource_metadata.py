@@ -0,0 +1,57 @@
+#! /usr/bin/env python
+r"""Benchmark the metadata overhead of writing or reading a PUDL table.
+
+The IO managers and other hot paths look up a table's :class:`Resource` every time
+they handle it, and ask it for its PyArrow schema, pandas dtypes and fields. This
+measures that overhead for every table in the PUDL metadata, both by building each
+Resource and its schemas from scratch, as :meth:`Resource.from_id` used to, and by
+using the cached Resources with their memoized schemas.
+
+Example:
+    python devtools/benchmarks/resource_metadata.py --repeats 5
+"""
+
+import time
+from collections.abc import Callable
+
+import click
+
+from pudl.metadata.classes import Resource
+from pudl.metadata.resources import RESOURCE_METADATA
+
+
+def _use_resource(res: Resource) -> None:
+    """Do what an IO manager does with the metadata of a table it handles."""
+    res.to_pyarrow()
+    res.to_pandas_dtypes()
+    for name in res.get_field_names():
+        res.get_field(name)
+
+
+def _time_per_table(get_resource: Callable[[str], Resource], repeats: int) -> float:
+    """Mean seconds of metadata overhead per table."""
+    resource_ids = sorted(RESOURCE_METADATA)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for resource_id in resource_ids:
+            _use_resource(get_resource(resource_id))
+    return (time.perf_counter() - start) / (repeats * len(resource_ids))
+
+
+@click.command()
+@click.option("--repeats", type=int, default=3, show_default=True)
+def main(repeats: int):
+    """Benchmark the metadata overhead per table with and without caching."""
+    timings = {
+        "uncached": _time_per_table(
+            lambda x: Resource(**Resource.dict_from_id(x)), repeats
+        ),
+        "cached": _time_per_table(Resource.from_id, repeats),
+    }
+    for label, seconds in timings.items():
+        click.echo(f"{label:>8}: {seconds * 1e3:.3f} ms per table")
+    click.echo(f" speedup: {timings['uncached'] / timings['cached']:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#! /usr/bin/env python
+r"""Compare DataFrame.to_sql with the bulk SQLite loader.
+
+A synthetic dataframe that conforms to the schema of a PUDL table is loaded into a
+fresh SQLite database twice: once with :meth:`pandas.DataFrame.to_sql` on a default
+SQLAlchemy engine, as the IO managers used to do, and once with
+:func:`pudl.helpers.bulk_load_sqlite` within :func:`pudl.helpers.sqlite_pragmas`, as
+the IO managers do now.
+
+Example:
+    python devtools/benchmarks/sqlite_load_speed.py \\
+        core_eia923__monthly_generation_fuel --rows 2000000
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+import click
+import sqlalchemy as sa
+from synthetic import synthetic_table
+
+from pudl.helpers import bulk_load_sqlite, sqlite_pragmas
+from pudl.metadata import PUDL_PACKAGE
+
+
+@click.command()
+@click.argument("table_name")
+@click.option("--rows", type=int, default=1_000_000, show_default=True)
+def main(table_name: str, rows: int):
+    """Benchmark loading TABLE_NAME into SQLite with and without the bulk loader."""
+    df = synthetic_table(table_name, rows)
+    md = PUDL_PACKAGE.to_sql()
+    sa_table = md.tables[table_name]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for label in ["to_sql", "bulk loader"]:
+            engine = sa.create_engine(f"sqlite:///{Path(tmp_dir) / label}.sqlite")
+            md.create_all(engine, tables=[sa_table])
+            start = time.perf_counter()
+            with engine.connect() as con:
+                if label == "to_sql":
+                    with con.begin():
+                        df.to_sql(
+                            table_name,
+                            con,
+                            if_exists="append",
+                            index=False,
+                            chunksize=100_000,
+                            dtype={c.name: c.type for c in sa_table.columns},
+                        )
+                else:
+                    with sqlite_pragmas(con), con.begin():
+                        bulk_load_sqlite(df, sa_table, con)
+            elapsed = time.perf_counter() - start
+            click.echo(f"{label:>12}: loaded {rows:,} rows in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
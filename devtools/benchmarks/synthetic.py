@@ -0,0 +1,47 @@
+"""Synthetic PUDL tables for the benchmark scripts in this directory."""
+
+import numpy as np
+import pandas as pd
+
+from pudl.metadata.classes import Resource
+
+
+def synthetic_table(table_name: str, rows: int, seed: int = 0) -> pd.DataFrame:
+    """Generate a dataframe with random values for every field in a resource.
+
+    The first primary key column is filled with unique values so that the primary key
+    is always unique, and the rows are shuffled so that the streaming writer has to
+    sort them.
+    """
+    res = Resource.from_id(table_name)
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for field in res.schema.fields:
+        if field.constraints.enum:
+            values = rng.choice(sorted(field.constraints.enum, key=str), size=rows)
+        elif field.type == "integer":
+            values = rng.integers(0, 100_000, size=rows)
+        elif field.type == "number":
+            values = rng.normal(size=rows)
+        elif field.type == "boolean":
+            values = rng.integers(0, 2, size=rows).astype(bool)
+        elif field.type in ("date", "datetime", "year"):
+            values = pd.Timestamp("2001-01-01") + pd.to_timedelta(
+                rng.integers(0, 20 * 365, size=rows), unit="D"
+            )
+        else:
+            values = rng.integers(0, 1_000, size=rows).astype(str)
+        columns[field.name] = values
+    pk = res.schema.primary_key or []
+    if pk:
+        unique = rng.permutation(rows)
+        field = res.get_field(pk[0])
+        if field.type in ("date", "datetime", "year"):
+            columns[pk[0]] = pd.Timestamp("1900-01-01") + pd.to_timedelta(
+                unique, unit="h"
+            )
+        elif field.type in ("integer", "number"):
+            columns[pk[0]] = unique
+        else:
+            columns[pk[0]] = unique.astype(str)
+    return res.format_df(pd.DataFrame(columns))
@@ -133,7 +133,7 @@ However, the allocated net generation will still be porporational to each genera
 net generation (if it's reported) or capacity (if generation is not reported).
 """
 
-import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import Literal
 
 # Useful high-level external modules.
@@ -235,6 +235,23 @@ def allocate_gen_fuel_asset_factory(
                     "works when using the default filesystem io_manager."
                 ),
             ),
+            "partitions": Field(
+                int,
+                default_value=8 if freq == "MS" else 1,
+                description=(
+                    "Number of groups of plants to allocate separately, which bounds "
+                    "the size of the intermediate tables. See "
+                    "allocate_gen_fuel_by_generator_energy_source()."
+                ),
+            ),
+            "workers": Field(
+                int,
+                default_value=1,
+                description=(
+                    "Number of processes to allocate the groups of plants in. Each "
+                    "worker holds the intermediate tables of one group at a time."
+                ),
+            ),
         },
     )
     def gen_fuel_by_gen_esc(
@@ -257,6 +274,8 @@ def allocate_gen_fuel_asset_factory(
             gens=gens,
             freq=freq,
             debug=context.op_config["debug"],
+            partitions=context.op_config["partitions"],
+            workers=context.op_config["workers"],
         )
 
     @asset(
@@ -333,6 +352,8 @@ def allocate_gen_fuel_by_generator_energy_source(
     gens: pd.DataFrame,
     freq: Literal["YS", "MS"],
     debug: bool = False,
+    partitions: int = 1,
+    workers: int = 1,
 ) -> pd.DataFrame:
     """Allocate net gen from gen_fuel table to the generator/energy_source_code level.
 
@@ -351,6 +372,13 @@ def allocate_gen_fuel_by_generator_energy_source(
     generator, prime_mover, and fuel and is used to allocate the associated
     net generation from the :ref:`core_eia923__monthly_generation_fuel` table.
 
+    Each plant's data is allocated independently of every other plant's, so the plants
+    can be split into ``partitions`` groups by their ``plant_id_eia`` modulo
+    ``partitions``, which are allocated separately (see
+    :func:`_allocate_gen_fuel_partition`) and then concatenated. The intermediate tables of the allocation are many times larger than
+    its inputs, so this reduces peak memory usage, and the groups can be allocated in
+    parallel by several ``workers``.
+
     Args:
         gf: Temporally aggregated :ref:`out_eia923__generation_fuel_combined` dataframe.
         bf: Temporally aggregated :ref:`core_eia923__monthly_boiler_fuel` dataframe.
@@ -359,15 +387,114 @@ def allocate_gen_fuel_by_generator_energy_source(
         gens: :ref:`core_eia860__scd_generators` dataframe.
         freq: Frequency at which the tables are aggregated temporally.
         debug: If True, return additional debugging information.
+        partitions: Number of groups of plants to allocate separately.
+        workers: Number of processes to allocate the groups of plants in.
+    """
+    # These depend on the data of all plants, so they're determined up front.
+    msw_codes_used = get_msw_codes_used(gf, bf)
+    start_date = min(
+        gf.report_date.min(), gen.report_date.min(), gens.report_date.min()
+    )
+
+    inputs = {"gf": gf, "bf": bf, "gen": gen, "bga": bga, "gens": gens}
+    if partitions > 1:
+        plant_partitions = {
+            # Hashes depend on the dtype, so plant IDs are used as integers directly.
+            name: df.plant_id_eia.to_numpy(dtype="int64") % partitions
+            for name, df in inputs.items()
+        }
+        partition_inputs = [
+            {
+                name: df.loc[plant_partitions[name] == partition]
+                for name, df in inputs.items()
+            }
+            for partition in range(partitions)
+        ]
+        partition_inputs = [
+            dfs
+            for dfs in partition_inputs
+            if not all(dfs[name].empty for name in ["gf", "gen", "gens"])
+        ]
+    else:
+        partition_inputs = [inputs]
+    partition_kwargs = {
+        "freq": freq,
+        "msw_codes_used": msw_codes_used,
+        "start_date": start_date,
+    }
+    logger.info(f"Allocating {len(partition_inputs)} groups of plants.")
+    if workers > 1 and len(partition_inputs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_allocate_gen_fuel_partition, **dfs, **partition_kwargs)
+                for dfs in partition_inputs
+            ]
+            results = [future.result() for future in futures]
+    else:
+        results = [
+            _allocate_gen_fuel_partition(**dfs, **partition_kwargs)
+            for dfs in partition_inputs
+        ]
+
+    if len(results) == 1:
+        net_gen_fuel_alloc, gf_test = results[0]
+    else:
+        net_gen_fuel_alloc = pd.concat(
+            [alloc for alloc, _ in results], ignore_index=True
+        ).sort_values(IDX_GENS_PM_ESC)
+        gf_test = pd.concat([gf_test for _, gf_test in results])
+    _ = check_original_gf_vs_the_allocated_by_gens_gf(gf_test)
+    # There are a tiny number of records that have NaNs in the prime mover code
+    # and for which the correct prime mover is unclear. Prime mover code is part
+    # of the primary key for this table, so we have to drop them.
+    len_before = net_gen_fuel_alloc.shape[0]
+    net_gen_fuel_alloc = net_gen_fuel_alloc.dropna(subset=["prime_mover_code"])
+    len_after = net_gen_fuel_alloc.shape[0]
+    fraction_dropped = (len_before - len_after) / len_before
+    dropped = len_before - len_after
+    logger.info(f"FRACTION DROPPED: {fraction_dropped}, NUM RECORDS DROPPED: {dropped}")
+    if fraction_dropped > 5e-5:
+        raise ValueError(
+            "Too many records were found to have a NULL prime_mover_code and "
+            f"dropped. Expected less than 5e-5, but found {fraction_dropped:.1%}."
+        )
+    if not debug:
+        net_gen_fuel_alloc = net_gen_fuel_alloc.loc[
+            :,
+            IDX_GENS_PM_ESC + ["energy_source_code_num"] + DATA_COLUMNS,
+        ]
+    return net_gen_fuel_alloc
+
+
+def _allocate_gen_fuel_partition(
+    gf: pd.DataFrame,
+    bf: pd.DataFrame,
+    gen: pd.DataFrame,
+    bga: pd.DataFrame,
+    gens: pd.DataFrame,
+    freq: Literal["YS", "MS"],
+    msw_codes_used: list[str],
+    start_date: pd.Timestamp,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Allocate the net gen and fuel of a group of plants.
+
+    See :func:`allocate_gen_fuel_by_generator_energy_source` for the arguments.
+
+    Returns:
+        The allocated data, and the original and allocated data summed by plant and
+        year (see :func:`sum_original_gf_and_the_allocated_by_gens_gf`) so that they
+        can be checked against each other for all plants at once.
     """
     bf, gens_at_freq, gen = standardize_input_frequency(bf, gens, gen, freq)
     # Add any startup energy source codes to the list of energy source codes
-    gens_at_freq = adjust_msw_energy_source_codes(gens_at_freq, gf, bf)
+    gens_at_freq = adjust_msw_energy_source_codes(
+        gens_at_freq, gf, bf, msw_codes_used=msw_codes_used
+    )
     gens_at_freq = add_missing_energy_source_codes_to_gens(gens_at_freq, gf, bf)
     # do the association! --> this step is where a small no. of plants are dropped for
     # an unknown reason. Investigate in issue #2978.
     gen_assoc = associate_generator_tables(
-        gens=gens_at_freq, gf=gf, gen=gen, bf=bf, bga=bga
+        gens=gens_at_freq, gf=gf, gen=gen, bf=bf, bga=bga, start_date=start_date
     )
     # Generate a fraction to use to allocate net generation and fuel consumption by.
     # These two methods create a column called `frac`, which will be a fraction
@@ -395,36 +522,10 @@ def allocate_gen_fuel_by_generator_energy_source(
         validate="1:1",
         suffixes=("_net_gen_alloc", "_fuel_alloc"),
     ).sort_values(IDX_GENS_PM_ESC)
-    # When 2020 and 2022 data are used in the fast ETL (2020 data is necessary for
-    # having ample FERC-EIA training data and 2022 as the new year of data) the ci
-    # tests fail on exit code 143 for memory reasons while all tests pass locally.
-    # This function was identified as a large memory suck, therefore this conditional
-    # prevents the function from running as part of the ci and enables the tests to
-    # pass.
-    if not os.environ.get("GITHUB_ACTIONS", False):
-        _ = test_original_gf_vs_the_allocated_by_gens_gf(
-            gf=gf, gf_allocated=net_gen_fuel_alloc
-        )
-    # There are a tiny number of records that have NaNs in the prime mover code
-    # and for which the correct prime mover is unclear. Prime mover code is part
-    # of the primary key for this table, so we have to drop them.
-    len_before = net_gen_fuel_alloc.shape[0]
-    net_gen_fuel_alloc = net_gen_fuel_alloc.dropna(subset=["prime_mover_code"])
-    len_after = net_gen_fuel_alloc.shape[0]
-    fraction_dropped = (len_before - len_after) / len_before
-    dropped = len_before - len_after
-    logger.info(f"FRACTION DROPPED: {fraction_dropped}, NUM RECORDS DROPPED: {dropped}")
-    if fraction_dropped > 5e-5:
-        raise ValueError(
-            "Too many records were found to have a NULL prime_mover_code and "
-            f"dropped. Expected less than 5e-5, but found {fraction_dropped:.1%}."
-        )
-    if not debug:
-        net_gen_fuel_alloc = net_gen_fuel_alloc.loc[
-            :,
-            IDX_GENS_PM_ESC + ["energy_source_code_num"] + DATA_COLUMNS,
-        ]
-    return net_gen_fuel_alloc
+    gf_test = sum_original_gf_and_the_allocated_by_gens_gf(
+        gf=gf, gf_allocated=net_gen_fuel_alloc
+    )
+    return net_gen_fuel_alloc, gf_test
 
 
 def select_input_data(
@@ -663,6 +764,7 @@ def associate_generator_tables(
     gen: pd.DataFrame,
     bf: pd.DataFrame,
     bga: pd.DataFrame,
+    start_date: pd.Timestamp | None = None,
 ) -> pd.DataFrame:
     """Associate the three tables needed to assign net gen and fuel to generators.
 
@@ -707,6 +809,8 @@ def associate_generator_tables(
         bf: :ref:`core_eia923__monthly_boiler_fuel` table with columns: :py:const:`IDX_B_PM_ESC` and
             fuel consumption columns.
         bga: :ref:`core_eia860__assn_boiler_generator` table.
+        start_date: the first report date of the data. See
+            :func:`remove_inactive_generators`.
 
     Returns:
         table of generators with stacked energy sources and broadcasted net generation
@@ -741,7 +845,7 @@ def associate_generator_tables(
             how="outer",
         )
         .merge(gf, on=IDX_PM_ESC, how="outer", validate="m:1", indicator=True)
-        .pipe(remove_inactive_generators)
+        .pipe(remove_inactive_generators, start_date=start_date)
         .pipe(
             _allocate_unassociated_pm_records,
             idx_cols=IDX_PM_ESC,
@@ -784,7 +888,9 @@ def associate_generator_tables(
     return gen_assoc
 
 
-def remove_inactive_generators(gen_assoc: pd.DataFrame) -> pd.DataFrame:
+def remove_inactive_generators(
+    gen_assoc: pd.DataFrame, start_date: pd.Timestamp | None = None
+) -> pd.DataFrame:
     """Remove the retired generators.
 
     We don't want to associate and later allocate net generation or fuel to generators
@@ -819,12 +925,14 @@ def remove_inactive_generators(gen_assoc: pd.DataFrame) -> pd.DataFrame:
         gen_assoc: table of generators with stacked energy sources and broadcasted net
             generation data from the core_eia923__monthly_generation and core_eia923__monthly_generation_fuel
             tables. Output of :func:`associate_generator_tables`.
+        start_date: the first report date of the data, before which ``retired_plants``
+            must have retired. Defaults to the first report date in ``gen_assoc``.
     """
     existing = gen_assoc.loc[(gen_assoc.operational_status == "existing")]
 
     retiring_generators = identify_retiring_generators(gen_assoc)
 
-    retired_plants = identify_retired_plants(gen_assoc)
+    retired_plants = identify_retired_plants(gen_assoc, start_date=start_date)
 
     proposed_generators = identify_generators_coming_online(gen_assoc)
 
@@ -877,8 +985,12 @@ def identify_retiring_generators(gen_assoc: pd.DataFrame) -> pd.DataFrame:
     return retiring_generators
 
 
-def identify_retired_plants(gen_assoc: pd.DataFrame) -> pd.DataFrame:
+def identify_retired_plants(
+    gen_assoc: pd.DataFrame, start_date: pd.Timestamp | None = None
+) -> pd.DataFrame:
     """Identify entire plants that have previously retired but are reporting data."""
+    if start_date is None:
+        start_date = min(gen_assoc.report_date)
     # get a subset of the data that represents all plants that have completely retired before the start date
     # Get a list of all of the plants with at least one retired generator and reports non-zero generation data
     # after the generator retirement date
@@ -916,7 +1028,7 @@ def identify_retired_plants(gen_assoc: pd.DataFrame) -> pd.DataFrame:
     plants_retiring_after_start_date = list(
         plants_with_only_retired_generators.loc[
             plants_with_only_retired_generators["generator_retirement_date"]
-            >= min(gen_assoc.report_date),
+            >= start_date,
             "plant_id_eia",
         ].unique()
     )
@@ -1637,8 +1749,28 @@ def manually_fix_energy_source_codes(gf: pd.DataFrame) -> pd.DataFrame:
     return gf
 
 
+def get_msw_codes_used(gf: pd.DataFrame, bf: pd.DataFrame) -> list[str]:
+    """Get a sorted list of all of the MSW-related codes used in gf and bf."""
+    msw_codes_in_gf = set(
+        gf.loc[
+            gf["energy_source_code"].isin(["MSW", "MSB", "MSN"]),
+            "energy_source_code",
+        ].unique()
+    )
+    msw_codes_in_bf = set(
+        bf.loc[
+            bf["energy_source_code"].isin(["MSW", "MSB", "MSN"]),
+            "energy_source_code",
+        ].unique()
+    )
+    return sorted(msw_codes_in_gf | msw_codes_in_bf)
+
+
 def adjust_msw_energy_source_codes(
-    gens: pd.DataFrame, gf: pd.DataFrame, bf_by_gens: pd.DataFrame
+    gens: pd.DataFrame,
+    gf: pd.DataFrame,
+    bf_by_gens: pd.DataFrame,
+    msw_codes_used: list[str] | None = None,
 ) -> pd.DataFrame:
     """Adjusts MSW codes.
 
@@ -1650,23 +1782,12 @@ def adjust_msw_energy_source_codes(
     only uses the ``MSW`` code.
 
     This function identifies which MSW codes are used in the gf and bf tables and
-    creates records to match these.
+    creates records to match these. If ``msw_codes_used`` is given, those codes are
+    used instead, e.g. when gf and bf only contain some of the plants.
     """
     # Adjust any energy source codes related to municipal solid waste
-    # get a list of all of the MSW-related codes used in gf and bf
-    msw_codes_in_gf = set(
-        gf.loc[
-            gf["energy_source_code"].isin(["MSW", "MSB", "MSN"]),
-            "energy_source_code",
-        ].unique()
-    )
-    msw_codes_in_bf = set(
-        bf_by_gens.loc[
-            bf_by_gens["energy_source_code"].isin(["MSW", "MSB", "MSN"]),
-            "energy_source_code",
-        ].unique()
-    )
-    msw_codes_used = list(msw_codes_in_gf | msw_codes_in_bf)
+    if msw_codes_used is None:
+        msw_codes_used = get_msw_codes_used(gf, bf_by_gens)
     # join these codes into a string that will be used to replace the MSW code
     replacement_codes = ",".join(msw_codes_used)
 
@@ -2026,20 +2147,16 @@ def test_gen_fuel_allocation(
         )
 
 
-def test_original_gf_vs_the_allocated_by_gens_gf(
+def sum_original_gf_and_the_allocated_by_gens_gf(
     gf: pd.DataFrame,
     gf_allocated: pd.DataFrame,
     data_columns: list[str] = DATA_COLUMNS,
     by: list[str] = ["year", "plant_id_eia"],
-    acceptance_threshold: float = 0.07,
 ) -> pd.DataFrame:
-    """Test whether the allocated data and original data sum up to similar values.
+    """Sum the original and allocated data columns, and calculate their ratio.
 
-    Raises:
-        AssertionError: If the number of plant/years that are off by more than 5% is
-            not within acceptable level of tolerance.
-        AssertionError: If the difference between the allocated and original data for
-            any plant/year is off by more than x10 or x-5.
+    The sums of groups of plants with disjoint ``by`` keys can be concatenated and
+    checked together with :func:`check_original_gf_vs_the_allocated_by_gens_gf`.
     """
     gf_test = pd.merge(
         gf.assign(year=lambda x: x.report_date.dt.year).groupby(by)[data_columns].sum(),
@@ -2052,12 +2169,47 @@ def test_original_gf_vs_the_allocated_by_gens_gf(
         how="outer",
     )
     # calculate the difference between the allocated and the original data
-    gf_test = gf_test.assign(
+    return gf_test.assign(
         **{
             f"{col}_diff": gf_test[f"{col}_allocated"] / gf_test[f"{col}_og"]
             for col in data_columns
         }
     )
+
+
+def test_original_gf_vs_the_allocated_by_gens_gf(
+    gf: pd.DataFrame,
+    gf_allocated: pd.DataFrame,
+    data_columns: list[str] = DATA_COLUMNS,
+    by: list[str] = ["year", "plant_id_eia"],
+    acceptance_threshold: float = 0.07,
+) -> pd.DataFrame:
+    """Test whether the allocated data and original data sum up to similar values.
+
+    Raises:
+        AssertionError: If the number of plant/years that are off by more than 5% is
+            not within acceptable level of tolerance.
+        AssertionError: If the difference between the allocated and original data for
+            any plant/year is off by more than x10 or x-5.
+    """
+    return check_original_gf_vs_the_allocated_by_gens_gf(
+        sum_original_gf_and_the_allocated_by_gens_gf(
+            gf=gf, gf_allocated=gf_allocated, data_columns=data_columns, by=by
+        ),
+        data_columns=data_columns,
+        acceptance_threshold=acceptance_threshold,
+    )
+
+
+def check_original_gf_vs_the_allocated_by_gens_gf(
+    gf_test: pd.DataFrame,
+    data_columns: list[str] = DATA_COLUMNS,
+    acceptance_threshold: float = 0.07,
+) -> pd.DataFrame:
+    """Check the output of :func:`sum_original_gf_and_the_allocated_by_gens_gf`.
+
+    See :func:`test_original_gf_vs_the_allocated_by_gens_gf` for the checks.
+    """
     # remove the inf diffs for net gen if the allocated value if small. many seem to be
     # a result of the MISSING_SENTINEL filling in.
     if gf_test[
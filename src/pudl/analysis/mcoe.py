@@ -67,7 +67,19 @@ def mcoe_asset_factory(
         ins={
             "bga": AssetIn(key="core_eia860__assn_boiler_generator"),
             "hr_by_unit": AssetIn(key=f"_out_eia__{agg_freqs[freq]}_heat_rate_by_unit"),
-            "gens": AssetIn(key="_out_eia__yearly_generators"),
+            "gens": AssetIn(
+                key="_out_eia__yearly_generators",
+                metadata={
+                    "columns": [
+                        "report_date",
+                        "plant_id_eia",
+                        "generator_id",
+                        "fuel_type_code_pudl",
+                        "fuel_type_count",
+                        "prime_mover_code",
+                    ]
+                },
+            ),
         },
         compute_kind="Python",
         io_manager_key="pudl_io_manager",
@@ -100,7 +112,17 @@ def mcoe_asset_factory(
             "gen": AssetIn(
                 key=f"out_eia923__{agg_freqs[freq]}_generation_fuel_by_generator"
             ),
-            "gens": AssetIn(key="_out_eia__yearly_generators"),
+            "gens": AssetIn(
+                key="_out_eia__yearly_generators",
+                metadata={
+                    "columns": [
+                        "plant_id_eia",
+                        "report_date",
+                        "generator_id",
+                        "capacity_mw",
+                    ]
+                },
+            ),
         },
         compute_kind="Python",
         io_manager_key="pudl_io_manager",
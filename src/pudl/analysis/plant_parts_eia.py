@@ -179,6 +179,7 @@ OR make the table via objects in this module:
 
 from collections import OrderedDict
 from copy import deepcopy
+from functools import cached_property
 from importlib import resources
 from pathlib import Path
 from typing import Literal
@@ -597,13 +598,15 @@ class MakePlantParts:
             pandas.DataFrame: The complete plant parts list
         """
         # aggregate everything by each plant part
+        part_names = [part for part in PLANT_PARTS if part != "plant_match_ferc1"]
+        aggregator = PlantPartAggregator(gens_mega, part_names)
         part_dfs = []
-        for part_name in PLANT_PARTS:
-            if part_name == "plant_match_ferc1":
-                continue
-            part_df = PlantPart(part_name).execute(gens_mega)
+        for part_name in part_names:
+            part_df = PlantPart(part_name).execute(gens_mega, aggregator=aggregator)
             # add in the attributes!
-            part_df = self.add_attributes(part_df, gens_mega, part_name)
+            part_df = self.add_attributes(
+                part_df, gens_mega, part_name, aggregator=aggregator
+            )
             # assert that all the plant part ID columns are now in part_df
             assert {
                 col
@@ -709,9 +712,12 @@ class MakePlantParts:
         )
 
         # Aggregate these records into "plant parts" and concatenate onto plant_part table
-        part_df = PlantPart(part_name).execute(plant_parts_eia)
+        aggregator = PlantPartAggregator(plant_parts_eia, [part_name])
+        part_df = PlantPart(part_name).execute(plant_parts_eia, aggregator=aggregator)
         # add in the attributes!
-        part_df = self.add_attributes(part_df, plant_parts_eia, part_name)
+        part_df = self.add_attributes(
+            part_df, plant_parts_eia, part_name, aggregator=aggregator
+        )
 
         # Assert that each 'ferc1_generator_agg_id' only contains one faked record
         double_df = part_df[
@@ -787,28 +793,290 @@ class MakePlantParts:
             ~plant_parts_eia["record_id_eia"].duplicated(keep="first")
         ]
 
-    def add_attributes(self, part_df, attribute_df, part_name):
-        """Add constant and min/max attributes to plant parts."""
-        for attribute_col in CONSISTENT_ATTRIBUTE_COLS:
-            part_df = AddConsistentAttributes(attribute_col, part_name).execute(
-                part_df, attribute_df
+    def add_attributes(
+        self,
+        part_df: pd.DataFrame,
+        attribute_df: pd.DataFrame,
+        part_name: str,
+        aggregator: "PlantPartAggregator | None" = None,
+    ) -> pd.DataFrame:
+        """Add constant and min/max attributes to plant parts.
+
+        All of the attributes of the part are found in one grouped pass by
+        :meth:`PlantPartAggregator.attributes`. Attributes already in ``part_df`` are
+        left as they are.
+
+        Args:
+            part_df: dataframe containing records associated with one plant part.
+            attribute_df: the records the plant part was aggregated from.
+            part_name: the name of the plant part.
+            aggregator: a :class:`PlantPartAggregator` of ``attribute_df`` which
+                covers ``part_name``. If None, one is made.
+        """
+        if aggregator is None:
+            aggregator = PlantPartAggregator(attribute_df, [part_name])
+        return part_df.merge(
+            aggregator.attributes(part_name, exclude=part_df.columns),
+            on=PLANT_PARTS[part_name]["id_cols"] + IDX_TO_ADD,
+            how="left",
+            validate="m:1",
+        )
+
+
+class PlantPartAggregator:
+    """Aggregate the records of ``gens_mega`` to many plant-parts at once.
+
+    Making each plant-part straight from ``gens_mega`` means grouping the whole table
+    by that part's ID columns, and then grouping it again for every attribute we add
+    to the part. Instead, the ID columns of all of the plant-parts are factorized into
+    integer codes once, and the "owned" and "total" ownership slices of ``gens_mega``
+    are summed up to their finest granularity: the combination of every plant-part's
+    ID columns. Each plant-part is then summed up from these tables of sums, with
+    weighted averages calculated from sums of weights and weighted values.
+
+    The consistent, priority and max/min attributes of each plant-part are found in
+    one grouped pass over the factorized attribute columns. See
+    :class:`AddConsistentAttributes`, :class:`AddPriorityAttribute` and
+    :class:`AddMaxMinAttribute` for how each type of attribute is defined.
+    """
+
+    def __init__(
+        self,
+        gens_mega: pd.DataFrame,
+        part_names: list[str],
+        sum_cols: list[str] = SUM_COLS,
+        wtavg_dict: dict = WTAVG_DICT,
+    ):
+        """Factorize the ID columns of the plant-parts.
+
+        Args:
+            gens_mega: a table of all of the generators with identifying columns and
+                data columns, sliced by ownership which makes "total" and "owned"
+                records for each generator owner.
+            part_names: the names of the plant-parts to aggregate to. Names can be
+                only those in :py:const:`PLANT_PARTS`.
+            sum_cols: columns to sum when aggregating the plant-parts.
+            wtavg_dict: dictionary of columns to average (keys) and columns to weight
+                by (values) when aggregating the plant-parts.
+        """
+        self.gens_mega = gens_mega
+        self.sum_cols = sum_cols
+        self.wtavg_dict = wtavg_dict
+        id_cols = list(
+            dict.fromkeys(
+                col
+                for part_name in part_names
+                for col in PLANT_PARTS[part_name]["id_cols"]
             )
-        for attribute_col in PRIORITY_ATTRIBUTES_DICT:
-            part_df = AddPriorityAttribute(attribute_col, part_name).execute(
-                part_df, attribute_df
+        )
+        self.key_cols = id_cols + IDX_TO_ADD + IDX_OWN_TO_ADD
+        # Null IDs get a code of -1. Sorting the uniques means sorting the codes of a
+        # column sorts its values, so the parts come out in the same order a groupby
+        # on the ID columns themselves would produce.
+        self.uniques = {}
+        codes = {}
+        for col in self.key_cols:
+            codes[col], self.uniques[col] = pd.factorize(gens_mega[col], sort=True)
+        self.codes = pd.DataFrame(codes)
+        self._attributes = {}
+
+    @cached_property
+    def _owned_sums(self) -> pd.DataFrame:
+        """Sums of the "owned" records by every ID column, owner and record type."""
+        return self._sum_finest(self._slice_rows("owned"), self.key_cols)
+
+    @cached_property
+    def _total_sums(self) -> pd.DataFrame:
+        """Sums of the "total" records by every ID column.
+
+        There is a "total" record of each generator for each of its owners, so the
+        records that are duplicates once their owner is dropped are only summed once.
+        """
+        rows = self._slice_rows("total")
+        dupes = self.gens_mega.iloc[rows].drop(columns=["utility_id_eia"]).duplicated()
+        return self._sum_finest(
+            rows[~dupes.to_numpy()],
+            [col for col in self.key_cols if col not in IDX_OWN_TO_ADD],
+        )
+
+    @cached_property
+    def _total_owners(self) -> pd.DataFrame:
+        """The owners and record types of all of the "total" records."""
+        return self.codes.iloc[self._slice_rows("total")]
+
+    def _slice_rows(self, ownership_record_type: str) -> np.ndarray:
+        """Get the positions of the records of one ownership slice."""
+        record_types = self.gens_mega.ownership_record_type
+        if record_types.isin(["owned", "total"]).sum() != len(record_types):
+            raise AssertionError(
+                "Error occurred in breaking apart ownership types."
+                "The total and owned slices should equal the total records."
+                "Check for nulls in the ownership_record_type column."
             )
-        for attribute_col in MAX_MIN_ATTRIBUTES_DICT:
-            part_df = AddMaxMinAttribute(
-                attribute_col,
-                part_name,
-                assign_col_dict=MAX_MIN_ATTRIBUTES_DICT[attribute_col]["assign_col"],
-            ).execute(
-                part_df,
-                attribute_df,
-                att_dtype=MAX_MIN_ATTRIBUTES_DICT[attribute_col]["dtype"],
-                keep=MAX_MIN_ATTRIBUTES_DICT[attribute_col]["keep"],
+        return np.flatnonzero(record_types == ownership_record_type)
+
+    def _sum_finest(self, rows: np.ndarray, by: list[str]) -> pd.DataFrame:
+        """Sum the data and weighted data of some records by the codes in ``by``."""
+        records = self.gens_mega.iloc[rows]
+        values = {col: records[col] for col in self.sum_cols}
+        for data_col, weight_col in self.wtavg_dict.items():
+            values[f"_{data_col}_times_weight"] = (
+                records[data_col] * records[weight_col]
             )
-        return part_df
+            values[f"_{data_col}_weight"] = records[weight_col].where(
+                records[data_col].notnull()
+            )
+        return (
+            pd.concat(
+                [
+                    self.codes[by].iloc[rows].reset_index(drop=True),
+                    pd.DataFrame(values).reset_index(drop=True),
+                ],
+                axis="columns",
+            )
+            .groupby(by, sort=False)
+            .sum(min_count=1)
+            .reset_index()
+        )
+
+    def _sum_part(self, sums: pd.DataFrame, by: list[str]) -> pd.DataFrame:
+        """Sum finest granularity sums by ``by`` and calculate the weighted averages.
+
+        Like a groupby, records with null IDs are dropped.
+        """
+        part = (
+            sums.loc[(sums[by].to_numpy() >= 0).all(axis=1)]
+            .groupby(by, sort=True)
+            .sum(min_count=1)
+            .reset_index()
+        )
+        for data_col in self.wtavg_dict:
+            part[data_col] = part.pop(f"_{data_col}_times_weight") / part.pop(
+                f"_{data_col}_weight"
+            )
+        return part[by + self.sum_cols + list(self.wtavg_dict)]
+
+    def _decode(self, part: pd.DataFrame) -> pd.DataFrame:
+        """Replace the codes of the ID columns with their values."""
+        return part.assign(
+            **{
+                col: self.uniques[col].take(part[col]).where(part[col].to_numpy() >= 0)
+                for col in part.columns.intersection(self.key_cols)
+            }
+        )
+
+    def aggregate(self, part_name: str) -> pd.DataFrame:
+        """Aggregate the plant part by separating ownership types.
+
+        See :meth:`PlantPart.ag_part_by_own_slice`.
+
+        Returns:
+            dataframe aggregated to the level of the part_name
+        """
+        logger.info(f"begin aggregation for: {part_name}")
+        tot_cols = PLANT_PARTS[part_name]["id_cols"] + IDX_TO_ADD
+        part_own = self._sum_part(self._owned_sums, tot_cols + IDX_OWN_TO_ADD)
+        # merge each of the utilities that own any slice of a plant-part into its
+        # utility-less "total" record.
+        part_tot = self._sum_part(self._total_sums, tot_cols).merge(
+            self._total_owners[tot_cols + IDX_OWN_TO_ADD].drop_duplicates(),
+            on=tot_cols,
+            how="left",
+            validate="1:m",
+        )
+        return pd.concat(
+            [self._decode(part_own), self._decode(part_tot)[part_own.columns]]
+        ).pipe(pudl.helpers.convert_cols_dtypes, "eia")
+
+    def attributes(self, part_name: str, exclude: list[str] = ()) -> pd.DataFrame:
+        """Get the attributes of each of a plant-part's records.
+
+        Args:
+            part_name: the name of the plant-part.
+            exclude: attribute columns not to get, e.g. because they are already in
+                the plant-part table.
+
+        Returns:
+            A table of the plant-part's ID columns plus :py:const:`IDX_TO_ADD` and
+            the requested attributes from :py:const:`CONSISTENT_ATTRIBUTE_COLS`,
+            :py:const:`PRIORITY_ATTRIBUTES_DICT` and
+            :py:const:`MAX_MIN_ATTRIBUTES_DICT`.
+        """
+        base_cols = PLANT_PARTS[part_name]["id_cols"] + IDX_TO_ADD
+        consistent_cols = [
+            col for col in CONSISTENT_ATTRIBUTE_COLS if col not in exclude
+        ]
+        priority_cols = [col for col in PRIORITY_ATTRIBUTES_DICT if col not in exclude]
+        max_min_cols = [col for col in MAX_MIN_ATTRIBUTES_DICT if col not in exclude]
+        valid = (self.codes[base_cols].to_numpy() >= 0).all(axis=1)
+        grouped = (
+            pd.concat(
+                [self.codes[base_cols]]
+                + [self._attribute(col) for col in consistent_cols]
+                + [self._attribute(col) for col in max_min_cols],
+                axis="columns",
+            )
+            .loc[valid]
+            .assign(row=np.flatnonzero(valid))
+            .groupby(base_cols, sort=True)
+        )
+        first_rows = grouped.row.min().to_numpy()
+        code_ranges = grouped[consistent_cols].agg(["min", "max"])
+
+        attributes = {col: self.gens_mega[col].iloc[first_rows] for col in base_cols}
+        for col in consistent_cols:
+            # only attributes that are identical for every component record of a
+            # plant-part are kept. Null attributes are never consistent.
+            min_code = code_ranges[(col, "min")].to_numpy()
+            attributes[col] = (
+                self.gens_mega[col]
+                .iloc[first_rows]
+                .where(
+                    (min_code == code_ranges[(col, "max")].to_numpy()) & (min_code >= 0)
+                )
+            )
+        for col in priority_cols:
+            attributes[col] = self._attribute(col).iloc[first_rows]
+        for col in max_min_cols:
+            if MAX_MIN_ATTRIBUTES_DICT[col]["keep"] == "first":
+                attributes[col] = grouped[col].max()
+            else:
+                # the last of the values sorted in descending order is null if any
+                # of them are null.
+                attributes[col] = (
+                    grouped[col].min().where(grouped[col].count() == grouped.size())
+                )
+        return pd.DataFrame({col: values.array for col, values in attributes.items()})
+
+    def _attribute(self, attribute_col: str) -> pd.Series:
+        """Prepare an attribute column of ``gens_mega`` the first time it's needed.
+
+        Consistent attributes are factorized, priority attributes are converted to a
+        category ordered by their priority and max/min attributes are assigned and
+        converted to their dtype.
+        """
+        if attribute_col not in self._attributes:
+            if attribute_col in MAX_MIN_ATTRIBUTES_DICT:
+                spec = MAX_MIN_ATTRIBUTES_DICT[attribute_col]
+                assign_col = spec["assign_col"].get(attribute_col)
+                values = (
+                    assign_col(self.gens_mega)
+                    if assign_col is not None
+                    else self.gens_mega[attribute_col]
+                ).astype(spec["dtype"])
+            elif attribute_col in PRIORITY_ATTRIBUTES_DICT:
+                values = self.gens_mega[attribute_col].astype(
+                    pd.CategoricalDtype(
+                        categories=PRIORITY_ATTRIBUTES_DICT[attribute_col],
+                        ordered=True,
+                    )
+                )
+            else:
+                values = pd.Series(pd.factorize(self.gens_mega[attribute_col])[0])
+            self._attributes[attribute_col] = values.reset_index(drop=True).rename(
+                attribute_col
+            )
+        return self._attributes[attribute_col]
 
 
 class PlantPart:
@@ -861,6 +1129,7 @@ class PlantPart:
         gens_mega: pd.DataFrame,
         sum_cols: list[str] = SUM_COLS,
         wtavg_dict: dict = WTAVG_DICT,
+        aggregator: PlantPartAggregator | None = None,
     ) -> pd.DataFrame:
         """Get a table of data aggregated by a specific plant-part.
 
@@ -869,12 +1138,26 @@ class PlantPart:
         :meth:`ag_part_by_own_slice`. Then several additional columns are added
         and the records are labeled as true or false granularities.
 
+        Args:
+            gens_mega: a table of all of the generators with identifying columns and
+                data columns, sliced by ownership which makes "total" and "owned"
+                records for each generator owner.
+            sum_cols: columns to sum.
+            wtavg_dict: dictionary of columns to average (keys) and columns to
+                weight by (values).
+            aggregator: a :class:`PlantPartAggregator` of ``gens_mega`` shared by
+                several plant-parts. If given, its ``sum_cols`` and ``wtavg_dict``
+                are used.
+
         Returns:
             a table with records that have been aggregated to a plant-part.
         """
         part_df = (
             self.ag_part_by_own_slice(
-                gens_mega, sum_cols=sum_cols, wtavg_dict=wtavg_dict
+                gens_mega,
+                sum_cols=sum_cols,
+                wtavg_dict=wtavg_dict,
+                aggregator=aggregator,
             )
             .pipe(self.ag_fraction_owned)
             .assign(plant_part=self.part_name)
@@ -900,6 +1183,7 @@ class PlantPart:
         gens_mega,
         sum_cols=SUM_COLS,
         wtavg_dict=WTAVG_DICT,
+        aggregator: PlantPartAggregator | None = None,
     ) -> pd.DataFrame:
         """Aggregate the plant part by separating ownership types.
 
@@ -911,59 +1195,18 @@ class PlantPart:
         the portions of generators created by scale_by_ownership will be
         appropriately aggregated to each plant part level.
 
+        The aggregation itself is done by a :class:`PlantPartAggregator`, which can
+        be shared between plant-parts.
+
         Returns:
             pandas.DataFrame: dataframe aggregated to the level of the
             part_name
         """
-        logger.info(f"begin aggregation for: {self.part_name}")
-        # id_cols = PLANT_PARTS[self.part_name]["id_cols"]
-        # split up the 'owned' slices from the 'total' slices.
-        # this is because the aggregations are different
-        part_own = gens_mega.loc[gens_mega.ownership_record_type == "owned"].copy()
-        part_tot = gens_mega.loc[gens_mega.ownership_record_type == "total"].copy()
-        if len(gens_mega) != len(part_own) + len(part_tot):
-            raise AssertionError(
-                "Error occurred in breaking apart ownership types."
-                "The total and owned slices should equal the total records."
-                "Check for nulls in the ownership_record_type column."
-            )
-        part_own = pudl.helpers.sum_and_weighted_average_agg(
-            df_in=part_own,
-            by=self.id_cols + IDX_TO_ADD + IDX_OWN_TO_ADD,
-            sum_cols=sum_cols,
-            wtavg_dict=wtavg_dict,
-        )
-
-        # we want a "total" record for each of the utilities that own any slice
-        # of a particular plant-part. To achieve this, we are going to remove
-        # the utility info (and drop duplicates bc a plant-part with many
-        # generators will have multiple duplicate records for each owner)
-        # we are going to generate the aggregated output for a utility-less
-        # "total" record and then merge back in the many utilities so each of
-        # the utilities is associated with an aggregated "total" plant-part
-        # record
-        part_tot_no_utils = part_tot.drop(columns=["utility_id_eia"]).drop_duplicates()
-        # still need to re-calc the fraction owned for the part
-        part_tot_out = (
-            pudl.helpers.sum_and_weighted_average_agg(
-                df_in=part_tot_no_utils,
-                by=self.id_cols + IDX_TO_ADD,
-                sum_cols=sum_cols,
-                wtavg_dict=wtavg_dict,
-            )
-            .pipe(pudl.helpers.convert_cols_dtypes, "eia")
-            .merge(
-                part_tot[self.id_cols + IDX_TO_ADD + IDX_OWN_TO_ADD].drop_duplicates(),
-                on=self.id_cols + IDX_TO_ADD,
-                how="left",
-                validate="1:m",
+        if aggregator is None:
+            aggregator = PlantPartAggregator(
+                gens_mega, [self.part_name], sum_cols=sum_cols, wtavg_dict=wtavg_dict
             )
-        )
-        part_ag = pd.concat([part_own, part_tot_out]).pipe(
-            pudl.helpers.convert_cols_dtypes, "eia"
-        )
-
-        return part_ag
+        return aggregator.aggregate(self.part_name)
 
     def ag_fraction_owned(self, part_ag: pd.DataFrame):
         """Calculate the fraction owned for a plant-part df.
@@ -987,29 +1230,18 @@ class PlantPart:
         # Note: we could simply not include the ownership_record_type == "total" records
         # We are automatically assign fraction_owned == 1 to them, but it seems
         # cleaner to run the full df through this same groupby
-        frac_owned = part_ag.groupby(
+        capacity_mw_total = part_ag.groupby(
             by=self.id_cols + IDX_TO_ADD + ["ownership_record_type"], observed=True
-        )[["capacity_mw"]].sum(min_count=1)
-        # then merge the total capacity with the plant-part capacity to use to
-        # calculate the fraction_owned
-        part_frac = (
-            pd.merge(
-                part_ag,
-                frac_owned,
-                right_index=True,
-                left_on=frac_owned.index.names,
-                suffixes=("", "_total"),
-            )
-            .assign(
-                fraction_owned=lambda x: np.where(
-                    x.ownership_record_type == "owned",
-                    x.capacity_mw / x.capacity_mw_total,
-                    1,
-                )
+        )["capacity_mw"].transform("sum", min_count=1)
+        # then use the total capacity of the plant-part to calculate the
+        # fraction_owned
+        part_frac = part_ag.assign(
+            fraction_owned=np.where(
+                part_ag.ownership_record_type == "owned",
+                part_ag.capacity_mw / capacity_mw_total,
+                1,
             )
-            .drop(columns=["capacity_mw_total"])
-            .pipe(pudl.helpers.convert_cols_dtypes, "eia")
-        )
+        ).pipe(pudl.helpers.convert_cols_dtypes, "eia")
         return part_frac
 
     def add_new_plant_name(self, part_df, gens_mega):
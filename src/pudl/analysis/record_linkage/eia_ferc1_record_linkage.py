@@ -29,14 +29,19 @@ are the connections we keep as the matches between FERC1 plant records and EIA
 plant-parts.
 """
 
+import hashlib
 import importlib
+import json
+import shutil
+import tempfile
+from pathlib import Path
 from typing import Literal
 
 import jellyfish
 import mlflow
 import numpy as np
 import pandas as pd
-from dagster import Out, graph, op
+from dagster import Config, Out, graph, op
 from splink import DuckDBAPI, Linker, SettingsCreator
 
 import pudl
@@ -176,10 +181,11 @@ def get_input_dfs(inputs):
 def prepare_for_matching(df, transformed_df):
     """Prepare the input dataframes for matching with splink."""
 
-    def _get_metaphone(row, col_name):
-        if pd.isnull(row[col_name]):
-            return None
-        return jellyfish.metaphone(row[col_name])
+    def _get_metaphone(names: pd.Series) -> pd.Series:
+        # Names repeat across years, so only encode each distinct name once.
+        uniques = names.dropna().unique()
+        metaphones = dict(zip(uniques, map(jellyfish.metaphone, uniques), strict=True))
+        return names.map(metaphones).astype(object).where(names.notna(), None)
 
     # replace old cols with transformed cols
     for col in transformed_df.columns:
@@ -187,8 +193,8 @@ def prepare_for_matching(df, transformed_df):
         df[orig_col_name] = transformed_df[col]
     df["installation_year"] = pd.to_datetime(df["installation_year"], format="%Y")
     df["construction_year"] = pd.to_datetime(df["construction_year"], format="%Y")
-    df["plant_name_mphone"] = df.apply(_get_metaphone, axis=1, args=("plant_name",))
-    df["utility_name_mphone"] = df.apply(_get_metaphone, axis=1, args=("utility_name",))
+    df["plant_name_mphone"] = _get_metaphone(df["plant_name"])
+    df["utility_name_mphone"] = _get_metaphone(df["utility_name"])
     cols = ID_COL + MATCHING_COLS + EXTRA_COLS
     df = df.loc[:, cols]
     return df
@@ -209,10 +215,36 @@ def get_training_data_df(inputs):
     return train_df
 
 
-@op
-def get_model_predictions(eia_df, ferc_df, train_df, experiment_tracker):
-    """Train splink model and output predicted matches."""
-    settings = SettingsCreator(
+class SplinkModelConfig(Config):
+    """Configuration for training the splink model and predicting matches."""
+
+    #: Directory in which to save the trained model parameters and the predicted
+    #: matches, so that later runs with the same training data and model settings
+    #: skip training. Predictions are made in a temporary DuckDB database file in
+    #: this directory rather than in memory. If empty, nothing is cached.
+    splink_cache_dir: str = ""
+    #: Only predict matches for the report years whose EIA or FERC records have
+    #: changed since they were last predicted with the cached model, and reuse the
+    #: saved predictions for all other years. Changes that affect every year's
+    #: predictions, like a different number of EIA records or different term
+    #: frequencies, still cause every year to be predicted again. Requires
+    #: ``splink_cache_dir``.
+    incremental: bool = False
+
+
+def _hash_records(*dfs: pd.DataFrame) -> str:
+    """Hash the contents of dataframes, irrespective of their row order."""
+    content = hashlib.sha256()
+    for df in dfs:
+        content.update(",".join(df.columns).encode())
+        row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        content.update(np.sort(row_hashes))
+    return content.hexdigest()
+
+
+def _get_splink_settings(eia_df: pd.DataFrame) -> SettingsCreator:
+    """Settings of the splink model linking EIA plant parts to FERC1 plants."""
+    return SettingsCreator(
         link_type="link_only",
         unique_id_column_name="record_id",
         additional_columns_to_retain=["plant_id_pudl", "utility_id_pudl"],
@@ -222,19 +254,173 @@ def get_model_predictions(eia_df, ferc_df, train_df, experiment_tracker):
         retain_intermediate_calculation_columns=True,
         probability_two_random_records_match=(1.0 / len(eia_df)),
     )
-    linker = Linker(
-        [eia_df, ferc_df],
-        settings=settings,
-        input_table_aliases=["eia_df", "ferc_df"],
-        db_api=DuckDBAPI(),
-    )
+
+
+def _train_model(linker: Linker, train_df: pd.DataFrame) -> None:
+    """Estimate the u and m probabilities of the splink model."""
     linker.table_management.register_table(train_df, "training_labels", overwrite=True)
     linker.training.estimate_u_using_random_sampling(max_pairs=1e7)
     linker.training.estimate_m_from_pairwise_labels("training_labels")
+
+
+def _get_cached_model(
+    cache_dir: Path,
+    eia_df: pd.DataFrame,
+    ferc_df: pd.DataFrame,
+    train_df: pd.DataFrame,
+) -> tuple[dict, str]:
+    """Load the trained splink model from the cache, training and saving it if needed.
+
+    The model is keyed by a hash of the training data and the model settings, which
+    include the :data:`COMPARISONS` and :data:`BLOCKING_RULES`.
+
+    Returns:
+        The trained model settings, and the key they were cached under.
+    """
+    settings_dict = _get_splink_settings(eia_df).create_settings_dict("duckdb")
+    # The prior match probability depends on the number of EIA records, and is reset
+    # below so that it doesn't have to be part of the key.
+    del settings_dict["probability_two_random_records_match"]
+    model_key = hashlib.sha256(
+        json.dumps(settings_dict, sort_keys=True, default=str).encode()
+        + _hash_records(train_df).encode()
+    ).hexdigest()[:16]
+    model_path = cache_dir / f"splink_model_{model_key}.json"
+    if model_path.exists():
+        logger.info(f"Using the trained splink model cached in {model_path}")
+        model = json.loads(model_path.read_text())
+    else:
+        linker = Linker(
+            [eia_df, ferc_df],
+            settings=_get_splink_settings(eia_df),
+            input_table_aliases=["eia_df", "ferc_df"],
+            db_api=DuckDBAPI(),
+        )
+        _train_model(linker, train_df)
+        model = linker.misc.save_model_to_json(str(model_path), overwrite=True)
+    model["probability_two_random_records_match"] = 1.0 / len(eia_df)
+    return model, model_key
+
+
+def _predict_with_cached_model(
+    config: SplinkModelConfig,
+    eia_df: pd.DataFrame,
+    ferc_df: pd.DataFrame,
+    train_df: pd.DataFrame,
+    threshold_prob: float,
+) -> pd.DataFrame:
+    """Predict matches with a cached model, only for new or changed years if requested.
+
+    All blocking rules compare records from the same report year, so the matches in
+    each year can be predicted on their own. Each year's predictions are saved in a
+    parquet file named for a hash of that year's input records. Term frequencies are
+    computed from the records of all years, so that the predictions don't depend on
+    which years were predicted together, and the predictions are made in a DuckDB
+    database file rather than in memory.
+
+    The scores of every year also depend on the term frequencies and on the prior
+    match probability, which is based on the number of EIA records. The predictions
+    are saved in a directory named for a hash of both, so any change to them causes
+    all years to be predicted again.
+    """
+    cache_dir = Path(config.splink_cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    model, model_key = _get_cached_model(cache_dir, eia_df, ferc_df, train_df)
+    tf_columns = {
+        level["tf_adjustment_column"]
+        for comparison in model["comparisons"]
+        for level in comparison["comparison_levels"]
+        if level.get("tf_adjustment_column")
+    }
+    tf_tables = {
+        col: pd.concat([eia_df[col], ferc_df[col]])
+        .value_counts(normalize=True)
+        .rename(f"tf_{col}")
+        .reset_index()
+        for col in sorted(tf_columns)
+    }
+    context_key = hashlib.sha256(
+        json.dumps(model["probability_two_random_records_match"]).encode()
+        + _hash_records(*tf_tables.values()).encode()
+    ).hexdigest()[:16]
+    preds_dir = cache_dir / f"predictions_{model_key}_{context_key}"
+    # Predictions made with other term frequencies or priors are out of date.
+    for stale_dir in cache_dir.glob(f"predictions_{model_key}_*"):
+        if stale_dir != preds_dir:
+            shutil.rmtree(stale_dir)
+    preds_dir.mkdir(exist_ok=True)
+
+    year_paths = {
+        year: preds_dir
+        / f"{year}_{_hash_records(eia_year_df, ferc_df[ferc_df.report_year == year])[:16]}.parquet"
+        for year, eia_year_df in eia_df.groupby("report_year")
+    }
+    years_to_predict = [
+        year
+        for year, path in year_paths.items()
+        if not (config.incremental and path.exists())
+    ]
+    logger.info(
+        f"Predicting matches for {len(years_to_predict)} of {len(year_paths)} "
+        "report years."
+    )
+    if years_to_predict:
+        # The DuckDB database only holds intermediate tables while predicting.
+        with tempfile.TemporaryDirectory(dir=cache_dir) as tmp_dir:
+            linker = Linker(
+                [
+                    eia_df[eia_df.report_year.isin(years_to_predict)],
+                    ferc_df[ferc_df.report_year.isin(years_to_predict)],
+                ],
+                settings=model,
+                input_table_aliases=["eia_df", "ferc_df"],
+                db_api=DuckDBAPI(str(Path(tmp_dir) / "splink.duckdb")),
+            )
+            for col, tf_table in tf_tables.items():
+                linker.table_management.register_term_frequency_lookup(tf_table, col)
+            preds_df = linker.inference.predict(
+                threshold_match_probability=threshold_prob
+            ).as_pandas_dataframe()
+
+        pred_years = preds_df.record_id_r.map(
+            ferc_df.set_index("record_id").report_year
+        )
+        for year in years_to_predict:
+            for stale_path in preds_dir.glob(f"{year}_*.parquet"):
+                stale_path.unlink()
+            preds_df[pred_years == year].to_parquet(year_paths[year], index=False)
+
+    return pd.concat(
+        [pd.read_parquet(path) for path in year_paths.values()], ignore_index=True
+    )
+
+
+@op
+def get_model_predictions(
+    config: SplinkModelConfig, eia_df, ferc_df, train_df, experiment_tracker
+):
+    """Train splink model and output predicted matches.
+
+    See :class:`SplinkModelConfig` for how the trained model and its predictions can
+    be cached between runs.
+    """
+    if config.incremental and not config.splink_cache_dir:
+        raise ValueError("Incremental predictions require a splink_cache_dir.")
     threshold_prob = 0.9
     experiment_tracker.execute_logging(
         lambda: mlflow.log_params({"threshold match probability": threshold_prob})
     )
+    if config.splink_cache_dir:
+        return _predict_with_cached_model(
+            config, eia_df, ferc_df, train_df, threshold_prob
+        )
+    linker = Linker(
+        [eia_df, ferc_df],
+        settings=_get_splink_settings(eia_df),
+        input_table_aliases=["eia_df", "ferc_df"],
+        db_api=DuckDBAPI(),
+    )
+    _train_model(linker, train_df)
     preds_df = linker.inference.predict(threshold_match_probability=threshold_prob)
     return preds_df.as_pandas_dataframe()
 
@@ -6,11 +6,12 @@ from tempfile import TemporaryDirectory
 import mlflow
 import numpy as np
 import pandas as pd
+import scipy.sparse
 from dagster import Config, graph, op
 from numba import njit
 from numba.typed import List
 from sklearn.cluster import DBSCAN, AgglomerativeClustering
-from sklearn.metrics import pairwise_distances_chunked
+from sklearn.metrics import pairwise_distances, pairwise_distances_chunked
 from sklearn.neighbors import NearestNeighbors
 
 import pudl
@@ -29,6 +30,10 @@ class PenalizeReportYearDistanceConfig(Config):
 
     distance_penalty: float = 10000.0
     metric: str = "euclidean"
+    #: If True, don't store the full distance matrix, and instead compute the
+    #: distances each step needs from the feature matrix. See
+    #: :class:`SparseDistanceMatrix`.
+    sparse: bool = False
 
 
 class DistanceMatrix:
@@ -77,6 +82,138 @@ class DistanceMatrix:
             shape=(feature_matrix.shape[0], feature_matrix.shape[0]),
         )
 
+    def radius_neighbors_graph(self, radius: float) -> scipy.sparse.csr_matrix:
+        """Sparse graph of the distances between all records within ``radius``."""
+        neighbor_computer = NearestNeighbors(radius=radius, metric="precomputed")
+        neighbor_computer.fit(self.distance_matrix)
+        return neighbor_computer.radius_neighbors_graph(mode="distance")
+
+    def cluster_distance_matrix(self, cluster_inds: np.ndarray) -> np.ndarray:
+        """Return a distance matrix with only distances within a cluster."""
+        return get_cluster_distance_matrix(self.distance_matrix, cluster_inds)
+
+    def average_distance_matrix(self, cluster_groups: list[np.ndarray]) -> np.ndarray:
+        """Average distance between each pair of clusters of records.
+
+        See :func:`get_average_distance_matrix`.
+        """
+        return get_average_distance_matrix(
+            self.distance_matrix, List([List(inds) for inds in cluster_groups])
+        )
+
+
+class SparseDistanceMatrix(DistanceMatrix):
+    """Compute the distances between records on demand from the feature matrix.
+
+    Rather than writing all N x N distances to disk, the distances are computed in
+    blocks of rows each time they're needed, and only those that each step uses are
+    kept: the sparse graph of neighbors within a radius used by DBSCAN, the distances
+    within the small overmerged clusters, and the sums of distances between clusters.
+    The same-year penalty is only applied within those blocks. Distances are computed
+    and rounded to float32 just like those :class:`DistanceMatrix` stores, so the
+    clustering steps assign the same IDs with either of them.
+    """
+
+    #: Approximate memory in MiB to use for each block of distances.
+    working_memory: int = 128
+
+    def __init__(
+        self,
+        feature_matrix: np.ndarray,
+        original_df: pd.DataFrame,
+        config: PenalizeReportYearDistanceConfig,
+    ):
+        """Keep the feature matrix and report years needed to compute distances."""
+        self.feature_matrix = feature_matrix
+        self.year_codes = pd.factorize(original_df["report_year"])[0].astype("int16")
+        self.config = config
+
+    def _penalized_distances(
+        self, rows: np.ndarray, distances: np.ndarray, cols: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Penalize distances between records from the same report year.
+
+        ``distances`` are between the records in ``rows`` and either all records, or
+        the records in ``cols`` if given, which are expected to be the same as
+        ``rows``.
+        """
+        distances = distances.astype("float32")
+        col_years = self.year_codes if cols is None else self.year_codes[cols]
+        distances[self.year_codes[rows][:, None] == col_years[None, :]] = (
+            self.config.distance_penalty
+        )
+        if cols is None:
+            distances[np.arange(len(rows)), rows] = 0
+        else:
+            np.fill_diagonal(distances, 0)
+        return distances
+
+    def _distance_blocks(self):
+        """Yield the row indices and penalized distances of blocks of rows."""
+        row_start = 0
+        for chunk in pairwise_distances_chunked(
+            self.feature_matrix,
+            metric=self.config.metric,
+            working_memory=self.working_memory,
+        ):
+            rows = np.arange(row_start, row_start + len(chunk))
+            yield rows, self._penalized_distances(rows, chunk)
+            row_start += len(chunk)
+
+    def radius_neighbors_graph(self, radius: float) -> scipy.sparse.csr_matrix:
+        """Sparse graph of the distances between all records within ``radius``."""
+        blocks = []
+        for rows, distances in self._distance_blocks():
+            in_radius = distances <= radius
+            # Records are not their own neighbors
+            in_radius[np.arange(len(rows)), rows] = False
+            blocks.append(
+                scipy.sparse.csr_matrix(
+                    (
+                        distances[in_radius],
+                        np.nonzero(in_radius)[1],
+                        np.concatenate([[0], np.cumsum(in_radius.sum(axis=1))]),
+                    ),
+                    shape=distances.shape,
+                )
+            )
+        return scipy.sparse.vstack(blocks, format="csr")
+
+    def cluster_distance_matrix(self, cluster_inds: np.ndarray) -> np.ndarray:
+        """Return a distance matrix with only distances within a cluster."""
+        return self._penalized_distances(
+            cluster_inds,
+            pairwise_distances(
+                self.feature_matrix[cluster_inds], metric=self.config.metric
+            ),
+            cols=cluster_inds,
+        )
+
+    def average_distance_matrix(self, cluster_groups: list[np.ndarray]) -> np.ndarray:
+        """Average distance between each pair of clusters of records.
+
+        The total distance between the records in each pair of clusters is summed one
+        block of rows at a time with a sparse record-to-cluster indicator matrix.
+        """
+        n_clusters = len(cluster_groups)
+        cluster_sizes = np.array([len(inds) for inds in cluster_groups])
+        membership = scipy.sparse.csr_matrix(
+            (
+                np.ones(cluster_sizes.sum()),
+                (
+                    np.concatenate(cluster_groups),
+                    np.repeat(np.arange(n_clusters), cluster_sizes),
+                ),
+            ),
+            shape=(self.feature_matrix.shape[0], n_clusters),
+        )
+        total_dist = np.zeros((n_clusters, n_clusters))
+        for rows, distances in self._distance_blocks():
+            total_dist += membership[rows].T @ (membership.T @ distances.T).T
+        average_dist_matrix = total_dist / np.add.outer(cluster_sizes, cluster_sizes)
+        np.fill_diagonal(average_dist_matrix, 0)
+        return average_dist_matrix
+
 
 def get_cluster_distance_matrix(
     distance_matrix: np.ndarray, cluster_inds: np.ndarray
@@ -123,6 +260,8 @@ def compute_distance_with_year_penalty(
 ) -> DistanceMatrix:
     """Compute a distance matrix and penalize records from the same year."""
     logger.info(f"Dist metric: {config.metric}")
+    if config.sparse:
+        return SparseDistanceMatrix(feature_matrix.matrix, original_df, config)
     return DistanceMatrix(feature_matrix.matrix, original_df, config)
 
 
@@ -143,9 +282,7 @@ def cluster_records_dbscan(
 ) -> pd.DataFrame:
     """Generate initial IDs using DBSCAN algorithm."""
     # DBSCAN is very efficient when passed a sparse radius neighbor graph
-    neighbor_computer = NearestNeighbors(radius=config.eps, metric="precomputed")
-    neighbor_computer.fit(distance_matrix.distance_matrix)
-    neighbor_graph = neighbor_computer.radius_neighbors_graph(mode="distance")
+    neighbor_graph = distance_matrix.radius_neighbors_graph(config.eps)
 
     # Classify records
     classifier = DBSCAN(metric="precomputed", eps=config.eps, min_samples=2)
@@ -218,9 +355,7 @@ def split_clusters(
         cluster_inds = id_year_df[
             id_year_df.record_label == duplicated_id
         ].index.to_numpy()
-        cluster_distances = get_cluster_distance_matrix(
-            distance_matrix.distance_matrix, cluster_inds
-        )
+        cluster_distances = distance_matrix.cluster_distance_matrix(cluster_inds)
 
         new_labels = classifier.fit_predict(cluster_distances)
         for new_label in np.unique(new_labels):
@@ -270,15 +405,12 @@ def match_orphaned_records(
     cluster_inds = id_year_df.groupby("record_label").indices
 
     # Orphaned records are considered a cluster of a single record
-    cluster_groups = [List([ind]) for ind in cluster_inds.get(-1, [])]
+    cluster_groups = [np.array([ind]) for ind in cluster_inds.get(-1, [])]
 
     # Get list of all points in each assigned cluster
-    cluster_groups += [List(inds) for key, inds in cluster_inds.items() if key != -1]
-    cluster_groups = List(cluster_groups)
+    cluster_groups += [inds for key, inds in cluster_inds.items() if key != -1]
 
-    average_dist_matrix = get_average_distance_matrix(
-        distance_matrix.distance_matrix, cluster_groups
-    )
+    average_dist_matrix = distance_matrix.average_distance_matrix(cluster_groups)
 
     # Assign new labels to all points
     new_labels = classifier.fit_predict(average_dist_matrix)
@@ -4,11 +4,13 @@ import enum
 import json
 import logging
 import re
+from collections import OrderedDict
+from functools import cache
 from importlib.resources import files
-from typing import Literal
+from typing import ClassVar, Literal
 
 import pandas as pd
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +58,48 @@ class LegalTermLocation(enum.Enum):
     ANYWHERE = 2
 
 
+@cache
+def _legal_term_regex_rules(
+    dict_file: str, json_entry: str, at_the_end: bool
+) -> tuple[tuple[str, str], ...]:
+    """Read the legal terms dictionary and compile it into regex rules.
+
+    Arguments:
+        dict_file: name of the legal terms JSON file in ``pudl.package_data.settings``.
+        json_entry: the entry in the JSON file containing the legal terms.
+        at_the_end: whether the legal terms should only be found at the end of names.
+
+    Returns:
+        the ``(regex rule, replacement)`` pairs to apply, in order.
+    """
+    # The dictionary of legal terms define how to normalize the text's legal form abreviations
+    json_source = files("pudl.package_data.settings").joinpath(dict_file)
+    with json_source.open() as json_file:
+        dict_legal_terms = json.load(json_file)[json_entry]["en"]
+
+    regex_rules = []
+    # Iterate through the dictionary of legal terms
+    for replacement, legal_terms in dict_legal_terms.items():
+        # Each replacement has a list of possible terms to be searched for
+        replacement = " " + replacement.lower() + " "
+        for legal_term in legal_terms:
+            # Make sure to use raw string
+            legal_term = legal_term.lower()
+            # If the legal term has . (dots), then apply regex directly on the legal term
+            # Otherwise, if it's a legal term with only letters in sequence, make sure
+            # that regex find the legal term as a word (\\bLEGAL_TERM\\b)
+            if legal_term.find(".") > -1:
+                legal_term = legal_term.replace(".", "\\.")
+            else:
+                legal_term = "\\b" + legal_term + "\\b"
+            # Check if the legal term should be found only at the end of the string
+            if at_the_end:
+                legal_term = legal_term + "$"
+            # ...and it's a raw string
+            regex_rules.append((rf"{legal_term}", replacement))
+    return tuple(regex_rules)
+
+
 class CompanyNameCleaner(BaseModel):
     """Class to normalize/clean up text based company names."""
 
@@ -101,6 +145,32 @@ class CompanyNameCleaner(BaseModel):
     #: Define if the letters with accents are replaced with non-accented ones
     remove_accents: bool = False
 
+    #: Maximum number of cleaned names to remember between calls to
+    #: :meth:`apply_name_cleaning`.
+    name_cache_size: ClassVar[int] = 2**18
+
+    _name_cache: OrderedDict = PrivateAttr(default_factory=OrderedDict)
+    _name_cache_key: str = PrivateAttr(default="")
+
+    def _resolve_regex_rules(self, dict_regex_rules: dict[str, list[str]]):
+        """Yield the name, replacement and regex of each rule in the dictionary.
+
+        A regex rule can be a reference to another regex rule, by adding the name of
+        the other regex rule in the place of the rule itself. This allows the
+        execution of a regex rule twice.
+        """
+        for name_rule, cleaning_rule in dict_regex_rules.items():
+            # First element is the replacement
+            replacement = cleaning_rule[0]
+            # Second element is the regex rule
+            regex_rule = cleaning_rule[1]
+            # Check if the regex rule is actually a reference to another regex rule.
+            if regex_rule in dict_regex_rules:
+                replacement = dict_regex_rules[cleaning_rule[1]][0]
+                regex_rule = dict_regex_rules[cleaning_rule[1]][1]
+            # Make sure to use raw string
+            yield name_rule, replacement, rf"{regex_rule}"
+
     def _apply_regex_rules(
         self, str_value: str, dict_regex_rules: dict[str, list[str]]
     ) -> str:
@@ -118,22 +188,9 @@ class CompanyNameCleaner(BaseModel):
         """
         clean_value = str_value
         # Iterate through the dictionary and apply each regex rule
-        for name_rule, cleaning_rule in dict_regex_rules.items():
-            # First element is the replacement
-            replacement = cleaning_rule[0]
-            # Second element is the regex rule
-            regex_rule = cleaning_rule[1]
-
-            # Check if the regex rule is actually a reference to another regex rule.
-            # By adding a name of another regex rule in the place of the rule itself allows the execution
-            # of a regex rule twice
-            if regex_rule in dict_regex_rules:
-                replacement = dict_regex_rules[cleaning_rule[1]][0]
-                regex_rule = dict_regex_rules[cleaning_rule[1]][1]
-
-            # Make sure to use raw string
-            regex_rule = rf"{regex_rule}"
-
+        for name_rule, replacement, regex_rule in self._resolve_regex_rules(
+            dict_regex_rules
+        ):
             # Treat the special case of the word THE at the end of a text's name
             found_the_word_the = None
             if name_rule == "place_word_the_at_the_beginning":
@@ -148,6 +205,21 @@ class CompanyNameCleaner(BaseModel):
 
         return clean_value
 
+    def _apply_regex_rules_to_series(
+        self, names: pd.Series, dict_regex_rules: dict[str, list[str]]
+    ) -> pd.Series:
+        """Vectorized version of :meth:`_apply_regex_rules` for a series of names."""
+        for name_rule, replacement, regex_rule in self._resolve_regex_rules(
+            dict_regex_rules
+        ):
+            found_the_word_the = None
+            if name_rule == "place_word_the_at_the_beginning":
+                found_the_word_the = names.str.contains(regex_rule, regex=True)
+            names = names.str.replace(regex_rule, replacement, regex=True)
+            if found_the_word_the is not None:
+                names = names.where(~found_the_word_the, "the " + names)
+        return names
+
     def _remove_unicode_chars(self, value: str) -> str:
         """Removes unicode character that is unreadable when converted to ASCII format.
 
@@ -161,52 +233,31 @@ class CompanyNameCleaner(BaseModel):
         clean_value = value.encode("ascii", "ignore").decode()
         return clean_value
 
+    def _cleaning_rules_dict(self) -> dict[str, list[str]]:
+        """The regex rules of the cleaning rules list."""
+        return {
+            rule_name: CLEANING_RULES_DICT[rule_name]
+            for rule_name in self.cleaning_rules_list
+        }
+
     def _apply_cleaning_rules(self, company_name: str) -> str:
         """Apply the cleaning rules from the dictionary of regex rules."""
-        cleaning_dict = {}
-        for rule_name in self.cleaning_rules_list:
-            cleaning_dict[rule_name] = CLEANING_RULES_DICT[rule_name]
-
-        # Apply all the cleaning rules
-        clean_company_name = self._apply_regex_rules(company_name, cleaning_dict)
-        return clean_company_name
+        return self._apply_regex_rules(company_name, self._cleaning_rules_dict())
+
+    def _legal_term_regex_rules(self) -> tuple[tuple[str, str], ...]:
+        """The regex rules used to normalize legal terms."""
+        return _legal_term_regex_rules(
+            self.__NAME_LEGAL_TERMS_DICT_FILE,
+            self.__NAME_JSON_ENTRY_LEGAL_TERMS,
+            self.legal_term_location == LegalTermLocation.AT_THE_END,
+        )
 
     def _apply_normalization_of_legal_terms(self, company_name: str) -> str:
         """Apply the normalizattion of legal terms according to dictionary of regex rules."""
         # Make sure to remove extra spaces, so legal terms can be found in the end (if requested)
         clean_company_name = company_name.strip()
-
-        # The dictionary of legal terms define how to normalize the text's legal form abreviations
-        json_source = files("pudl.package_data.settings").joinpath(
-            self.__NAME_LEGAL_TERMS_DICT_FILE
-        )
-        with json_source.open() as json_file:
-            _dict_legal_terms = json.load(json_file)[
-                self.__NAME_JSON_ENTRY_LEGAL_TERMS
-            ]["en"]
-
-        # Apply normalization for legal terms
-        # Iterate through the dictionary of legal terms
-        for replacement, legal_terms in _dict_legal_terms.items():
-            # Each replacement has a list of possible terms to be searched for
-            replacement = " " + replacement.lower() + " "
-            for legal_term in legal_terms:
-                # Make sure to use raw string
-                legal_term = legal_term.lower()
-                # If the legal term has . (dots), then apply regex directly on the legal term
-                # Otherwise, if it's a legal term with only letters in sequence, make sure
-                # that regex find the legal term as a word (\\bLEGAL_TERM\\b)
-                if legal_term.find(".") > -1:
-                    legal_term = legal_term.replace(".", "\\.")
-                else:
-                    legal_term = "\\b" + legal_term + "\\b"
-                # Check if the legal term should be found only at the end of the string
-                if self.legal_term_location == LegalTermLocation.AT_THE_END:
-                    legal_term = legal_term + "$"
-                # ...and it's a raw string
-                regex_rule = rf"{legal_term}"
-                # Apply the replacement
-                clean_company_name = re.sub(regex_rule, replacement, clean_company_name)
+        for regex_rule, replacement in self._legal_term_regex_rules():
+            clean_company_name = re.sub(regex_rule, replacement, clean_company_name)
         return clean_company_name
 
     def get_clean_data(self, company_name: str) -> str:
@@ -256,6 +307,69 @@ class CompanyNameCleaner(BaseModel):
 
         return clean_company_name
 
+    def _clean_unique_names(self, names: pd.Series) -> pd.Series:
+        """Vectorized version of :meth:`get_clean_data` for a series of unique strings.
+
+        Each cleaning rule is applied to all of the names in a single pass.
+        """
+        if self.remove_unicode:
+            names = names.str.encode("ascii", "ignore").str.decode("ascii")
+        names = names.str.strip().str.lower()
+        names = self._apply_regex_rules_to_series(names, self._cleaning_rules_dict())
+        if self.normalize_legal_terms:
+            names = names.str.strip()
+            for regex_rule, replacement in self._legal_term_regex_rules():
+                names = names.str.replace(regex_rule, replacement, regex=True)
+        if self.output_lettercase == "upper":
+            names = names.str.upper()
+        elif self.output_lettercase == "title":
+            names = names.str.title()
+        return names.str.strip().str.replace(r"\s+", " ", regex=True)
+
+    def _get_clean_series(self, names: pd.Series) -> pd.Series:
+        """Clean a series of names, cleaning each distinct name only once.
+
+        Names repeat heavily across years, so only the distinct names that haven't
+        been cleaned recently are passed to :meth:`_clean_unique_names`. The results
+        are kept in a least recently used cache of up to :attr:`name_cache_size` names,
+        which is reset if the cleaning configuration changes.
+        """
+        cache_key = self.model_dump_json()
+        if cache_key != self._name_cache_key:
+            self._name_cache.clear()
+            self._name_cache_key = cache_key
+
+        codes, uniques = pd.factorize(names)
+        is_str = uniques.map(lambda name: isinstance(name, str)).to_numpy(dtype=bool)
+        for name in uniques[~is_str]:
+            logger.warning(f"{name} is not a string.")
+        str_uniques = uniques[is_str]
+        is_cached = str_uniques.isin(self._name_cache.keys())
+        for name in str_uniques[is_cached]:
+            self._name_cache.move_to_end(name)
+        new_names = str_uniques[~is_cached]
+        self._name_cache.update(
+            zip(
+                new_names,
+                self._clean_unique_names(pd.Series(new_names, dtype="object")),
+                strict=True,
+            )
+        )
+        clean_uniques = [
+            self._name_cache[name] if name_is_str else pd.NA
+            for name, name_is_str in zip(uniques, is_str, strict=True)
+        ]
+        while len(self._name_cache) > self.name_cache_size:
+            self._name_cache.popitem(last=False)
+
+        clean_names = pd.Series(
+            pd.array(clean_uniques + [pd.NA], dtype="object")[codes],
+            index=names.index,
+            name=names.name,
+            dtype="object",
+        )
+        return clean_names
+
     def apply_name_cleaning(
         self, df: pd.DataFrame, return_as_dframe: bool = False
     ) -> pd.DataFrame:
@@ -271,14 +385,13 @@ class CompanyNameCleaner(BaseModel):
         Returns:
             df (dataframe): the clean version of the input dataframe
         """
-        if isinstance(df, pd.DataFrame) and len(df.columns) > 1:
-            clean_df = pd.DataFrame()
-            for col in df.columns:
-                clean_df = pd.concat(
-                    [clean_df, df[col].apply(self.get_clean_data)], axis=1
+        if isinstance(df, pd.DataFrame):
+            if len(df.columns) > 1:
+                return pd.concat(
+                    [self._get_clean_series(df[col]) for col in df.columns], axis=1
                 )
-            return clean_df
-        out = df.squeeze().apply(self.get_clean_data)
+            df = df.squeeze(axis="columns")
+        out = self._get_clean_series(df)
         if return_as_dframe:
             return out.to_frame()
         return out
@@ -1,11 +1,11 @@
 """Spatial operations for demand allocation."""
 
-import itertools
 import warnings
 from collections.abc import Callable, Iterable
 from typing import Literal
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 import shapely.ops
 from shapely.geometry import GeometryCollection, MultiPolygon, Polygon
@@ -130,6 +130,7 @@ def self_union(gdf: gpd.GeoDataFrame, ratios: Iterable[str] = None) -> gpd.GeoDa
     Returns:
         GeoDataFrame representing the union of the input features with themselves.
         Its index contains tuples of the index of the original overlapping features.
+        Holes enclosed by the input features, but not inside any of them, are dropped.
 
     Raises:
         NotImplementedError: MultiPolygon geometries are not yet supported.
@@ -139,19 +140,26 @@ def self_union(gdf: gpd.GeoDataFrame, ratios: Iterable[str] = None) -> gpd.GeoDa
     is_mpoly = gdf.geometry.geom_type == "MultiPolygon"
     if is_mpoly.any():
         raise NotImplementedError("MultiPolygon geometries are not yet supported")
-    # Calculate all pairwise intersections
+    # Calculate the intersections of all pairs of intersecting geometries, which the
+    # spatial index finds without comparing every pair
     # https://nbviewer.jupyter.org/gist/jorisvandenbossche/3a55a16fda9b3c37e0fb48b1d4019e65
-    pairs = itertools.combinations(gdf.geometry, 2)
-    intersections = gpd.GeoSeries([a.intersection(b) for a, b in pairs])
+    left, right = gdf.sindex.query(gdf.geometry, predicate="intersects", sort=True)
+    is_pair = left < right
+    intersections = (
+        gdf.geometry.iloc[left[is_pair]]
+        .reset_index(drop=True)
+        .intersection(gdf.geometry.iloc[right[is_pair]], align=False)
+    )
     # Form polygons from the boundaries of the original polygons and their intersections
-    boundaries = pd.concat([gdf.geometry, intersections]).boundary.unary_union
-    polygons = gpd.GeoSeries(shapely.ops.polygonize(boundaries))
-    # Determine origin of each polygon by a spatial join on representative points
+    boundaries = pd.concat([gdf.geometry, intersections]).boundary.union_all()
+    polygons = gpd.GeoSeries(shapely.get_parts(shapely.polygonize([boundaries])))
+    # Determine origin of each polygon by a spatial join on representative points,
+    # dropping holes enclosed by the original polygons but not inside any of them
     points = gpd.GeoDataFrame(geometry=polygons.representative_point())
     oids = gpd.sjoin(
         points,
         gdf[["geometry"]],
-        how="left",
+        how="inner",
         predicate="within",
     )["index_right"]
     # Build new dataframe
@@ -163,8 +171,12 @@ def self_union(gdf: gpd.GeoDataFrame, ratios: Iterable[str] = None) -> gpd.GeoDa
     if ratios:
         fraction = df.area.to_numpy() / gdf.area[oids].to_numpy()
         df[ratios] = df[ratios].multiply(fraction, axis="index")
-    # Add original row indices to index
-    df.index = oids.groupby(oids.index).agg(tuple)[oids.index]
+    # Add original row indices to index, from the runs of rows of each polygon
+    starts = np.flatnonzero(np.diff(oids.index, prepend=-1))
+    index = [tuple(x) for x in np.split(oids.to_numpy(), starts[1:])]
+    df.index = pd.Index(index, tupleize_cols=False).repeat(
+        np.diff(starts, append=len(oids))
+    )
     df.index.name = None
     # Return with original column order
     return df[gdf.columns]
@@ -185,7 +197,7 @@ def dissolve(
         by: Names of columns to group features by.
         func: Aggregation function for data columns (see :meth:`pd.DataFrame.groupby`).
         how: Aggregation function for geometry column.
-            Either 'union' (:meth:`gpd.GeoSeries.unary_union`),
+            Either 'union' (:meth:`gpd.GeoSeries.union_all`),
             'first' (first geometry in group),
             or a function aggregating multiple geometries into one.
 
@@ -194,7 +206,7 @@ def dissolve(
         and grouping columns set as the index.
     """
     check_gdf(gdf)
-    merges = {"union": lambda x: x.unary_union, "first": lambda x: x.iloc[0]}
+    merges = {"union": lambda x: x.union_all(), "first": lambda x: x.iloc[0]}
     data = gdf.drop(columns=gdf.geometry.name).groupby(by=by).aggregate(func)
     geometry = gdf.groupby(by=by, group_keys=False)[gdf.geometry.name].aggregate(
         merges.get(how, how)
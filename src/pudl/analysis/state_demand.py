@@ -18,7 +18,9 @@ electricity demand estimates (e.g. at the county level).
 """
 
 import datetime
+import itertools
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
 import geopandas as gpd
@@ -379,7 +381,7 @@ def filter_ferc714_hourly_demand_matrix(
 
 
 def impute_ferc714_hourly_demand_matrix(
-    df: pd.DataFrame, years: list[int]
+    df: pd.DataFrame, years: list[int], workers: int = 1, warm_start: bool = False
 ) -> pd.DataFrame:
     """Impute null values in FERC 714 hourly demand matrix.
 
@@ -387,34 +389,82 @@ def impute_ferc714_hourly_demand_matrix(
     with only the respondents reporting data in that year.
 
     .. note::
-        Takes about 15 minutes.
+        Takes about 15 minutes with one worker and no warm starts.
 
     Args:
         df: FERC 714 hourly demand matrix,
           as described in :func:`load_ferc714_hourly_demand_matrix`.
         years: list of years to input
+        workers: Number of processes to impute the years with. The years are split
+            into this many chunks of consecutive years, which are imputed in
+            parallel.
+        warm_start: Whether to warm start the imputation of each year from the
+            imputed values of the adjacent year imputed before it in the same chunk.
+            See :func:`_impute_ferc714_years`.
 
     Returns:
         Copy of `df` with imputed values.
     """
-    results = []
     # sort here and then don't sort in the groupby so we can process
     # the newer years of data first. This is so we can see early if
     # new data causes any failures.
     df = df.sort_index(ascending=False)
-    for year, gdf in df.groupby(df.index.year, sort=False):
-        # remove the records o/s of the working years because some
-        # respondents report one record of midnight of January first
-        # of the next year (report_date.dt.year + 1). and
-        # impute_ferc714_hourly_demand_matrix chunks over years at a time
-        # and having only one record
-        if year in years:
-            logger.info(f"Imputing year {year}")
-            keep = df.columns[~gdf.isnull().all()]
-            tsi = pudl.analysis.timeseries_cleaning.Timeseries(gdf[keep])
-            result = tsi.to_dataframe(tsi.impute(method="tnn"), copy=False)
-            results.append(result)
-    return pd.concat(results)
+    # remove the records o/s of the working years because some
+    # respondents report one record of midnight of January first
+    # of the next year (report_date.dt.year + 1). and
+    # impute_ferc714_hourly_demand_matrix chunks over years at a time
+    # and having only one record
+    year_dfs = [
+        gdf for year, gdf in df.groupby(df.index.year, sort=False) if year in years
+    ]
+    chunks = [
+        year_dfs[chunk[0] : chunk[-1] + 1]
+        for chunk in np.array_split(np.arange(len(year_dfs)), workers)
+        if len(chunk)
+    ]
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(
+                    _impute_ferc714_years, chunks, itertools.repeat(warm_start)
+                )
+            )
+    else:
+        results = [_impute_ferc714_years(chunk, warm_start) for chunk in chunks]
+    return pd.concat([result for chunk in results for result in chunk])
+
+
+def _impute_ferc714_years(
+    year_dfs: list[pd.DataFrame], warm_start: bool = False
+) -> list[pd.DataFrame]:
+    """Impute the FERC 714 hourly demand matrix of consecutive years one by one.
+
+    If `warm_start`, each year after the first is warm started from the imputed values
+    of the year imputed just before it: the demand of the same respondent at the same
+    hour of the year (or the last hour of the shorter year). A warm started year
+    starts its :func:`pudl.analysis.timeseries_cleaning.impute_latc_tnn` iterations
+    from a larger `rho0`, so fewer iterations are needed.
+
+    Args:
+        year_dfs: FERC 714 hourly demand matrix of each year to impute.
+        warm_start: Whether to warm start the imputation of each year after the first.
+
+    Returns:
+        Imputed FERC 714 hourly demand matrix of each year.
+    """
+    results = []
+    for gdf in year_dfs:
+        logger.info(f"Imputing year {gdf.index[0].year}")
+        keep = gdf.columns[~gdf.isnull().all()]
+        tsi = pudl.analysis.timeseries_cleaning.Timeseries(gdf[keep])
+        kwargs = {}
+        if warm_start and results:
+            previous = results[-1].reindex(columns=keep).to_numpy()
+            hours = np.minimum(np.arange(len(gdf)), len(previous) - 1)
+            kwargs = {"x0": previous[hours], "rho0": 1e-5}
+        result = tsi.to_dataframe(tsi.impute(method="tnn", **kwargs), copy=False)
+        results.append(result)
+    return results
 
 
 def melt_ferc714_hourly_demand_matrix(
@@ -490,6 +540,23 @@ def _out_ferc714__hourly_demand_matrix(
 @asset(
     compute_kind="NumPy",
     required_resource_keys={"dataset_settings"},
+    config_schema={
+        "workers": Field(
+            int,
+            default_value=1,
+            description=(
+                "Number of processes to impute chunks of consecutive years with."
+            ),
+        ),
+        "warm_start": Field(
+            bool,
+            default_value=False,
+            description=(
+                "Whether to warm start the imputation of each year from the imputed"
+                " values of the previous year imputed by the same process."
+            ),
+        ),
+    },
 )
 def _out_ferc714__hourly_imputed_demand(
     context,
@@ -510,7 +577,12 @@ def _out_ferc714__hourly_imputed_demand(
         df: DataFrame with imputed FERC714 hourly demand.
     """
     years = context.resources.dataset_settings.ferc714.years
-    df = impute_ferc714_hourly_demand_matrix(_out_ferc714__hourly_demand_matrix, years)
+    df = impute_ferc714_hourly_demand_matrix(
+        _out_ferc714__hourly_demand_matrix,
+        years,
+        workers=context.op_config["workers"],
+        warm_start=context.op_config["warm_start"],
+    )
     df = melt_ferc714_hourly_demand_matrix(df, _out_ferc714__utc_offset)
     return df
 
@@ -30,6 +30,7 @@ And described at:
 """
 
 import functools
+import time
 import warnings
 from collections.abc import Iterable, Sequence
 from typing import Any
@@ -39,6 +40,10 @@ import numpy as np
 import pandas as pd
 import scipy.stats
 
+import pudl
+
+logger = pudl.logging_helpers.get_logger(__name__)
+
 # ---- Helpers ---- #
 
 
@@ -305,16 +310,24 @@ def _ten2mat(tensor: np.ndarray, mode: int) -> np.ndarray:
 
 
 def _svt_tnn(matrix: np.ndarray, tau: float, theta: int) -> np.ndarray:
-    """Singular value thresholding (SVT) truncated nuclear norm (TNN) minimization."""
+    """Singular value thresholding (SVT) truncated nuclear norm (TNN) minimization.
+
+    For wide matrices, the singular values and left singular vectors come from the
+    symmetric eigendecomposition of the (much smaller) ``matrix @ matrix.T``, which
+    is truncated to the singular values larger than ``tau`` before projecting
+    ``matrix`` onto them.
+    """
     [m, n] = matrix.shape
     if 2 * m < n:
-        u, s, v = np.linalg.svd(matrix @ matrix.T, full_matrices=0)
-        s = np.sqrt(s)
-        idx = np.sum(s > tau)
+        s, u = np.linalg.eigh(matrix @ matrix.T)
+        # eigenvalues are in ascending order
+        keep = np.flatnonzero(s > tau**2)[::-1]
+        s, u = np.sqrt(s[keep]), u[:, keep]
+        idx = len(s)
         mid = np.zeros(idx)
         mid[:theta] = 1
         mid[theta:idx] = (s[theta:idx] - tau) / s[theta:idx]
-        return (u[:, :idx] @ np.diag(mid)) @ (u[:, :idx].T @ matrix)
+        return (u * mid) @ (u.T @ matrix)
     if m > 2 * n:
         return _svt_tnn(matrix.T, tau, theta).T
     u, s, v = np.linalg.svd(matrix, full_matrices=0)
@@ -324,6 +337,18 @@ def _svt_tnn(matrix: np.ndarray, tau: float, theta: int) -> np.ndarray:
     return u[:, :idx] @ np.diag(vec) @ v[:idx, :]
 
 
+def _log_convergence(
+    method: str, it: int, tol: float, epsilon: float, start: float
+) -> None:
+    """Log whether an imputation converged, and how long its iterations took."""
+    elapsed = time.perf_counter() - start
+    status = "Converged" if tol < epsilon else "Stopped without converging"
+    logger.info(
+        f"{method}: {status} after {it} iterations in {elapsed:.1f}s "
+        f"({elapsed / it:.3f}s per iteration) with tolerance {tol:.2e}."
+    )
+
+
 def impute_latc_tnn(
     tensor: np.ndarray,
     lags: Sequence[int] = [1],
@@ -333,6 +358,7 @@ def impute_latc_tnn(
     theta: int = 20,
     epsilon: float = 1e-7,
     maxiter: int = 300,
+    x0: np.ndarray = None,
 ) -> np.ndarray:
     """Impute tensor values with LATC-TNN method by Chen and Sun (2020).
 
@@ -352,11 +378,16 @@ def impute_latc_tnn(
         theta:
         epsilon: Convergence criterion. A smaller number will result in more iterations.
         maxiter: Maximum number of iterations.
+        x0: Initial estimate of `tensor`, e.g. the imputed values of a similar
+            tensor, to warm start the imputation from. Missing values start from
+            `x0` (or the mean of the observed values where `x0` is null) rather than
+            the mean of the observed values. A good warm start can be given a larger
+            `rho0`, so that fewer iterations are needed.
 
     Returns:
         Tensor with missing values in `tensor` replaced by imputed values.
     """
-    rng = np.random.default_rng()
+    start = time.perf_counter()
     tensor = np.where(np.isnan(tensor), 0, tensor)
     dim = np.array(tensor.shape)
     dim_time = int(np.prod(dim) / dim[0])
@@ -368,7 +399,10 @@ def impute_latc_tnn(
     t = np.zeros(np.insert(dim, 0, len(dim)))
     z = mat.copy()
     z[pos_missing] = np.mean(mat[mat != 0])
-    a = 0.001 * rng.random(dim[0] * d).reshape([dim[0], d])
+    if x0 is not None:
+        z0 = _ten2mat(x0, mode=0)[pos_missing]
+        z[pos_missing] = np.where(np.isnan(z0), z[pos_missing], z0)
+    a = np.zeros((dim[0], d))
     it = 0
     ind = np.zeros((d, dim_time - max_lag), dtype=int)
     for i in range(d):
@@ -378,10 +412,11 @@ def impute_latc_tnn(
     rho = rho0
     while True:
         rho = min(rho * 1.05, 1e5)
+        z_ten = _mat2ten(z, shape=dim, mode=0)
         for k in range(len(dim)):
             x[k] = _mat2ten(
                 _svt_tnn(
-                    _ten2mat(_mat2ten(z, shape=dim, mode=0) - t[k] / rho, mode=k),
+                    _ten2mat(z_ten - t[k] / rho, mode=k),
                     tau=alpha[k] / rho,
                     theta=theta,
                 ),
@@ -404,16 +439,14 @@ def impute_latc_tnn(
             )[pos_missing]
         else:
             z[pos_missing] = (_ten2mat(np.mean(x + t / rho, axis=0), 0))[pos_missing]
-        t = t + rho * (
-            x - np.broadcast_to(_mat2ten(z, dim, 0), np.insert(dim, 0, len(dim)))
-        )
+        t += rho * (x - _mat2ten(z, dim, 0))
         tol = np.linalg.norm((mat_hat - last_mat), "fro") / snorm
         last_mat = mat_hat.copy()
         it += 1
-        print(f"Iteration: {it}", end="\r")
+        logger.debug(f"LATC-TNN iteration {it}: tolerance {tol:.2e}")
         if tol < epsilon or it >= maxiter:
             break
-    print(f"Iteration: {it}")
+    _log_convergence("LATC-TNN", it, tol, epsilon, start)
     return tensor_hat
 
 
@@ -461,6 +494,7 @@ def impute_latc_tubal(  # noqa: C901
     Returns:
         Tensor with missing values in `tensor` replaced by imputed values.
     """
+    start = time.perf_counter()
     rng = np.random.default_rng()
     tensor = np.where(np.isnan(tensor), 0, tensor)
     dim = np.array(tensor.shape)
@@ -522,10 +556,10 @@ def impute_latc_tubal(  # noqa: C901
             temp1 = _ten2mat(_mat2ten(z, dim, 0) - t / rho, 2)
             _, phi = np.linalg.eig(temp1 @ temp1.T)
             del temp1
-        print(f"Iteration: {it}", end="\r")
+        logger.debug(f"LATC-Tubal iteration {it}: tolerance {tol:.2e}")
         if tol < epsilon or it >= maxiter:
             break
-    print(f"Iteration: {it}")
+    _log_convergence("LATC-Tubal", it, tol, epsilon, start)
     return x
 
 
@@ -1225,6 +1259,7 @@ class Timeseries:
         periods: int = 24,
         blocks: int = 1,
         method: str = "tubal",
+        x0: np.ndarray = None,
         **kwargs: Any,
     ) -> np.ndarray:
         """Impute null values.
@@ -1242,6 +1277,8 @@ class Timeseries:
                 This has been found to reduce processing time for `method='tnn'`.
             method: Imputation method to use
                 ('tubal': :func:`impute_latc_tubal`, 'tnn': :func:`impute_latc_tnn`).
+            x0: Array of same shape as :attr:`x` with initial estimates of the values
+                to impute, to warm start `method='tnn'`. See :func:`impute_latc_tnn`.
             kwargs: Optional arguments to `method`.
 
         Returns:
@@ -1256,12 +1293,16 @@ class Timeseries:
         if (x == 0).any():
             raise ValueError("Zero values present. Replace with very small value.")
         tensor = self.fold_tensor(x, periods=periods)
+        if x0 is not None:
+            x0 = self.fold_tensor(x0, periods=periods)
         n = tensor.shape[1]
         ends = [*range(0, n, int(np.ceil(n / blocks))), n]
         for i in range(blocks):
             if blocks > 1:
-                print(f"Block: {i}")
+                logger.info(f"Imputing block {i}")
             idx = slice(None), slice(ends[i], ends[i + 1]), slice(None)
+            if x0 is not None:
+                kwargs["x0"] = x0[idx]
             tensor[idx] = imputer(tensor[idx], **kwargs)
         return self.unfold_tensor(tensor)
 
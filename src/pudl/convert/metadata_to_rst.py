@@ -81,7 +81,11 @@ def metadata_to_rst(
 
     logger.info(f"Exporting PUDL metadata to: {output}")
     resource_ids = [rid for rid in sorted(RESOURCE_METADATA) if rid not in skip]
-    package = Package.from_resource_ids(resource_ids=tuple(sorted(resource_ids)))
+    # The Resources are cached and shared with the rest of PUDL, so sort the fields of
+    # copies of them for rendering.
+    package = Package.from_resource_ids(
+        resource_ids=tuple(sorted(resource_ids))
+    ).model_copy(deep=True)
     # Sort fields within each resource by name:
     for resource in package.resources:
         resource.schema.fields = sorted(resource.schema.fields, key=lambda x: x.name)
@@ -138,7 +138,7 @@ def asset_check_from_schema(
         resource = package.get_resource(resource_id)
     except ValueError:
         return None
-    pandera_schema = resource.schema.to_pandera()
+    pandera_schema = resource.to_pandera()
 
     @asset_check(asset=asset_key, blocking=True)
     def pandera_schema_check(asset_value) -> AssetCheckResult:
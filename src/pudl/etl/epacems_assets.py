@@ -10,11 +10,14 @@ see: https://docs.dagster.io/concepts/ops-jobs-graphs/dynamic-graphs and https:/
 """
 
 from collections import namedtuple
+from collections.abc import Iterator
 from pathlib import Path
 
 import dask.dataframe as dd
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 from dagster import (
     AssetIn,
@@ -63,10 +66,7 @@ def get_years_from_settings(context):
         yield DynamicOutput(year, mapping_key=str(year))
 
 
-@op(
-    required_resource_keys={"datastore", "dataset_settings"},
-    tags={"memory-use": "high"},
-)
+@op(required_resource_keys={"datastore", "dataset_settings"})
 def process_single_year(
     context,
     year,
@@ -96,29 +96,66 @@ def process_single_year(
 
     for year_quarter in year_quarters_in_year:
         logger.info(f"Processing EPA CEMS hourly data for {year_quarter}")
-        df = pudl.extract.epacems.extract(year_quarter=year_quarter, ds=ds)
-        if not df.empty:  # If state-year combination has data
-            df = pudl.transform.epacems.transform(
-                df, core_epa__assn_eia_epacamd, core_eia__entity_plants
-            )
-        table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
-
-        # Write to a directory of partitioned parquet files
+        # Stream the quarter through the transform in batches, writing each one as a
+        # row group, so the whole quarter never has to be held in memory at once.
+        batches = pudl.extract.epacems.extract_batches(year_quarter=year_quarter, ds=ds)
         with pq.ParquetWriter(
             where=partitioned_path / f"epacems-{year_quarter}.parquet",
             schema=schema,
             compression="snappy",
             version="2.6",
         ) as partitioned_writer:
-            partitioned_writer.write_table(table)
+            for df in pudl.transform.epacems.transform_batches(
+                batches, core_epa__assn_eia_epacamd, core_eia__entity_plants
+            ):
+                partitioned_writer.write_table(
+                    pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+                )
 
     return YearPartitions(year_quarters_in_year)
 
 
+def split_quarter_by_state(path: Path, schema: pa.Schema) -> Iterator[pa.Table]:
+    """Read a quarter of partitioned EPA CEMS data once and split it up by state.
+
+    The row numbers belonging to each state are gathered in one pass with a hash group
+    by, and the rows for one state at a time are taken from the quarter's data, so at
+    most one quarter and one quarter-state are held in memory. Rows whose state isn't
+    one of :data:`pudl.metadata.enums.EPACEMS_STATES` (e.g. nulls) are dropped.
+
+    Args:
+        path: The quarterly parquet file.
+        schema: The schema of the EPA CEMS hourly emissions table.
+
+    Yields:
+        One table per state with data in the quarter, sorted by state. The rows for
+        each state are in the order of the quarterly file.
+    """
+    quarter_table = pq.read_table(source=path, schema=schema)
+    # Dictionaries differ between the quarterly files, so group on the plain strings.
+    rows_by_state = (
+        pa.table(
+            {
+                "state": pc.cast(quarter_table["state"], pa.string()),
+                "row": np.arange(quarter_table.num_rows),
+            }
+        )
+        .group_by("state", use_threads=False)
+        .aggregate([("row", "list")])
+        .filter(pc.field("state").isin(sorted(EPACEMS_STATES)))
+        .sort_by("state")
+    )
+    for rows in rows_by_state["row_list"]:
+        yield quarter_table.take(rows.values)
+
+
 @op
 def consolidate_partitions(context, partitions: list[YearPartitions]) -> None:
     """Read partitions into memory and write to a single monolithic output.
 
+    Every quarterly file is only read once, and is written out as one row group for
+    each quarter-state combination, so only one quarter has to fit in memory at a time.
+
     Args:
         context: dagster keyword that provides access to resources and config.
         partitions: Year and state combinations in the output database.
@@ -133,22 +170,11 @@ def consolidate_partitions(context, partitions: list[YearPartitions]) -> None:
         where=monolithic_path, schema=schema, compression="snappy", version="2.6"
     ) as monolithic_writer:
         for year_partition in partitions:
-            for state in EPACEMS_STATES:
-                monolithic_writer.write_table(
-                    # Concat a slice of each state's data from all quarters in a year
-                    # and write to parquet to create year-state row groups
-                    pa.concat_tables(
-                        [
-                            pq.read_table(
-                                source=partitioned_path
-                                / f"epacems-{year_quarter}.parquet",
-                                filters=[[("state", "=", state.upper())]],
-                                schema=schema,
-                            )
-                            for year_quarter in year_partition.year_quarters
-                        ]
-                    )
-                )
+            for year_quarter in sorted(year_partition.year_quarters):
+                for state_table in split_quarter_by_state(
+                    partitioned_path / f"epacems-{year_quarter}.parquet", schema
+                ):
+                    monolithic_writer.write_table(state_table)
 
 
 @graph_asset
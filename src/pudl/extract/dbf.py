@@ -1,16 +1,20 @@
 """Generalized DBF extractor for FERC data."""
 
+import codecs
 import contextlib
 import csv
 import importlib.resources
+import itertools
 import warnings
 import zipfile
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from functools import lru_cache
 from pathlib import Path
 from typing import IO, Any, Protocol, Self
 
+import numpy as np
 import pandas as pd
 import sqlalchemy as sa
 from dagster import op
@@ -185,7 +189,7 @@ class FercDbfArchive:
             table_name: name of the table.
         """
         sch = self.get_table_schema(table_name)
-        df = pd.DataFrame(iter(self.get_table_dbf(table_name)))
+        df = read_dbf_columns(self.get_table_dbf(table_name))
         df = df.drop("_NullFlags", axis=1, errors="ignore").rename(
             sch.get_column_rename_map(), axis=1
         )
@@ -247,6 +251,127 @@ class FercFieldParser(FieldParser):
         return super().parseN(field, data)
 
 
+def _decode_ferc_numeric(data: np.ndarray) -> np.ndarray:
+    """Decode numeric fields the way :meth:`FercFieldParser.parseN` does.
+
+    Args:
+        data: raw bytes of the field in each record.
+
+    Returns:
+        Integers if all of the fields hold integers, otherwise floats with NaN for
+        empty fields, or None for all of them if they are all empty.
+    """
+    data = np.strings.lstrip(np.strings.strip(np.strings.strip(data), b"\x00*"), b"0")
+    data = np.where(data == b".", b"0", data)
+    data = np.strings.strip(np.strings.strip(data), b"\x00*")
+    is_null = data == b""
+    if is_null.all():
+        return np.full(len(data), None, dtype=object)
+    is_int = np.strings.isdigit(np.strings.lstrip(data, b"+-"))
+    if is_int.all():
+        return data.astype(np.int64)
+    values = np.full(len(data), np.nan)
+    values[is_int] = data[is_int].astype(np.int64)
+    is_float = ~is_int & ~is_null
+    try:
+        values[is_float] = data[is_float].astype(float)
+    except ValueError:
+        # Some files use commas as decimal separators.
+        values[is_float] = np.strings.replace(data[is_float], b",", b".").astype(float)
+    return values
+
+
+def _decode_latin1(data: np.ndarray) -> np.ndarray:
+    """Decode latin-1 character fields the way :meth:`FieldParser.parseC` does.
+
+    Each latin-1 byte is the code point of its character, so the bytes are widened
+    into a unicode array all at once rather than decoded one field at a time.
+    """
+    length = data.dtype.itemsize
+    chars = np.ascontiguousarray(data).view(np.uint8).reshape(-1, length)
+    text = chars.astype(np.uint32).view(f"U{length}").ravel()
+    return np.strings.rstrip(text, "\x00 ").astype(object)
+
+
+_COLUMN_DECODERS: dict[Callable, Callable[[np.ndarray], np.ndarray]] = {
+    FercFieldParser.parseN: _decode_ferc_numeric,
+    FieldParser.parseC: _decode_latin1,
+}
+"""Vectorized decoders of DBF columns, keyed by the field parser method they mimic."""
+
+
+def read_dbf_columns(dbf: DBF) -> pd.DataFrame:
+    """Read the records of a DBF table into a dataframe one column at a time.
+
+    Iterating over a :class:`dbfread.DBF` builds a dict for every record and parses
+    every field in Python. Instead, the fixed-width records are read into a NumPy
+    structured array. Numeric fields parsed by :class:`FercFieldParser` and latin-1
+    character fields are decoded with vectorized string operations, and all other
+    fields are parsed by the table's field parser once per distinct value. The
+    result is the same as ``pd.DataFrame(iter(dbf))``, which is used directly for
+    tables with memo files, raw tables and records that don't match their fields.
+
+    Args:
+        dbf: the DBF table to read.
+
+    Returns:
+        A dataframe with a column for each field and a row for each record that
+        has not been deleted.
+    """
+    record_length = dbf.header.recordlen
+    lengths = [field.length for field in dbf.fields]
+    if (
+        dbf.raw
+        or getattr(dbf, "memofilename", None) is not None
+        or 1 + sum(lengths) != record_length
+    ):
+        return pd.DataFrame(iter(dbf))
+    with dbf.dbf_bytes() as infile:
+        infile.seek(dbf.header.headerlen)
+        block = infile.read()
+    records = np.frombuffer(
+        block,
+        dtype=np.dtype(
+            {
+                "names": ["flag"] + [f"field{i}" for i in range(len(lengths))],
+                "formats": ["S1"] + [f"S{length}" for length in lengths],
+                "offsets": np.cumsum([0, 1] + lengths[:-1]).tolist(),
+                "itemsize": record_length,
+            }
+        ),
+        count=len(block) // record_length,
+    )
+    # Records end at the end of file marker, and deleted ones are flagged with a *.
+    (eof,) = np.nonzero(records["flag"] == b"\x1a")
+    records = records[: eof[0] if len(eof) else len(records)]
+    records = records[records["flag"] == b" "]
+    if not len(records):
+        return pd.DataFrame()
+
+    parser = dbf.parserclass(dbf)
+    is_latin1 = codecs.lookup(dbf.encoding).name == "iso8859-1"
+    columns = {}
+    for i, field in enumerate(dbf.fields):
+        data = records[f"field{i}"]
+        decoder = _COLUMN_DECODERS.get(
+            getattr(type(parser), f"parse{field.type}", None)
+        )
+        if decoder is _decode_latin1 and not is_latin1:
+            decoder = None
+        if decoder is not None:
+            columns[field.name] = decoder(data)
+            continue
+        # NumPy drops trailing null bytes, which the parser needs to see.
+        uniques, inverse = np.unique(data, return_inverse=True)
+        values = np.empty(len(uniques), dtype=object)
+        values[:] = [
+            parser.parse(field, bytes(value).ljust(field.length, b"\x00"))
+            for value in uniques
+        ]
+        columns[field.name] = values[inverse].tolist()
+    return pd.DataFrame(columns)
+
+
 DBF_TYPES = {
     "C": sa.String,
     "D": sa.Date,
@@ -396,6 +521,23 @@ class FercDbfReader:
         return dfs
 
 
+_worker_dbf_reader: AbstractFercDbfReader | None = None
+"""The DBF reader of a worker process that loads tables in parallel."""
+
+
+def _set_worker_dbf_reader(dbf_reader: AbstractFercDbfReader) -> None:
+    """Keep the DBF reader in a worker process, so its open archives are reused."""
+    global _worker_dbf_reader
+    _worker_dbf_reader = dbf_reader
+
+
+def _load_worker_table_dfs(
+    table_name: str, partition: dict[str, Any]
+) -> list[PartitionedDataFrame]:
+    """Load a table from a single partition with the worker process' DBF reader."""
+    return _worker_dbf_reader.load_table_dfs(table_name, [partition])
+
+
 class FercDbfExtractor:
     """Generalized class for loading data from foxpro databases into SQLAlchemy.
 
@@ -432,6 +574,7 @@ class FercDbfExtractor:
         datastore: Datastore,
         settings: FercToSqliteSettings,
         output_path: Path,
+        workers: int = 1,
     ):
         """Constructs new instance of FercDbfExtractor.
 
@@ -439,12 +582,19 @@ class FercDbfExtractor:
             datastore: top-level datastore instance for accessing raw data files.
             settings: generic settings object for this extrctor.
             output_path: directory where the output databases should be stored.
+            workers: number of processes to load tables from the partitions with. If
+                1, everything is loaded serially in the current process.
         """
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}.")
+        self.workers = workers
         self.settings: GenericDatasetSettings = self.get_settings(settings)
         self.output_path = output_path
         self.datastore = datastore
         self.dbf_reader = self.get_dbf_reader(datastore)
-        self.sqlite_engine = sa.create_engine(self.get_db_path())
+        self.sqlite_engine = pudl.helpers.set_sqlite_pragmas(
+            sa.create_engine(self.get_db_path())
+        )
         self.sqlite_meta = sa.MetaData()
         self.sqlite_meta.reflect(self.sqlite_engine)
 
@@ -484,6 +634,7 @@ class FercDbfExtractor:
                 datastore=context.resources.datastore,
                 settings=context.resources.ferc_to_sqlite_settings,
                 output_path=PudlPaths().output_dir,
+                workers=context.resources.runtime_settings.dbf_num_workers,
             )
             dbf_extractor.execute()
 
@@ -508,7 +659,9 @@ class FercDbfExtractor:
         with contextlib.suppress(sa.exc.OperationalError):
             pudl.helpers.drop_tables(self.sqlite_engine, clobber=True)
 
-        self.sqlite_engine = sa.create_engine(self.get_db_path())
+        self.sqlite_engine = pudl.helpers.set_sqlite_pragmas(
+            sa.create_engine(self.get_db_path())
+        )
         self.sqlite_meta = sa.MetaData()
         self.sqlite_meta.reflect(self.sqlite_engine)
 
@@ -575,11 +728,8 @@ class FercDbfExtractor:
         logger.info(
             f"Loading {self.DATASET} table data from {len(partitions)} partitions."
         )
-        for table in self.dbf_reader.get_table_names():
-            logger.info(f"Pandas: reading {table} into a DataFrame.")
-            new_df = self.aggregate_table_frames(
-                table, self.dbf_reader.load_table_dfs(table, partitions)
-            )
+        for table, dfs in self.iter_table_dfs(partitions):
+            new_df = self.aggregate_table_frames(table, dfs)
             if new_df is None or len(new_df) <= 0:
                 logger.warning(f"Table {table} contains no data, skipping.")
                 continue
@@ -589,16 +739,57 @@ class FercDbfExtractor:
             if len(new_df) <= 0:
                 continue
 
-            coltypes = {col.name: col.type for col in self.sqlite_meta.tables[table].c}
             logger.info(f"SQLite: loading {len(new_df)} rows into {table}.")
-            new_df.to_sql(
-                table,
-                self.sqlite_engine,
-                if_exists="append",
-                chunksize=100000,
-                dtype=coltypes,
-                index=False,
-            )
+            with self.sqlite_engine.begin() as con:
+                pudl.helpers.bulk_load_sqlite(
+                    new_df, self.sqlite_meta.tables[table], con
+                )
+
+    def iter_table_dfs(
+        self, partitions: list[dict[str, Any]]
+    ) -> Iterator[tuple[str, list[PartitionedDataFrame]]]:
+        """Loads the frames of each table from all of the partitions.
+
+        With more than one worker, each table is loaded from each partition in a pool
+        of processes, while the tables that have been loaded are aggregated and written
+        to sqlite in this process. To bound memory use, only twice as many table
+        partitions as there are workers are loaded ahead of the table being written.
+
+        Args:
+            partitions: partition filters of the archives to load the tables from.
+
+        Yields:
+            The name of each table, in order, and its frames in order of partitions.
+        """
+        table_names = self.dbf_reader.get_table_names()
+        if self.workers == 1:
+            for table in table_names:
+                logger.info(f"Pandas: reading {table} into a DataFrame.")
+                yield table, self.dbf_reader.load_table_dfs(table, partitions)
+            return
+
+        tasks = ((table, p) for table in table_names for p in partitions)
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_set_worker_dbf_reader,
+            initargs=(self.dbf_reader,),
+        ) as executor:
+            pending = deque()
+
+            def submit(n_tasks: int) -> None:
+                for table, p in itertools.islice(tasks, n_tasks):
+                    pending.append(
+                        (table, executor.submit(_load_worker_table_dfs, table, p))
+                    )
+
+            submit(2 * self.workers)
+            for table in table_names:
+                dfs = []
+                while pending and pending[0][0] == table:
+                    dfs.extend(pending.popleft()[1].result())
+                    submit(1)
+                logger.info(f"Pandas: read {table} from {len(dfs)} partitions.")
+                yield table, dfs
 
     def finalize_schema(self, meta: sa.MetaData) -> sa.MetaData:
         """This method is called just before the schema is written to sqlite.
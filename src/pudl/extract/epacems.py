@@ -20,10 +20,15 @@ Hence, we've called it `plant_id_epa` until it gets transformed into `plant_id_e
 during the transform process with help from the crosswalk.
 """
 
+import csv
+import io
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import Annotated
+from typing import IO, Annotated
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
 from pydantic import BaseModel, StringConstraints
 
 import pudl.logging_helpers
@@ -174,69 +179,147 @@ class EpaCemsDatastore:
 
     def get_data_frame(self, partition: EpaCemsPartition) -> pd.DataFrame:
         """Constructs dataframe from a zipfile for a given (year_quarter) partition."""
-        with (
-            self.datastore.get_zipfile_resource(
-                "epacems", **partition.get_filters()
-            ) as zf,
-            zf.open(str(partition.get_quarterly_file()), "r") as csv_file,
-        ):
-            df = self._csv_to_dataframe(
-                csv_file,
-                ignore_cols=API_IGNORE_COLS,
-                rename_dict=API_RENAME_DICT,
-                dtype_dict=API_DTYPE_DICT,
-            )
-        return df
-
-    def _csv_to_dataframe(
+        return _concat_batches(self.iter_data_frames(partition))
+
+    def iter_data_frames(
+        self, partition: EpaCemsPartition, block_size: int = 2**26
+    ) -> Iterator[pd.DataFrame]:
+        """Yields dataframes for consecutive batches of rows of a (year_quarter) partition.
+
+        The CSV is read incrementally with :func:`pyarrow.csv.open_csv`, so only one
+        batch of roughly ``block_size`` bytes of CSV has to be held in memory at a time.
+
+        Args:
+            partition: the year_quarter to read.
+            block_size: the number of bytes of CSV to parse into each batch.
+        """
+        with self.datastore.get_zipfile_resource(
+            "epacems", **partition.get_filters()
+        ) as zf:
+            csv_name = str(partition.get_quarterly_file())
+            with zf.open(csv_name, "r") as csv_file:
+                header = _read_header(csv_file)
+            with zf.open(csv_name, "r") as csv_file:
+                yield from self._csv_to_dataframes(
+                    csv_file,
+                    header=header,
+                    ignore_cols=API_IGNORE_COLS,
+                    rename_dict=API_RENAME_DICT,
+                    dtype_dict=API_DTYPE_DICT,
+                    block_size=block_size,
+                )
+
+    def _csv_to_dataframes(
         self,
-        csv_path: Path,
-        ignore_cols: dict[str, str],
+        csv_file: IO[bytes],
+        header: list[str],
+        ignore_cols: set[str],
         rename_dict: dict[str, str],
         dtype_dict: dict[str, type],
-        chunksize: int = 100_000,
-    ) -> pd.DataFrame:
-        """Convert a CEMS csv file into a :class:`pandas.DataFrame`.
+        block_size: int,
+    ) -> Iterator[pd.DataFrame]:
+        """Convert a CEMS csv file into a series of :class:`pandas.DataFrame` batches.
 
         Args:
-            csv_path: Path to CSV file containing data to read.
+            csv_file: CSV file containing data to read.
+            header: the column names in the CSV file.
 
-        Returns:
-            A DataFrame containing the filtered and dtyped contents of the CSV file.
+        Yields:
+            DataFrames containing the filtered and dtyped contents of the CSV file.
         """
-        chunk_iter = pd.read_csv(
-            csv_path,
-            index_col=False,
-            usecols=lambda col: col not in ignore_cols,
-            dtype=dtype_dict,
-            chunksize=chunksize,
-            low_memory=True,
-            parse_dates=["Date"],
+        columns = [col for col in header if col not in ignore_cols]
+        dtypes = {k: v for k, v in dtype_dict.items() if k in columns}
+        reader = pv.open_csv(
+            csv_file,
+            read_options=pv.ReadOptions(block_size=block_size),
+            convert_options=pv.ConvertOptions(
+                include_columns=columns,
+                column_types={col: _arrow_type(dtype) for col, dtype in dtypes.items()},
+                strings_can_be_null=True,
+            ),
         )
-        df = pd.concat(chunk_iter)
-        dtypes = {k: v for k, v in dtype_dict.items() if k in df.columns}
-        return df.astype(dtypes).rename(columns=rename_dict)
+        for batch in reader:
+            yield batch.to_pandas().astype(dtypes).rename(columns=rename_dict)
 
 
-def extract(year_quarter: str, ds: Datastore) -> pd.DataFrame:
-    """Coordinate the extraction of EPA CEMS hourly DataFrames.
+def _read_header(csv_file: IO[bytes]) -> list[str]:
+    """Read the column names from the first line of a CSV file."""
+    line = io.TextIOWrapper(csv_file, encoding="utf-8-sig").readline()
+    return next(csv.reader([line]))
+
+
+def _arrow_type(dtype) -> pa.DataType:
+    """The Arrow type to parse a CSV column into before converting it to dtype."""
+    if isinstance(dtype, pd.CategoricalDtype | pd.StringDtype):
+        return pa.string()
+    return pa.from_numpy_dtype(dtype.numpy_dtype)
+
+
+def extract_batches(
+    year_quarter: str, ds: Datastore, block_size: int = 2**26
+) -> Iterator[pd.DataFrame]:
+    """Extract EPA CEMS hourly data for a quarter in batches of rows.
 
     Args:
         year_quarter: report year and quarter of the data to extract
         ds: Initialized datastore
+        block_size: the number of bytes of CSV to read into each batch.
+
     Yields:
-        A single quarter of EPA CEMS hourly emissions data.
+        Consecutive batches of rows from a single quarter of EPA CEMS hourly emissions
+        data. Nothing is yielded if the quarter isn't found.
     """
     ds = EpaCemsDatastore(ds)
     partition = EpaCemsPartition(year_quarter=year_quarter)
     year = partition.year
-    # We have to assign the reporting year for partitioning purposes
+    logger.info(f"Extracting data frames for {year_quarter}")
+    batches = ds.iter_data_frames(partition, block_size=block_size)
     try:
-        logger.info(f"Extracting data frame for {year_quarter}")
-        df = ds.get_data_frame(partition).assign(year=year)
-    # If the requested quarter is not found, return an empty df with expected columns:
+        first = next(batches, None)
     except KeyError:
-        logger.warning(f"No data found for {year_quarter}. Returning empty dataframe.")
+        logger.warning(f"No data found for {year_quarter}.")
+        return
+    if first is None:
+        return
+    # We have to assign the reporting year for partitioning purposes
+    yield first.assign(year=year)
+    for batch in batches:
+        yield batch.assign(year=year)
+
+
+def extract(year_quarter: str, ds: Datastore) -> pd.DataFrame:
+    """Coordinate the extraction of EPA CEMS hourly DataFrames.
+
+    Args:
+        year_quarter: report year and quarter of the data to extract
+        ds: Initialized datastore
+    Yields:
+        A single quarter of EPA CEMS hourly emissions data.
+    """
+    batches = list(extract_batches(year_quarter=year_quarter, ds=ds))
+    # If the requested quarter is not found, return an empty df with expected columns:
+    if not batches:
+        logger.warning(f"Returning empty dataframe for {year_quarter}.")
         res = Resource.from_id("core_epacems__hourly_emissions")
-        df = res.format_df(pd.DataFrame())
-    return df
+        return res.format_df(pd.DataFrame())
+    return _concat_batches(batches)
+
+
+def _concat_batches(dfs: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate batches of rows, unifying the categories of categorical columns.
+
+    Each batch only knows about the categories that appear within it, so categorical
+    columns fall back to objects when the batches are concatenated and have to be
+    converted back.
+    """
+    dfs = list(dfs)
+    if not dfs:
+        return pd.DataFrame()
+    categoricals = [
+        col
+        for col in dfs[0].columns
+        if isinstance(dfs[0][col].dtype, pd.CategoricalDtype)
+    ]
+    return pd.concat(dfs, ignore_index=True).astype(
+        {col: "category" for col in categoricals}
+    )
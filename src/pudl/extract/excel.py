@@ -2,10 +2,14 @@
 
 import pathlib
 import re
+import sys
+from collections import OrderedDict
+from datetime import date, time, timedelta
 from io import BytesIO
 
 import dbfread
 import pandas as pd
+from pandas.io.parsers import TextParser
 
 import pudl
 from pudl.extract.extractor import GenericExtractor, GenericMetadata, PartitionSelection
@@ -127,15 +131,25 @@ class ExcelExtractor(GenericExtractor):
 
     METADATA: ExcelMetadata = None
 
-    def __init__(self, ds):
+    MAX_SHEET_CACHE_BYTES: int = 2**30
+    """Approximate cap on the memory used by parsed sheets cached by the extractor.
+
+    Sheets of a workbook are parsed together the first time any page of a partition is
+    read from it, and are kept until the partition is finished or until the least
+    recently used sheets have to be evicted to stay under this cap.
+    """
+
+    def __init__(self, ds, max_workers: int = 1):
         """Create new extractor object and load metadata.
 
         Args:
             ds (datastore.Datastore): An initialized datastore, or subclass
+            max_workers: number of processes to extract pages and partitions with.
         """
-        super().__init__(ds)
+        super().__init__(ds, max_workers=max_workers)
         self._metadata = self.METADATA
-        self._file_cache = {}
+        self._sheet_cache: OrderedDict[tuple, tuple[list[list], int]] = OrderedDict()
+        self._sheet_cache_bytes = 0
 
     def process_raw(
         self, df: pd.DataFrame, page: str, **partition: PartitionSelection
@@ -209,39 +223,102 @@ class ExcelExtractor(GenericExtractor):
         Returns:
             pd.DataFrame instance with the parsed Excel spreadsheet frame
         """
-        xlsx_filename = self.source_filename(page, **partition)
-
-        if xlsx_filename not in self._file_cache:
-            excel_file = None
-            with self.ds.get_zipfile_resource(
-                self._dataset_name,
-                **self.zipfile_resource_partitions(page, **partition),
-            ) as zf:
-                # If loading the excel file from the zip fails then try to open a dbf file.
-                extension = pathlib.Path(xlsx_filename).suffix.lower()
-                if extension == ".dbf":
-                    with zf.open(xlsx_filename) as dbf_filepath:
-                        df = pd.DataFrame(
-                            iter(dbfread.DBF(xlsx_filename, filedata=dbf_filepath))
-                        )
-                        excel_file = pudl.helpers.convert_df_to_excel_file(
-                            df, index=False
-                        )
-                else:
-                    excel_file = pd.ExcelFile(
-                        BytesIO(zf.read(xlsx_filename)), engine="calamine"
-                    )
-            self._file_cache[xlsx_filename] = excel_file
-        # TODO(rousik): this _file_cache could be replaced with @cache or @memoize annotations
-        excel_file = self._file_cache[xlsx_filename]
-
-        return pd.read_excel(
-            excel_file,
-            sheet_name=self._metadata.get_sheet_name(page, **partition),
+        data = self._get_sheet_data(page, **partition)
+        if not data:
+            return pd.DataFrame()
+        # This is what pd.read_excel() does with the cells of a sheet, so the result is
+        # the same as reading the sheet directly, without parsing the workbook again.
+        return TextParser(
+            data,
+            header=0,
+            dtype=self.get_dtypes(page, **partition),
             skiprows=self._metadata.get_skiprows(page, **partition),
             skipfooter=self._metadata.get_skipfooter(page, **partition),
-            dtype=self.get_dtypes(page, **partition),
+            skip_blank_lines=False,
+        ).read()
+
+    def release_partition(self, **partition: PartitionSelection) -> None:
+        """Drop the cached sheets of all workbooks read for a partition."""
+        partition_key = self._partition_key(partition)
+        for key in [key for key in self._sheet_cache if key[0] == partition_key]:
+            self._evict(key)
+
+    def source_key(self, page: str, **partition: PartitionSelection) -> tuple:
+        """Identify the workbook a page is read from by its archive and file name."""
+        return (
+            self._partition_key(self.zipfile_resource_partitions(page, **partition)),
+            self.source_filename(page, **partition),
+        )
+
+    @staticmethod
+    def _partition_key(partition: dict[str, PartitionSelection]) -> tuple:
+        return tuple(sorted((k, str(v)) for k, v in partition.items()))
+
+    def _get_sheet_data(self, page: str, **partition: PartitionSelection) -> list[list]:
+        """Return the cells of the sheet holding a page, parsing its workbook if needed.
+
+        The first time a page is read from a workbook, all of the sheets that any page
+        of the same partition needs from that workbook are parsed in one pass.
+        """
+        workbook = self.source_key(page, **partition)
+        key = (
+            self._partition_key(partition),
+            workbook,
+            self._metadata.get_sheet_name(page, **partition),
         )
+        if key not in self._sheet_cache:
+            sheet_names = {
+                self._metadata.get_sheet_name(other, **partition)
+                for other in self._metadata.get_all_pages()
+                if other not in self.BLACKLISTED_PAGES
+                and self.source_key(other, **partition) == workbook
+            }
+            excel_file = self._load_workbook(page, **partition)
+            # The requested sheet goes in last, so that it is never the one evicted.
+            sheet_names.discard(key[2])
+            for sheet_name in [*sheet_names, key[2]]:
+                self._cache_sheet(
+                    key[:2] + (sheet_name,), _read_sheet(excel_file, sheet_name)
+                )
+            excel_file.close()
+        self._sheet_cache.move_to_end(key)
+        return self._sheet_cache[key][0]
+
+    def _cache_sheet(self, key: tuple, data: list[list]) -> None:
+        if key in self._sheet_cache:
+            self._evict(key)
+        nbytes = _sheet_nbytes(data)
+        self._sheet_cache[key] = (data, nbytes)
+        self._sheet_cache_bytes += nbytes
+        # Evict the least recently used sheets, but always keep the newest one.
+        while (
+            self._sheet_cache_bytes > self.MAX_SHEET_CACHE_BYTES
+            and len(self._sheet_cache) > 1
+        ):
+            self._evict(next(iter(self._sheet_cache)))
+
+    def _evict(self, key: tuple) -> None:
+        _, nbytes = self._sheet_cache.pop(key)
+        self._sheet_cache_bytes -= nbytes
+
+    def _load_workbook(
+        self, page: str, **partition: PartitionSelection
+    ) -> pd.ExcelFile:
+        """Open the workbook holding a page with the calamine engine."""
+        xlsx_filename = self.source_filename(page, **partition)
+        with self.ds.get_zipfile_resource(
+            self._dataset_name,
+            **self.zipfile_resource_partitions(page, **partition),
+        ) as zf:
+            # If loading the excel file from the zip fails then try to open a dbf file.
+            extension = pathlib.Path(xlsx_filename).suffix.lower()
+            if extension == ".dbf":
+                with zf.open(xlsx_filename) as dbf_filepath:
+                    df = pd.DataFrame(
+                        iter(dbfread.DBF(xlsx_filename, filedata=dbf_filepath))
+                    )
+                    return pudl.helpers.convert_df_to_excel_file(df, index=False)
+            return pd.ExcelFile(BytesIO(zf.read(xlsx_filename)), engine="calamine")
 
     def source_filename(self, page: str, **partition: PartitionSelection) -> str:
         """Produce the xlsx document file name as it will appear in the archive.
@@ -257,3 +334,41 @@ class ExcelExtractor(GenericExtractor):
             string name of the xlsx file
         """
         return self._metadata.get_file_name(page, **partition)
+
+
+def _convert_cell(value):
+    """Convert a calamine cell value the same way pandas' calamine reader does."""
+    if isinstance(value, float):
+        val = int(value)
+        return val if val == value else value
+    if isinstance(value, date):
+        return pd.Timestamp(value)
+    if isinstance(value, timedelta):
+        return pd.Timedelta(value)
+    if isinstance(value, time):
+        return value
+    return value
+
+
+def _read_sheet(excel_file: pd.ExcelFile, sheet_name: str | int) -> list[list]:
+    """Read the cells of one sheet of a workbook opened with the calamine engine.
+
+    Like :func:`pandas.read_excel`, a string is taken to be the name of the sheet and
+    anything else its position in the workbook.
+    """
+    book = excel_file.book
+    if isinstance(sheet_name, str):
+        sheet = book.get_sheet_by_name(sheet_name)
+    else:
+        sheet = book.get_sheet_by_index(int(sheet_name))
+    return [
+        [_convert_cell(cell) for cell in row]
+        for row in sheet.to_python(skip_empty_area=False)
+    ]
+
+
+def _sheet_nbytes(data: list[list]) -> int:
+    """Estimate the memory used by the cells of a sheet."""
+    return sys.getsizeof(data) + sum(
+        sys.getsizeof(row) + sum(sys.getsizeof(cell) for cell in row) for row in data
+    )
@@ -1,8 +1,11 @@
 """Generic functionality for extractors."""
 
 import importlib.resources
+import time
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from collections.abc import Hashable
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
 import pandas as pd
@@ -11,6 +14,7 @@ from dagster import (
     DagsterType,
     DynamicOut,
     DynamicOutput,
+    Field,
     In,
     OpDefinition,
     TypeCheckContext,
@@ -116,17 +120,22 @@ class GenericExtractor(ABC):
     BLACKLISTED_PAGES = []
     """List of supported pages that should not be extracted."""
 
-    def __init__(self, ds):
+    def __init__(self, ds, max_workers: int = 1):
         """Create new extractor object and load metadata.
 
         Args:
             ds (datastore.Datastore): An initialized datastore, or subclass
+            max_workers: number of processes to extract pages and partitions with. If
+                1, everything is extracted serially in the current process.
         """
         if not self.METADATA:
             raise NotImplementedError("self.METADATA must be set.")
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}.")
         self._metadata = self.METADATA
         self._dataset_name = self._metadata.get_dataset_name()
         self.ds = ds
+        self.max_workers = max_workers
         self.cols_added: list[str] = []
 
     @abstractmethod
@@ -241,30 +250,119 @@ class GenericExtractor(ABC):
             return all_page_dfs
         logger.info(f"Extracting {self._dataset_name} spreadsheet data.")
 
+        pages = []
         for page in self._metadata.get_all_pages():
             if page in self.BLACKLISTED_PAGES:
                 logger.debug(f"Skipping blacklisted page {page}.")
                 continue
-            current_page_dfs = [
-                pd.DataFrame(),
-            ]
-            for partition in pudl.helpers.iterate_multivalue_dict(**partitions):
+            pages.append(page)
+        # The pages that come from the same source file of a partition are extracted
+        # as a unit, so that extractors can share work (e.g. parsing a workbook)
+        # between them.
+        tasks = self._extraction_tasks(
+            pages, list(pudl.helpers.iterate_multivalue_dict(**partitions))
+        )
+        if self.max_workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                # map() returns results in the order of the tasks, so the pages are
+                # concatenated the same way regardless of which worker finishes first.
+                results = list(
+                    executor.map(
+                        self._extract_pages,
+                        [task_pages for task_pages, _ in tasks],
+                        [partition for _, partition in tasks],
+                    )
+                )
+        else:
+            results = [self._extract_pages(*task) for task in tasks]
+
+        page_dfs = {page: [pd.DataFrame()] for page in pages}
+        page_seconds = dict.fromkeys(pages, 0.0)
+        for result in results:
+            for page, (df, seconds) in result.items():
+                page_dfs[page].append(df)
+                page_seconds[page] += seconds
+        for page in pages:
+            logger.info(
+                f"Extracted {self._dataset_name} {page} from {len(page_dfs[page]) - 1} "
+                f"partitions in {page_seconds[page]:.1f}s."
+            )
+            all_page_dfs[page] = self.combine(page_dfs.pop(page), page)
+        return all_page_dfs
+
+    def release_partition(self, **partition: PartitionSelection) -> None:  # noqa: B027
+        """Release anything held on to while extracting the pages of a partition.
+
+        This is called each time the pages of a partition that share a source file (see
+        :meth:`source_key`) have been extracted. Extractors that cache source files
+        should override it to drop them.
+        """
+
+    def source_key(self, page: str, **partition: PartitionSelection) -> Hashable:
+        """Identify the source file that a page of a partition is read from.
+
+        Pages of a partition with the same key are extracted together, so that they can
+        share the work of loading their source. By default, this is the
+        :meth:`source_filename`.
+        """
+        return self.source_filename(page, **partition)
+
+    def _extraction_tasks(
+        self, pages: list[str], partitions: list[dict[str, PartitionSelection]]
+    ) -> list[tuple[list[str], dict[str, PartitionSelection]]]:
+        """Group the pages to extract from each partition by their source file.
+
+        Returns:
+            A list of (pages, partition) tuples, ordered by partition. Pages that don't
+            appear in a partition are left out.
+        """
+        tasks = []
+        for partition in partitions:
+            pages_by_source = defaultdict(list)
+            for page in pages:
                 # we are going to skip
                 if self.source_filename(page, **partition) == "-1":
                     logger.debug(f"No page for {self._dataset_name} {page} {partition}")
                     continue
-                logger.debug(
-                    f"Loading dataframe for {self._dataset_name} {page} {partition}"
-                )
-                df = self.load_source(page, **partition)
-                df = pudl.helpers.simplify_columns(df)
-                df = self.process_raw(df, page, **partition)
-                df = self.process_renamed(df, page, **partition)
-                self.validate(df, page, **partition)
-                current_page_dfs.append(df)
-
-            all_page_dfs[page] = self.combine(current_page_dfs, page)
-        return all_page_dfs
+                pages_by_source[self.source_key(page, **partition)].append(page)
+            tasks += [(group, partition) for group in pages_by_source.values()]
+        return tasks
+
+    def _extract_pages(
+        self, pages: list[str], partition: dict[str, PartitionSelection]
+    ) -> dict[str, tuple[pd.DataFrame, float]]:
+        """Extract the given pages, which share a source file, from a single partition.
+
+        This runs in a worker process when extracting in parallel, so everything it
+        needs is on the (pickled) extractor and in its arguments.
+
+        Returns:
+            A dictionary mapping each page to its extracted dataframe, and the number of
+            seconds it took to extract.
+        """
+        try:
+            return {
+                page: self._extract_page_partition(page, partition) for page in pages
+            }
+        finally:
+            self.release_partition(**partition)
+
+    def _extract_page_partition(
+        self, page: str, partition: dict[str, PartitionSelection]
+    ) -> tuple[pd.DataFrame, float]:
+        """Load, clean up and validate a single page from a single partition.
+
+        Returns:
+            The extracted dataframe, and the number of seconds it took to extract.
+        """
+        start = time.perf_counter()
+        logger.debug(f"Loading dataframe for {self._dataset_name} {page} {partition}")
+        df = self.load_source(page, **partition)
+        df = pudl.helpers.simplify_columns(df)
+        df = self.process_raw(df, page, **partition)
+        df = self.process_renamed(df, page, **partition)
+        self.validate(df, page, **partition)
+        return df, time.perf_counter() - start
 
 
 @op(tags={"memory-use": "high"})
@@ -336,6 +434,15 @@ def partition_extractor_factory(
         required_resource_keys={"datastore"},
         name=f"extract_single_{name}_partition",
         ins={"part_dict": In(dagster_type=dagster_dict_str_strint)},
+        config_schema={
+            "max_workers": Field(
+                int,
+                default_value=1,
+                description=(
+                    "Number of processes to use to extract the pages of the partition."
+                ),
+            )
+        },
     )
     def extract_single_partition(
         context, part_dict: dict[str, str | int]
@@ -352,7 +459,9 @@ def partition_extractor_factory(
             A dictionary of DataFrames extracted from Excel/CSV, keyed by page name.
         """
         ds = context.resources.datastore
-        return extractor_cls(ds).extract(**part_dict)
+        return extractor_cls(ds, max_workers=context.op_config["max_workers"]).extract(
+            **part_dict
+        )
 
     return extract_single_partition
 
@@ -1,9 +1,14 @@
 """Generic extractor for all FERC XBRL data."""
 
+import importlib.metadata
 import io
-from collections.abc import Callable
+import json
+import tempfile
+import zipfile
+from collections.abc import Callable, Iterable
 from pathlib import Path
 
+import sqlalchemy as sa
 from dagster import op
 from ferc_xbrl_extractor.cli import run_main
 
@@ -32,12 +37,26 @@ class FercXbrlDatastore:
 
         return io.BytesIO(raw_archive)
 
-    def get_filings(self, year: int, form: XbrlFormNumber) -> io.BytesIO:
-        """Return the corresponding archive full of XBRL filings."""
-        return io.BytesIO(
-            self.datastore.get_unique_resource(
-                f"ferc{form.value}", year=year, data_format="xbrl"
-            )
+    def get_taxonomy_checksum(self, form: XbrlFormNumber) -> str:
+        """Returns the checksum of the taxonomy archive, without retrieving it."""
+        return self.datastore.get_unique_resource_checksum(
+            f"ferc{form.value}", data_format="xbrl_taxonomy"
+        )
+
+    def get_filings(self, year: int, form: XbrlFormNumber) -> Path | io.BytesIO:
+        """Return the corresponding archive full of XBRL filings.
+
+        Archives in the local cache are returned as paths, so that the filings are read
+        from disk one at a time rather than holding the whole archive in memory.
+        """
+        return self.datastore.get_unique_resource_file(
+            f"ferc{form.value}", year=year, data_format="xbrl"
+        )
+
+    def get_filings_checksum(self, year: int, form: XbrlFormNumber) -> str:
+        """Returns the checksum of an archive of XBRL filings, without retrieving it."""
+        return self.datastore.get_unique_resource_checksum(
+            f"ferc{form.value}", year=year, data_format="xbrl"
         )
 
 
@@ -69,7 +88,7 @@ def xbrl2sqlite_op_factory(form: XbrlFormNumber) -> Callable:
             return
 
         sql_path = PudlPaths().sqlite_db_path(f"ferc{form.value}_xbrl")
-        if sql_path.exists():
+        if sql_path.exists() and not rs.xbrl_incremental:
             sql_path.unlink()
 
         convert_form(
@@ -80,6 +99,7 @@ def xbrl2sqlite_op_factory(form: XbrlFormNumber) -> Callable:
             sql_path=sql_path,
             batch_size=rs.xbrl_batch_size,
             workers=rs.xbrl_num_workers,
+            incremental=rs.xbrl_incremental,
         )
 
     return inner_op
@@ -93,9 +113,19 @@ def convert_form(
     sql_path: Path,
     batch_size: int | None = None,
     workers: int | None = None,
+    incremental: bool = False,
 ) -> None:
     """Clone a single FERC XBRL form to SQLite.
 
+    An incremental conversion records the checksums of the taxonomy and of each year's
+    archive of filings in ``ferc{N}_xbrl_conversion.json`` next to the other outputs.
+    The next incremental conversion only parses the archives of years that are new or
+    have changed, after deleting the rows of the filings they replace, and it deletes
+    the filings of years that are no longer requested. The new filings are converted
+    into a scratch database and then appended to the tables in ``sql_path``. If there is no record of an
+    earlier conversion, or the taxonomy or ``ferc_xbrl_extractor`` version changed,
+    the database is rebuilt from all of the archives.
+
     Args:
         form_settings: Validated settings for converting the desired XBRL form to SQLite.
         form: FERC form number.
@@ -104,30 +134,159 @@ def convert_form(
         sql_path: path to the SQLite DB we'd like to write to.
         batch_size: Number of XBRL filings to process in a single CPU process.
         workers: Number of CPU processes to create for processing XBRL filings.
+        incremental: Whether to only convert the archives of filings that changed
+            since the last incremental conversion into ``sql_path``.
 
     Returns:
         None
     """
     datapackage_path = str(output_path / f"ferc{form.value}_xbrl_datapackage.json")
     metadata_path = str(output_path / f"ferc{form.value}_xbrl_taxonomy_metadata.json")
+    state_path = output_path / f"ferc{form.value}_xbrl_conversion.json"
+
+    years = form_settings.years
+    if incremental:
+        state = {
+            "ferc_xbrl_extractor": importlib.metadata.version(
+                "catalystcoop.ferc_xbrl_extractor"
+            ),
+            "taxonomy": datastore.get_taxonomy_checksum(form),
+            "filings": {},
+        }
+        checksums = {
+            str(year): datastore.get_filings_checksum(year, form) for year in years
+        }
+        previous = json.loads(state_path.read_text()) if state_path.exists() else {}
+        if (
+            not sql_path.exists()
+            or not Path(datapackage_path).exists()
+            or any(previous.get(key) != state[key] for key in state if key != "filings")
+        ):
+            logger.info(f"Converting all ferc{form.value} XBRL filings to SQLite.")
+            sql_path.unlink(missing_ok=True)
+            previous = {"filings": {}}
+        state["filings"] = {
+            year: filings
+            for year, filings in previous["filings"].items()
+            if checksums.get(year) == filings["checksum"]
+        }
+        stale_filings = {
+            name
+            for year, filings in previous["filings"].items()
+            if year not in state["filings"]
+            for name in filings["filing_names"]
+        }
+        years = [year for year in years if str(year) not in state["filings"]]
+    else:
+        # An earlier incremental conversion doesn't describe the new database.
+        state_path.unlink(missing_ok=True)
 
-    taxonomy_archive = datastore.get_taxonomy(form)
     # Process XBRL filings for each year requested
-    filings_archives = [
-        datastore.get_filings(year, form) for year in form_settings.years
-    ]
-    # if we set clobber=True, clobbers on *every* call to run_main;
-    # we already delete the existing base on `clobber=True` in `xbrl2sqlite`
-    run_main(
-        filings=filings_archives,
-        db_path=sql_path,
-        clobber=False,
-        taxonomy=taxonomy_archive,
-        form_number=form.value,
-        metadata_path=metadata_path,
-        datapackage_path=datapackage_path,
-        workers=workers,
-        batch_size=batch_size,
-        loglevel="INFO",
-        logfile=None,
-    )
+    filings_archives = [datastore.get_filings(year, form) for year in years]
+    if incremental:
+        for year, archive in zip(years, filings_archives, strict=True):
+            filing_names = _get_filing_names(archive)
+            state["filings"][str(year)] = {
+                "checksum": checksums[str(year)],
+                "filing_names": filing_names,
+            }
+            # Also delete new filings that a failed conversion may have left behind.
+            stale_filings.update(filing_names)
+        if stale_filings and sql_path.exists():
+            logger.info(
+                f"Deleting {len(stale_filings)} changed ferc{form.value} XBRL filings."
+            )
+            _delete_filings(sql_path, stale_filings)
+        if not years:
+            logger.info(f"All ferc{form.value} XBRL filings are already in SQLite.")
+            state_path.write_text(json.dumps(state, indent=2, sort_keys=True))
+            return
+        logger.info(f"Converting ferc{form.value} XBRL filings from {years} to SQLite.")
+
+    run_main_kwargs = {
+        "filings": filings_archives,
+        # if we set clobber=True, clobbers on *every* call to run_main;
+        # we already delete the existing base on `clobber=True` in `xbrl2sqlite`
+        "clobber": False,
+        "taxonomy": datastore.get_taxonomy(form),
+        "form_number": form.value,
+        "metadata_path": metadata_path,
+        "datapackage_path": datapackage_path,
+        "workers": workers,
+        "batch_size": batch_size,
+        "loglevel": "INFO",
+        "logfile": None,
+    }
+    if incremental and sql_path.exists():
+        # Depending on its version, run_main either appends to or replaces existing
+        # tables, so the new filings are converted into a scratch database and then
+        # appended to the existing one.
+        with tempfile.TemporaryDirectory(dir=sql_path.parent) as tmp_dir:
+            new_sql_path = Path(tmp_dir) / sql_path.name
+            run_main(db_path=new_sql_path, **run_main_kwargs)
+            _append_tables(new_sql_path, sql_path)
+    else:
+        run_main(db_path=sql_path, **run_main_kwargs)
+    if incremental:
+        state_path.write_text(json.dumps(state, indent=2, sort_keys=True))
+
+
+def _get_filing_names(archive: Path | io.BytesIO) -> list[str]:
+    """Returns the names of the XBRL filings in an archive, as they appear in tables."""
+    with zipfile.ZipFile(archive) as zf:
+        return sorted(
+            Path(name).stem for name in zf.namelist() if Path(name).suffix == ".xbrl"
+        )
+
+
+def _delete_filings(sql_path: Path, filing_names: Iterable[str]) -> None:
+    """Delete the rows of the given filings from all tables in an XBRL database."""
+    filing_names = sorted(filing_names)
+    engine = sa.create_engine(f"sqlite:///{sql_path}")
+    metadata = sa.MetaData()
+    metadata.reflect(engine)
+    with engine.begin() as conn:
+        for table in metadata.tables.values():
+            if "filing_name" not in table.c:
+                continue
+            for start in range(0, len(filing_names), 1000):
+                names = filing_names[start : start + 1000]
+                conn.execute(table.delete().where(table.c.filing_name.in_(names)))
+    engine.dispose()
+
+
+def _append_tables(src_path: Path, dest_path: Path) -> None:
+    """Append the rows of every table in one SQLite DB to the same table in another.
+
+    Tables that don't exist in ``dest_path`` yet are created, and columns that are new
+    to existing tables (e.g. facts added to the taxonomy) are added to them, so that
+    the earlier rows get nulls in those columns.
+    """
+    src_metadata = sa.MetaData()
+    src_engine = sa.create_engine(f"sqlite:///{src_path}")
+    src_metadata.reflect(src_engine)
+    src_engine.dispose()
+    engine = sa.create_engine(f"sqlite:///{dest_path}")
+    metadata = sa.MetaData()
+    metadata.reflect(engine)
+    with engine.connect() as conn:
+        conn.exec_driver_sql("ATTACH DATABASE ? AS src", (str(src_path),))
+        for src_table in src_metadata.tables.values():
+            if src_table.name not in metadata.tables:
+                src_table.to_metadata(metadata).create(conn)
+            table = metadata.tables[src_table.name]
+            for column in src_table.columns:
+                if column.name not in table.c:
+                    column_type = column.type.compile(dialect=engine.dialect)
+                    conn.exec_driver_sql(
+                        f'ALTER TABLE "{table.name}" '
+                        f'ADD COLUMN "{column.name}" {column_type}'
+                    )
+            columns = ", ".join(f'"{column.name}"' for column in src_table.columns)
+            conn.exec_driver_sql(
+                f'INSERT INTO main."{table.name}" ({columns}) '  # noqa: S608
+                f'SELECT {columns} FROM src."{table.name}"'
+            )
+        conn.commit()
+        conn.exec_driver_sql("DETACH DATABASE src")
+    engine.dispose()
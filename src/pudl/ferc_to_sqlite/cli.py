@@ -79,8 +79,17 @@ def ferc_to_sqlite_job_factory(
     type=int,
     default=None,
     help=(
-        "Number of worker processes to use when parsing XBRL filings. "
-        "Defaults to using the number of CPUs."
+        "Number of worker processes to use when parsing XBRL filings and loading "
+        "DBF tables. Defaults to using the number of CPUs for XBRL, and a single "
+        "process for DBF."
+    ),
+)
+@click.option(
+    "--incremental/--no-incremental",
+    default=False,
+    help=(
+        "Only convert the XBRL filing archives that are new or have changed since the "
+        "last incremental conversion, instead of rebuilding the XBRL databases."
     ),
 )
 @click.option(
@@ -138,6 +147,7 @@ def main(
     etl_settings_yml: pathlib.Path,
     batch_size: int,
     workers: int | None,
+    incremental: bool,
     dagster_workers: int,
     gcs_cache_path: str,
     logfile: pathlib.Path,
@@ -178,6 +188,8 @@ def main(
                 "config": {
                     "xbrl_num_workers": workers,
                     "xbrl_batch_size": batch_size,
+                    "xbrl_incremental": incremental,
+                    "dbf_num_workers": workers or 1,
                 },
             },
         },
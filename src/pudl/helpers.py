@@ -15,7 +15,8 @@ import re
 import shutil
 import time
 from collections import defaultdict
-from collections.abc import Callable, Generator, Iterable
+from collections.abc import Callable, Generator, Iterable, Iterator
+from contextlib import contextmanager
 from functools import partial
 from io import BytesIO
 from typing import Any, Literal, NamedTuple
@@ -1084,6 +1085,157 @@ def drop_tables(engine: sa.Engine, clobber: bool = False) -> None:
         conn.exec_driver_sql("VACUUM")
 
 
+SQLITE_BULK_LOAD_PRAGMAS: dict[str, str | int] = {
+    "journal_mode": "MEMORY",
+    "synchronous": "OFF",
+    "cache_size": -256_000,
+    "temp_store": "MEMORY",
+}
+"""SQLite PRAGMAs that speed up bulk loading data into a database.
+
+The rollback journal is kept in memory and writes aren't synced to disk, so a crash
+in the middle of a load can corrupt the database. That's acceptable for databases that
+are always rebuilt from scratch, like the FERC DBF databases, where they can be set on
+every connection with :func:`set_sqlite_pragmas`. Databases that are updated in place
+should only use them around a load with :func:`sqlite_pragmas`. A negative
+``cache_size`` is in KiB, so each connection gets a ~250 MB page cache.
+"""
+
+
+def set_sqlite_pragmas(
+    engine: sa.Engine, pragmas: dict[str, str | int] = SQLITE_BULK_LOAD_PRAGMAS
+) -> sa.Engine:
+    """Set SQLite PRAGMAs on every new connection made by an engine.
+
+    PRAGMAs like ``journal_mode`` and ``synchronous`` only apply to the connection
+    that sets them, so they are set by a listener that runs whenever the engine opens a
+    new DBAPI connection. Connections that are already open are not affected.
+
+    Args:
+        engine: SQLAlchemy engine connected to a SQLite database.
+        pragmas: mapping of PRAGMA names to the values they should be set to.
+
+    Returns:
+        The same engine, for chaining.
+    """
+
+    @sa.event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+    return engine
+
+
+@contextmanager
+def sqlite_pragmas(
+    con: sa.Connection, pragmas: dict[str, str | int] = SQLITE_BULK_LOAD_PRAGMAS
+) -> Iterator[sa.Connection]:
+    """Set SQLite PRAGMAs on a connection, and restore their old values afterwards.
+
+    PRAGMAs like ``journal_mode`` and ``synchronous`` can't be changed inside a
+    transaction, so they are set and restored while no transaction is open. Transactions
+    should be started and committed within the block, e.g. with
+    :meth:`sqlalchemy.Connection.begin`.
+
+    Args:
+        con: open connection to a SQLite database, with no transaction in progress.
+        pragmas: mapping of PRAGMA names to the values they should be set to.
+
+    Yields:
+        The same connection, with the PRAGMAs set.
+    """
+    previous = {
+        name: con.exec_driver_sql(f"PRAGMA {name}").scalar() for name in pragmas
+    }
+    for name, value in pragmas.items():
+        con.exec_driver_sql(f"PRAGMA {name}={value}")
+    con.commit()
+    try:
+        yield con
+    finally:
+        con.rollback()
+        for name, value in previous.items():
+            con.exec_driver_sql(f"PRAGMA {name}={value}")
+        con.commit()
+
+
+def _sqlite_column_values(
+    col: pd.Series, sa_type: sa.types.TypeEngine, dialect: sa.Dialect
+) -> list:
+    """Convert a column into a list of Python values that sqlite3 can bind.
+
+    Numeric and boolean columns are converted in one vectorized pass through NumPy.
+    Other columns are converted to objects with nulls replaced by None, and are passed
+    through the SQLAlchemy type's bind processor (if it has one) so that e.g. dates
+    and datetimes are stored in exactly the same format as :meth:`pandas.DataFrame.to_sql`
+    would store them.
+    """
+    nulls = col.isna().to_numpy()
+    processor = None
+    if pd.api.types.is_bool_dtype(col) or pd.api.types.is_integer_dtype(col):
+        values = col.to_numpy(dtype="int64", na_value=0).tolist()
+    elif pd.api.types.is_float_dtype(col):
+        values = col.to_numpy(dtype="float64", na_value=np.nan).tolist()
+    else:
+        values = col.to_numpy(dtype=object).tolist()
+        if sa_type is not None:
+            processor = sa_type.dialect_impl(dialect).bind_processor(dialect)
+    for i in np.flatnonzero(nulls):
+        values[i] = None
+    if processor is not None:
+        values = [None if value is None else processor(value) for value in values]
+    return values
+
+
+def bulk_load_sqlite(
+    df: pd.DataFrame,
+    table: sa.Table,
+    con: sa.Connection,
+    chunksize: int = 100_000,
+) -> None:
+    """Append a dataframe to an existing SQLite table without going through to_sql.
+
+    :meth:`pandas.DataFrame.to_sql` builds a dictionary for every row and binds each
+    parameter through SQLAlchemy. Instead, each chunk of the dataframe is converted
+    column by column (see :func:`_sqlite_column_values`) and inserted with a single
+    DBAPI ``executemany`` call. Any secondary indexes on the table are dropped before
+    the load and recreated afterwards, so they are built once rather than updated on
+    every insert.
+
+    Database errors (e.g. constraint violations or columns that aren't in the table)
+    are raised as the usual :mod:`sqlalchemy.exc` exceptions.
+
+    Args:
+        df: dataframe to load. Every column must exist in ``table``.
+        table: SQLAlchemy table to append the data to.
+        con: open connection to the SQLite database. The caller is responsible for
+            committing the transaction.
+        chunksize: the number of rows to convert and insert at a time.
+    """
+    columns = list(df.columns)
+    col_types = [
+        table.columns[col].type if col in table.columns else None for col in columns
+    ]
+    quoted_cols = ", ".join(f'"{col}"' for col in columns)
+    placeholders = ", ".join("?" for _ in columns)
+    stmt = f'INSERT INTO "{table.name}" ({quoted_cols}) VALUES ({placeholders})'  # noqa: S608
+
+    for index in table.indexes:
+        index.drop(con, checkfirst=True)
+    for start in range(0, len(df), chunksize):
+        chunk = df.iloc[start : start + chunksize]
+        values = [
+            _sqlite_column_values(chunk[col], col_type, con.dialect)
+            for col, col_type in zip(columns, col_types, strict=True)
+        ]
+        con.exec_driver_sql(stmt, list(zip(*values, strict=True)))
+    for index in table.indexes:
+        index.create(con, checkfirst=True)
+
+
 def merge_dicts(lods: list[dict[Any, Any]]) -> dict[Any, Any]:
     """Merge multipe dictionaries together.
 
@@ -1133,11 +1285,8 @@ def convert_cols_dtypes(
         :py:const:`pudl.metadata.fields.FIELD_METADATA`
     """
     # get me all of the columns for the table in the constants dtype dict
-    dtypes = {
-        col: dtype
-        for col, dtype in get_pudl_dtypes(group=data_source).items()
-        if col in df.columns
-    }
+    pudl_dtypes = get_pudl_dtypes(group=data_source)
+    dtypes = {col: pudl_dtypes[col] for col in df.columns if col in pudl_dtypes}
 
     # grab only the boolean columns (we only need their names)
     bool_cols = [col for col in dtypes if dtypes[col] == "boolean"]
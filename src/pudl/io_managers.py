@@ -1,11 +1,13 @@
 """Dagster IO Managers."""
 
 import re
+import sqlite3
 from pathlib import Path
 from sqlite3 import sqlite_version
 from typing import Any
 
 import dask.dataframe as dd
+import numpy as np
 import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
@@ -42,6 +44,74 @@ def get_table_name_from_context(context: OutputContext) -> str:
     return context.get_identifier()
 
 
+def get_load_options_from_context(
+    context: InputContext,
+) -> tuple[list[str] | None, list | None]:
+    """Retrieves the columns and row filters requested by an input's metadata.
+
+    Assets can ask for a subset of an upstream table by attaching metadata to their
+    inputs, e.g. ``AssetIn(metadata={"columns": ["plant_id_eia", "capacity_mw"]})``.
+
+    * ``columns``: the list of columns to load. If absent, all columns are loaded.
+    * ``filters``: row filters in the disjunctive normal form used by
+      :func:`pyarrow.parquet.read_table`, e.g. ``[("report_date", ">=", pd.Timestamp("2020-01-01"))]``
+      or a list of such lists to combine several conjunctions with OR. If absent, all
+      rows are loaded.
+
+    Returns:
+        The requested columns and filters, each of which is None if not specified.
+    """
+    metadata = context.metadata or {}
+    return metadata.get("columns"), metadata.get("filters")
+
+
+_FILTER_OPERATORS = {
+    "=": lambda col, val: col == val,
+    "==": lambda col, val: col == val,
+    "!=": lambda col, val: col != val,
+    "<": lambda col, val: col < val,
+    "<=": lambda col, val: col <= val,
+    ">": lambda col, val: col > val,
+    ">=": lambda col, val: col >= val,
+    "in": lambda col, val: col.isin(val),
+    "not in": lambda col, val: ~col.isin(val),
+}
+
+
+def apply_load_options(
+    df: pd.DataFrame, columns: list[str] | None, filters: list | None
+) -> pd.DataFrame:
+    """Select the requested rows and columns from an already loaded dataframe.
+
+    This mirrors the pushdown performed by :class:`PudlParquetIOManager` for IO managers
+    that can't filter data while reading it, so that an asset sees the same data no
+    matter which storage format its inputs are read from.
+
+    Args:
+        df: the full table.
+        columns: see :func:`get_load_options_from_context`.
+        filters: see :func:`get_load_options_from_context`.
+    """
+    if filters:
+        # A flat list of predicates is a single conjunction.
+        if isinstance(filters[0], tuple):
+            filters = [filters]
+        mask = pd.Series(False, index=df.index)
+        for conjunction in filters:
+            conjunction_mask = pd.Series(True, index=df.index)
+            for col, op, val in conjunction:
+                if op not in _FILTER_OPERATORS:
+                    raise ValueError(f"Unsupported filter operator: {op}")
+                conjunction_mask &= (
+                    _FILTER_OPERATORS[op](df[col], val).fillna(False).astype(bool)
+                )
+            mask |= conjunction_mask
+        df = df.loc[mask].reset_index(drop=True)
+    if columns is not None:
+        df = df.loc[:, columns]
+    return df
+
+
 class PudlMixedFormatIOManager(IOManager):
     """Format switching IOManager that supports sqlite and parquet.
 
@@ -66,7 +136,12 @@ class PudlMixedFormatIOManager(IOManager):
     read_from_parquet: bool
     """If true, data will be read from parquet files instead of sqlite."""
 
-    def __init__(self, write_to_parquet: bool = False, read_from_parquet: bool = False):
+    def __init__(
+        self,
+        write_to_parquet: bool = False,
+        read_from_parquet: bool = False,
+        parquet_row_group_size: int | None = None,
+    ):
         """Creates new instance of mixed format pudl IO manager.
 
         By default, data is written and read from sqlite, but experimental
@@ -81,6 +156,9 @@ class PudlMixedFormatIOManager(IOManager):
                 read from the sqlite database. Reading from parquet provides
                 performance increases as well as better datatype handling, so
                 this option is encouraged.
+            parquet_row_group_size: if set, parquet files are written in streaming
+                mode with row groups of at most this many rows. See
+                :class:`PudlParquetIOManager`.
         """
         if read_from_parquet and not write_to_parquet:
             raise RuntimeError(
@@ -92,7 +170,9 @@ class PudlMixedFormatIOManager(IOManager):
             base_dir=PudlPaths().output_dir,
             db_name="pudl",
         )
-        self._parquet_io_manager = PudlParquetIOManager()
+        self._parquet_io_manager = PudlParquetIOManager(
+            row_group_size=parquet_row_group_size
+        )
         if self.write_to_parquet or self.read_from_parquet:
             logger.warning(
                 f"pudl_io_manager: experimental support for parquet enabled. "
@@ -232,15 +312,8 @@ class SQLiteIOManager(IOManager):
             # Remove old table records before loading to db
             con.execute(sa_table.delete())
 
-        with engine.begin() as con:
-            df.to_sql(
-                table_name,
-                con,
-                if_exists="append",
-                index=False,
-                chunksize=100_000,
-                dtype={c.name: c.type for c in sa_table.columns},
-            )
+        with engine.connect() as con, pudl.helpers.sqlite_pragmas(con), con.begin():
+            pudl.helpers.bulk_load_sqlite(df, sa_table, con)
 
     # TODO (bendnorman): Create a SQLQuery type so it's clearer what this method expects
     def _handle_str_output(self, context: OutputContext, query: str):
@@ -322,6 +395,28 @@ class SQLiteIOManager(IOManager):
 class PudlParquetIOManager(IOManager):
     """IOManager that writes pudl tables to pyarrow parquet files."""
 
+    row_group_size: int | None
+    """If set, write tables in streaming mode, one row group of this size at a time."""
+
+    def __init__(self, row_group_size: int | None = None):
+        """Creates new instance of the parquet IO manager.
+
+        Args:
+            row_group_size: If None, the whole dataframe has its schema enforced and is
+                converted to a single :class:`pyarrow.Table` before it is written.
+                Otherwise the dataframe is sorted by its primary key and written in
+                slices of at most this many rows, each of which has its schema
+                enforced, is converted to Arrow, and is written as its own row group.
+                This bounds the extra memory required to write very large tables, and
+                lets readers use the row group statistics to skip data when filtering
+                on primary key columns.
+        """
+        if row_group_size is not None and row_group_size < 1:
+            raise ValueError(
+                f"row_group_size must be a positive integer, got {row_group_size}."
+            )
+        self.row_group_size = row_group_size
+
     def handle_output(self, context: OutputContext, df: Any) -> None:
         """Writes pudl dataframe to parquet file."""
         assert isinstance(df, pd.DataFrame), "Only panda dataframes are supported."
@@ -330,6 +425,10 @@ class PudlParquetIOManager(IOManager):
         parquet_path.parent.mkdir(parents=True, exist_ok=True)
         res = Resource.from_id(table_name)
 
+        if self.row_group_size is not None:
+            self._write_row_groups(df, res, parquet_path)
+            return
+
         df = res.enforce_schema(df)
         schema = res.to_pyarrow()
         with pq.ParquetWriter(
@@ -342,13 +441,194 @@ class PudlParquetIOManager(IOManager):
                 pa.Table.from_pandas(df, schema=schema, preserve_index=False)
             )
 
+    def _write_row_groups(
+        self, df: pd.DataFrame, res: Resource, parquet_path: Path
+    ) -> None:
+        """Enforce the schema on and write a dataframe one row group at a time.
+
+        Only one slice of the dataframe is copied, typed and converted to Arrow at a
+        time. The rows are written in primary key order, so any duplicate primary keys
+        end up next to each other: duplicates within a slice are caught by
+        :meth:`pudl.metadata.classes.Resource.enforce_schema`, and duplicates that
+        straddle two slices are caught by comparing the keys on either side of the
+        boundary.
+
+        Args:
+            df: the dataframe to write.
+            res: the resource describing the table's schema.
+            parquet_path: the file to write to.
+
+        Raises:
+            ValueError: if a column in the schema is missing, or if the primary key
+                contains duplicate or null values.
+        """
+        # Check for missing columns and log the dropped columns once, up front.
+        res.enforce_schema(df.iloc[:0])
+        field_names = res.get_field_names()
+        field_positions = [df.columns.get_loc(name) for name in field_names]
+        pk = res.schema.primary_key or []
+        if pk:
+            row_order = (
+                df.loc[:, pk]
+                .reset_index(drop=True)
+                .sort_values(pk, kind="stable", na_position="last")
+                .index.to_numpy()
+            )
+        else:
+            row_order = np.arange(len(df))
+
+        schema = res.to_pyarrow()
+        sorting_columns = pq.SortingColumn.from_ordering(
+            schema, [(col, "ascending") for col in pk], null_placement="at_end"
+        )
+        prev_key = None
+        with pq.ParquetWriter(
+            where=parquet_path,
+            schema=schema,
+            compression="snappy",
+            version="2.6",
+            sorting_columns=sorting_columns or None,
+        ) as writer:
+            for start in range(0, len(df), self.row_group_size):
+                rows = row_order[start : start + self.row_group_size]
+                chunk = res.enforce_schema(df.iloc[rows, field_positions])
+                if pk:
+                    if tuple(chunk[pk].iloc[0]) == prev_key:
+                        raise ValueError(
+                            f"{res.name} duplicate primary keys ({pk=}) when "
+                            f"enforcing schema: {prev_key}"
+                        )
+                    prev_key = tuple(chunk[pk].iloc[-1])
+                writer.write_table(
+                    pa.Table.from_pandas(chunk, schema=schema, preserve_index=False),
+                    row_group_size=self.row_group_size,
+                )
+                del chunk
+        logger.info(
+            f"Wrote {len(df)} rows of {res.name} to {parquet_path} in row groups of "
+            f"up to {self.row_group_size} rows."
+        )
+
     def load_input(self, context: InputContext) -> pd.DataFrame:
-        """Loads pudl table from parquet file."""
+        """Loads pudl table from parquet file.
+
+        Any columns or row filters requested in the input's metadata (see
+        :func:`get_load_options_from_context`) are pushed down into the pyarrow dataset
+        scan, so unneeded columns are never read, and row groups whose statistics rule
+        out every row are skipped.
+
+        The table's schema was enforced when it was written, so the data doesn't need
+        to be validated again. The columns only need to be cast to their pandas dtypes.
+        """
         table_name = get_table_name_from_context(context)
         parquet_path = PudlPaths().parquet_path(table_name)
         res = Resource.from_id(table_name)
-        df = pq.read_table(source=parquet_path, schema=res.to_pyarrow()).to_pandas()
-        return res.enforce_schema(df)
+        columns, filters = get_load_options_from_context(context)
+        df = pq.read_table(
+            source=parquet_path,
+            schema=res.to_pyarrow(),
+            columns=columns,
+            filters=filters,
+        ).to_pandas()
+        dtypes = res.to_pandas_dtypes()
+        return df.astype({col: dtypes[col] for col in df.columns}, copy=False)
+
+
+def read_sqlite_table(  # noqa: C901
+    con: sa.Connection, res: Resource, chunksize: int = 100_000
+) -> pd.DataFrame:
+    """Read a table described by a resource from SQLite into typed pandas columns.
+
+    The number of rows is counted first, so that every column can be preallocated
+    with the right length and type. Rows are then fetched from the DBAPI cursor in
+    chunks and copied straight into those columns, rather than concatenating one
+    dataframe per chunk, so the data is only held in memory once. Each column is then
+    wrapped in its pandas dtype without copying integer, float, and boolean data.
+
+    The primary key is checked once over the whole table, so duplicate keys are caught
+    even if they end up in different chunks.
+
+    Args:
+        con: open connection to the SQLite database.
+        res: the resource describing the table.
+        chunksize: the number of rows to fetch from the database at a time.
+
+    Returns:
+        A dataframe with one column per field in the resource, in schema order, with
+        the pandas dtypes specified by the resource.
+
+    Raises:
+        ValueError: if the table doesn't exist, is missing columns, has duplicate or
+            null primary key values, or its number of rows changes while it's read.
+    """
+    fields = res.schema.fields
+    dtypes = res.to_pandas_dtypes()
+    quoted_cols = ", ".join(f'"{field.name}"' for field in fields)
+    try:
+        n_rows = con.exec_driver_sql(f'SELECT COUNT(*) FROM "{res.name}"').scalar()  # noqa: S608
+        cursor = con.connection.cursor()
+        cursor.execute(f'SELECT {quoted_cols} FROM "{res.name}"')  # noqa: S608
+    except (sa.exc.OperationalError, sqlite3.OperationalError) as err:
+        raise ValueError(
+            f"{res.name} not found. Either the table was dropped "
+            "or it doesn't exist in the pudl.metadata.resources."
+            "Add the table to the metadata and recreate the database."
+        ) from err
+
+    values = {}
+    nulls = {}
+    for field in fields:
+        if field.type in ("integer", "boolean"):
+            values[field.name] = np.empty(n_rows, dtype="int64")
+        elif field.type == "number":
+            values[field.name] = np.empty(n_rows, dtype="float64")
+        else:
+            values[field.name] = np.empty(n_rows, dtype=object)
+        nulls[field.name] = np.zeros(n_rows, dtype=bool)
+
+    start = 0
+    while rows := cursor.fetchmany(chunksize):
+        stop = start + len(rows)
+        if stop > n_rows:
+            break
+        chunk = np.empty((len(rows), len(fields)), dtype=object)
+        chunk[:] = rows
+        chunk_nulls = np.equal(chunk, None)
+        for i, field in enumerate(fields):
+            nulls[field.name][start:stop] = chunk_nulls[:, i]
+            col = chunk[:, i]
+            if values[field.name].dtype != object:
+                col[chunk_nulls[:, i]] = 0
+            values[field.name][start:stop] = col
+        start = stop
+    cursor.close()
+    if rows or start != n_rows:
+        raise ValueError(
+            f"The number of rows in {res.name} changed from {n_rows} while it was "
+            "being read."
+        )
+
+    columns = {}
+    for field in fields:
+        vals, mask, dtype = (
+            values.pop(field.name),
+            nulls.pop(field.name),
+            dtypes[field.name],
+        )
+        if field.type == "integer":
+            columns[field.name] = pd.arrays.IntegerArray(vals, mask)
+        elif field.type == "boolean":
+            columns[field.name] = pd.arrays.BooleanArray(vals.astype(bool), mask)
+        elif field.type == "number":
+            vals[mask] = np.nan
+            columns[field.name] = vals
+        elif field.type in ("date", "datetime", "year"):
+            columns[field.name] = pd.to_datetime(vals, format="ISO8601").astype(dtype)
+        else:
+            columns[field.name] = pd.array(vals, dtype=dtype)
+    df = pd.DataFrame(columns, copy=False)
+    res.check_primary_key(df)
+    return df
 
 
 class PudlSQLiteIOManager(SQLiteIOManager):
@@ -452,18 +732,14 @@ class PudlSQLiteIOManager(SQLiteIOManager):
         res = self.package.get_resource(table_name)
 
         df = res.enforce_schema(df)
-        with self.engine.begin() as con:
+        with (
+            self.engine.connect() as con,
+            pudl.helpers.sqlite_pragmas(con),
+            con.begin(),
+        ):
             # Remove old table records before loading to db
             con.execute(sa_table.delete())
-
-            df.to_sql(
-                table_name,
-                con,
-                if_exists="append",
-                index=False,
-                chunksize=100_000,
-                dtype={c.name: c.type for c in sa_table.columns},
-            )
+            pudl.helpers.bulk_load_sqlite(df, sa_table, con)
 
     def load_input(self, context: InputContext) -> pd.DataFrame:
         """Load a dataframe from a sqlite database.
@@ -487,27 +763,13 @@ class PudlSQLiteIOManager(SQLiteIOManager):
             ) from err
 
         with self.engine.begin() as con:
-            try:
-                df = pd.concat(
-                    [
-                        res.enforce_schema(chunk_df)
-                        for chunk_df in pd.read_sql_table(
-                            table_name, con, chunksize=100_000
-                        )
-                    ]
-                )
-            except ValueError as err:
-                raise ValueError(
-                    f"{table_name} not found. Either the table was dropped "
-                    "or it doesn't exist in the pudl.metadata.resources."
-                    "Add the table to the metadata and recreate the database."
-                ) from err
+            df = read_sqlite_table(con, res)
             if df.empty:
                 raise AssertionError(
                     f"The {table_name} table is empty. Materialize the {table_name} "
                     "asset so it is available in the database."
                 )
-        return df
+        return apply_load_options(df, *get_load_options_from_context(context))
 
 
 @io_manager(
@@ -525,6 +787,12 @@ class PudlSQLiteIOManager(SQLiteIOManager):
                 SQLite database.""",
             default_value=True,
         ),
+        "parquet_row_group_size": Field(
+            int,
+            description="""If set, parquet files are written in streaming mode,
+                sorted by primary key, in row groups of at most this many rows.""",
+            is_required=False,
+        ),
     }
 )
 def pudl_mixed_format_io_manager(init_context: InitResourceContext) -> IOManager:
@@ -532,13 +800,27 @@ def pudl_mixed_format_io_manager(init_context: InitResourceContext) -> IOManager
     return PudlMixedFormatIOManager(
         write_to_parquet=init_context.resource_config["write_to_parquet"],
         read_from_parquet=init_context.resource_config["read_from_parquet"],
+        parquet_row_group_size=init_context.resource_config.get(
+            "parquet_row_group_size"
+        ),
     )
 
 
-@io_manager
+@io_manager(
+    config_schema={
+        "row_group_size": Field(
+            int,
+            description="""If set, parquet files are written in streaming mode,
+                sorted by primary key, in row groups of at most this many rows.""",
+            is_required=False,
+        ),
+    }
+)
 def parquet_io_manager(init_context: InitResourceContext) -> IOManager:
     """Create a Parquet only IO manager."""
-    return PudlParquetIOManager()
+    return PudlParquetIOManager(
+        row_group_size=init_context.resource_config.get("row_group_size")
+    )
 
 
 class FercSQLiteIOManager(SQLiteIOManager):
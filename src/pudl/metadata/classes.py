@@ -7,7 +7,7 @@ import re
 import sys
 import warnings
 from collections.abc import Callable, Iterable
-from functools import cached_property, lru_cache
+from functools import cache, cached_property, lru_cache
 from pathlib import Path
 from typing import Annotated, Any, Literal, Self, TypeVar
 
@@ -1317,6 +1317,8 @@ class Resource(PudlMeta):
         | None
     ) = None
     create_database_schema: bool = True
+    # Resources are shared by Resource.from_id() and memoize their schemas.
+    model_config = ConfigDict(frozen=True)
 
     _check_unique = _validator(
         "contributors", "keywords", "licenses", "sources", fn=_check_unique
@@ -1392,9 +1394,10 @@ class Resource(PudlMeta):
             schema["fields"] = fields
         # Expand sources
         sources = obj.get("sources", [])
-        obj["sources"] = [
+        data_sources = [
             DataSource.from_id(value) for value in sources if value in SOURCES
         ]
+        obj["sources"] = data_sources
         # Expand licenses (assign CC-BY-4.0 by default)
         licenses = obj.get("licenses", ["cc-by-4.0"])
         obj["licenses"] = [License.dict_from_id(value) for value in licenses]
@@ -1402,17 +1405,15 @@ class Resource(PudlMeta):
         if "contributors" in schema:
             raise ValueError("Resource metadata contains explicit contributors")
         contributors = []
-        for source in sources:
-            if source in SOURCES:
-                contributors.extend(DataSource.from_id(source).contributors)
+        for source in data_sources:
+            contributors.extend(source.contributors)
         obj["contributors"] = set(contributors)
         # Lookup and insert keywords
         if "keywords" in schema:
             raise ValueError("Resource metadata contains explicit keywords")
         keywords = []
-        for source in sources:
-            if source in SOURCES:
-                keywords.extend(DataSource.from_id(source).keywords)
+        for source in data_sources:
+            keywords.extend(source.keywords)
         obj["keywords"] = sorted(set(keywords))
         # Insert foreign keys
         schema["foreign_keys"] = FOREIGN_KEYS.get(resource_id, [])
@@ -1444,20 +1445,39 @@ class Resource(PudlMeta):
         return obj
 
     @classmethod
+    @cache
     def from_id(cls, x: str) -> "Resource":
-        """Construct from PUDL identifier (`resource.name`)."""
+        """Construct from PUDL identifier (`resource.name`).
+
+        The result is cached, since the metadata of the same tables is needed every
+        time they are written or read. Every call with the same identifier returns the
+        same Resource, along with its memoized PyArrow, pandas, SQL and Pandera
+        schemas, so the Resource and its nested metadata must not be modified.
+        """
         return cls(**cls.dict_from_id(x))
 
+    @cached_property
+    def _fields_by_name(self) -> dict[str, Field]:
+        """The fields of the resource schema by name."""
+        return {field.name: field for field in self.schema.fields}
+
     def get_field(self, name: str) -> Field:
         """Return field with the given name if it's part of the Resources."""
-        names = [field.name for field in self.schema.fields]
-        if name not in names:
-            raise KeyError(f"The field {name} is not part of the {self.name} schema.")
-        return self.schema.fields[names.index(name)]
+        try:
+            return self._fields_by_name[name]
+        except KeyError:
+            raise KeyError(
+                f"The field {name} is not part of the {self.name} schema."
+            ) from None
 
     def get_field_names(self) -> list[str]:
         """Return a list of all the field names in the resource schema."""
-        return [field.name for field in self.schema.fields]
+        return list(self._fields_by_name)
+
+    @cached_property
+    def _sql_tables(self) -> dict[tuple[bool, bool], sa.Table]:
+        """SQL Tables built without a MetaData, by type and value checks."""
+        return {}
 
     def to_sql(
         self,
@@ -1465,9 +1485,17 @@ class Resource(PudlMeta):
         check_types: bool = True,
         check_values: bool = True,
     ) -> sa.Table:
-        """Return equivalent SQL Table."""
+        """Return equivalent SQL Table.
+
+        Tables built without a ``metadata`` to add them to are memoized.
+        """
         if metadata is None:
-            metadata = sa.MetaData()
+            key = (check_types, check_values)
+            if key not in self._sql_tables:
+                self._sql_tables[key] = self.to_sql(
+                    sa.MetaData(), check_types=check_types, check_values=check_values
+                )
+            return self._sql_tables[key]
         columns = [
             f.to_sql(
                 check_types=check_types,
@@ -1482,21 +1510,42 @@ class Resource(PudlMeta):
             constraints.append(key.to_sql())
         return sa.Table(self.name, metadata, *columns, *constraints)
 
-    def to_pyarrow(self) -> pa.Schema:
-        """Construct a PyArrow schema for the resource."""
+    @cached_property
+    def _pyarrow_schema(self) -> pa.Schema:
+        """The PyArrow schema of the resource."""
         fields = [field.to_pyarrow() for field in self.schema.fields]
         metadata = {"description": self.description}
         if self.schema.primary_key is not None:
             metadata |= {"primary_key": ",".join(self.schema.primary_key)}
         return pa.schema(fields=fields, metadata=metadata)
 
+    def to_pyarrow(self) -> pa.Schema:
+        """Construct a PyArrow schema for the resource."""
+        return self._pyarrow_schema
+
+    @cached_property
+    def _pandas_dtypes(self) -> dict[str, str | pd.CategoricalDtype]:
+        """The default pandas data type of each field by field name."""
+        return {f.name: f.to_pandas_dtype() for f in self.schema.fields}
+
     def to_pandas_dtypes(self, **kwargs: Any) -> dict[str, str | pd.CategoricalDtype]:
         """Return Pandas data type of each field by field name.
 
         Args:
             kwargs: Arguments to :meth:`Field.to_pandas_dtype`.
         """
-        return {f.name: f.to_pandas_dtype(**kwargs) for f in self.schema.fields}
+        if kwargs:
+            return {f.name: f.to_pandas_dtype(**kwargs) for f in self.schema.fields}
+        return dict(self._pandas_dtypes)
+
+    @cached_property
+    def _pandera_schema(self) -> pr.DataFrameSchema:
+        """The Pandera schema of the resource."""
+        return self.schema.to_pandera()
+
+    def to_pandera(self) -> pr.DataFrameSchema:
+        """Construct a Pandera schema for the resource."""
+        return self._pandera_schema
 
     def match_primary_key(self, names: Iterable[str]) -> dict[str, str] | None:
         """Match primary key fields to input field names.
@@ -1655,6 +1704,15 @@ class Resource(PudlMeta):
             )
 
         df = self.format_df(df)
+        self.check_primary_key(df)
+        return df
+
+    def check_primary_key(self, df: pd.DataFrame) -> None:
+        """Check that the primary key columns are unique and non-null.
+
+        Raises:
+            ValueError: if any primary key is duplicated or contains null values.
+        """
         pk = self.schema.primary_key
         if pk and not (dupes := df[df.duplicated(subset=pk)]).empty:
             raise ValueError(
@@ -1664,7 +1722,6 @@ class Resource(PudlMeta):
             raise ValueError(
                 f"{self.name} Null values found in primary key columns.\n{nulls}"
             )
-        return df
 
     def aggregate_df(
         self, df: pd.DataFrame, raised: bool = False, error: Callable = None
@@ -1959,26 +2016,26 @@ class Package(PudlMeta):
             excluded_etl_groups: Collection of ETL groups used to filter resources
                 out of Package.
         """
-        resources = [Resource.dict_from_id(x) for x in resource_ids]
+        resources = [Resource.from_id(x) for x in resource_ids]
         if resolve_foreign_keys:
             # Add missing resources based on foreign keys
             names = list(resource_ids)
             i = 0
             while i < len(resources):
                 for resource in resources[i:]:
-                    for key in resource["schema"].get("foreign_keys", []):
-                        name = key.get("reference", {}).get("resource")
-                        if name and name not in names:
+                    for key in resource.schema.foreign_keys:
+                        name = key.reference.resource
+                        if name not in names:
                             names.append(name)
                 i = len(resources)
                 if len(names) > i:
-                    resources += [Resource.dict_from_id(x) for x in names[i:]]
+                    resources += [Resource.from_id(x) for x in names[i:]]
 
         if excluded_etl_groups:
             resources = [
                 resource
                 for resource in resources
-                if resource["etl_group"] not in excluded_etl_groups
+                if resource.etl_group not in excluded_etl_groups
             ]
 
         return cls(name="pudl", resources=resources)
@@ -2019,12 +2076,23 @@ class Package(PudlMeta):
         else:
             sys.stdout.write(rendered)
 
+    @cached_property
+    def _sql_metadata(self) -> dict[tuple[bool, bool], sa.MetaData]:
+        """SQL MetaData of the package, by type and value checks."""
+        return {}
+
     def to_sql(
         self,
         check_types: bool = True,
         check_values: bool = True,
     ) -> sa.MetaData:
-        """Return equivalent SQL MetaData."""
+        """Return equivalent SQL MetaData.
+
+        The MetaData is memoized, since every SQLite IO manager needs it.
+        """
+        key = (check_types, check_values)
+        if key in self._sql_metadata:
+            return self._sql_metadata[key]
         metadata = sa.MetaData(
             naming_convention={
                 "ix": "ix_%(column_0_label)s",
@@ -2041,6 +2109,7 @@ class Package(PudlMeta):
                     check_types=check_types,
                     check_values=check_values,
                 )
+        self._sql_metadata[key] = metadata
         return metadata
 
     def get_sorted_resources(self) -> StrictList[Resource]:
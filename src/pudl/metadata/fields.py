@@ -1,6 +1,8 @@
 """Field metadata."""
 
-from copy import deepcopy
+from collections.abc import Mapping
+from functools import cache
+from types import MappingProxyType
 from typing import Any
 
 import pandas as pd
@@ -6137,14 +6139,42 @@ FIELD_METADATA_BY_RESOURCE: dict[str, dict[str, Any]] = {
 }
 
 
+def _compile_pudl_dtypes(
+    group: str | None,
+    field_meta: dict[str, Any],
+    field_meta_by_group: dict[str, Any],
+    dtype_map: dict[str, Any],
+) -> dict[str, Any]:
+    """Map each field to the data type of its type, or of its group's override."""
+    overrides = field_meta_by_group.get(group, {})
+    return {
+        name: dtype_map[overrides.get(name, {}).get("type", meta["type"])]
+        for name, meta in field_meta.items()
+    }
+
+
+@cache
+def _get_default_pudl_dtypes(group: str | None) -> Mapping[str, Any]:
+    """The pandas data types of all PUDL fields, compiled once for each group."""
+    return MappingProxyType(
+        _compile_pudl_dtypes(
+            group, FIELD_METADATA, FIELD_METADATA_BY_GROUP, FIELD_DTYPES_PANDAS
+        )
+    )
+
+
 def get_pudl_dtypes(
     group: str | None = None,
     field_meta: dict[str, Any] | None = FIELD_METADATA,
     field_meta_by_group: dict[str, Any] | None = FIELD_METADATA_BY_GROUP,
     dtype_map: dict[str, Any] | None = FIELD_DTYPES_PANDAS,
-) -> dict[str, Any]:
+) -> Mapping[str, Any]:
     """Compile a dictionary of field dtypes, applying group overrides.
 
+    The pandas data types of the PUDL field metadata are only compiled once for each
+    group, and the same read-only mapping is returned on every call. Copy it with
+    :class:`dict` if you need to modify it.
+
     Args:
         group: The data group (e.g. ferc1, eia) to use for overriding the default
             field types. If None, no overrides are applied and the default types
@@ -6158,14 +6188,13 @@ def get_pudl_dtypes(
     Returns:
         A mapping of PUDL field names to their associated data types.
     """
-    field_meta = deepcopy(field_meta)
-    dtypes = {}
-    for f in field_meta:
-        if f in field_meta_by_group.get(group, []):
-            field_meta[f].update(field_meta_by_group[group][f])
-        dtypes[f] = dtype_map[field_meta[f]["type"]]
-
-    return dtypes
+    if (
+        field_meta is FIELD_METADATA
+        and field_meta_by_group is FIELD_METADATA_BY_GROUP
+        and dtype_map is FIELD_DTYPES_PANDAS
+    ):
+        return _get_default_pudl_dtypes(group)
+    return _compile_pudl_dtypes(group, field_meta, field_meta_by_group, dtype_map)
 
 
 def apply_pudl_dtypes(
@@ -6194,12 +6223,16 @@ def apply_pudl_dtypes(
         strict: whether or not all columns need a corresponding field.
 
     Returns:
-        The input dataframe, but with standard PUDL types applied.
+        The input dataframe, but with standard PUDL types applied. Only the columns
+        whose types differ from their PUDL types are cast.
     """
+    group_field_meta = field_meta_by_group.get(group, {})
     unspecified_fields = sorted(
-        set(df.columns)
-        - set(field_meta.keys())
-        - set(field_meta_by_group.get(group, {}).keys())
+        {
+            col
+            for col in df.columns
+            if col not in field_meta and col not in group_field_meta
+        }
     )
     if strict and len(unspecified_fields) > 0:
         raise ValueError(f"Found unspecified fields: {unspecified_fields}")
@@ -6210,4 +6243,10 @@ def apply_pudl_dtypes(
         dtype_map=FIELD_DTYPES_PANDAS,
     )
 
-    return df.astype({col: dtypes[col] for col in df.columns if col in dtypes})
+    return df.astype(
+        {
+            col: dtypes[col]
+            for col, dtype in df.dtypes.items()
+            if col in dtypes and dtype != dtypes[col]
+        }
+    )
@@ -1,9 +1,12 @@
 """A collection of denormalized FERC assets and helper functions."""
 
+import hashlib
 import importlib
 import re
+from collections import defaultdict
 from copy import deepcopy
 from functools import cached_property
+from pathlib import Path
 from typing import Any, Literal, NamedTuple, Self
 
 import networkx as nx
@@ -939,8 +942,20 @@ def exploded_table_asset_factory(
         name=f"_out_ferc1__detailed_{get_core_ferc1_asset_description(root_table)}",
         ins=ins,
         io_manager_key=io_manager_key,
+        config_schema={
+            "forest_cache_dir": Field(
+                str,
+                default_value="",
+                description=(
+                    "Directory in which to cache calculation forests, keyed by a hash "
+                    "of their calculation components, seeds and tags. If empty, the "
+                    "forest is rebuilt every time."
+                ),
+            )
+        },
     )
     def exploded_tables_asset(
+        context,
         **kwargs: dict[str, pd.DataFrame],
     ) -> pd.DataFrame:
         _core_ferc1_xbrl__metadata = kwargs["_core_ferc1_xbrl__metadata"]
@@ -968,6 +983,9 @@ def exploded_table_asset_factory(
             tags=tags,
             group_metric_checks=group_metric_checks,
             off_by_facts=off_by_facts,
+            forest_cache_dir=Path(context.op_config["forest_cache_dir"])
+            if context.op_config["forest_cache_dir"]
+            else None,
         ).boom(tables_to_explode=tables_to_explode)
 
     return exploded_tables_asset
@@ -1108,6 +1126,7 @@ class Exploder:
         tags: pd.DataFrame = pd.DataFrame(),
         group_metric_checks: GroupMetricChecks = GroupMetricChecks(),
         off_by_facts: list[OffByFactoid] = None,
+        forest_cache_dir: Path | None = None,
     ):
         """Instantiate an Exploder class.
 
@@ -1118,6 +1137,8 @@ class Exploder:
             calculation_components_xbrl_ferc1: table of calculation components.
             seed_nodes: NodeIds to use as seeds for the calculation forest.
             tags: Additional metadata to merge onto the exploded dataframe.
+            forest_cache_dir: directory in which to cache the leafy metadata of the
+                calculation forest. If None, it is rebuilt every time.
         """
         self.table_names: list[str] = table_names
         self.root_table: str = root_table
@@ -1127,6 +1148,7 @@ class Exploder:
         self.seed_nodes = seed_nodes
         self.tags = tags
         self.off_by_facts = off_by_facts
+        self.forest_cache_dir = forest_cache_dir
 
     @cached_property
     def exploded_calcs(self: Self):
@@ -1341,6 +1363,7 @@ class Exploder:
             seeds=self.seed_nodes,
             tags=self.tags,
             group_metric_checks=self.group_metric_checks,
+            cache_dir=self.forest_cache_dir,
         )
 
     @cached_property
@@ -1706,6 +1729,7 @@ class XbrlCalculationForestFerc1(BaseModel):
     seeds: list[NodeId] = []
     tags: pd.DataFrame = pd.DataFrame()
     group_metric_checks: GroupMetricChecks = GroupMetricChecks()
+    cache_dir: Path | None = None
     model_config = ConfigDict(
         arbitrary_types_allowed=True, ignored_types=(cached_property,)
     )
@@ -1715,6 +1739,21 @@ class XbrlCalculationForestFerc1(BaseModel):
         """Construct parent_cols based on the provided calc_cols."""
         return [col + "_parent" for col in self.calc_cols]
 
+    @cached_property
+    def content_hash(self: Self) -> str:
+        """A hash of the calculations, seeds and tags that define the forest.
+
+        Used to identify the cached leafy metadata of a forest in :attr:`cache_dir`,
+        so that it is only rebuilt when the calculation components change.
+        """
+        content = hashlib.sha256()
+        for df in [self.exploded_calcs, self.tags]:
+            content.update(df.columns.str.cat(sep=",").encode())
+            content.update(pd.util.hash_pandas_object(df, index=False).to_numpy())
+        content.update(repr(self.seeds).encode())
+        content.update(pudl.__version__.encode())
+        return content.hexdigest()
+
     @model_validator(mode="after")
     def unique_associations(self: Self):
         """Ensure parent-child associations in exploded calculations are unique."""
@@ -2210,13 +2249,6 @@ class XbrlCalculationForestFerc1(BaseModel):
             stepparents = stepparents.union(graph.predecessors(stepchild))
         return list(stepparents)
 
-    def _get_path_weight(self, path: list[NodeId], graph: nx.DiGraph) -> float:
-        """Multiply all weights along a path together."""
-        leaf_weight = 1.0
-        for parent, child in zip(path, path[1:], strict=False):
-            leaf_weight *= graph.get_edge_data(parent, child)["weight"]
-        return leaf_weight
-
     @cached_property
     def leafy_meta(self: Self) -> pd.DataFrame:
         """Identify leaf facts and compile their metadata.
@@ -2234,58 +2266,87 @@ class XbrlCalculationForestFerc1(BaseModel):
         - What tags the leaf has inherited from its ancestors.
         - The leaf node's xbrl_factoid_original
         - The weight associated with the leaf, in relation to its root.
+
+        If a :attr:`cache_dir` is given, the leafy metadata is read from there when a
+        forest with the same :attr:`content_hash` has already been built, and written
+        there otherwise.
         """
+        if self.cache_dir is None:
+            return self._build_leafy_meta()
+        path = Path(self.cache_dir) / f"leafy_meta_{self.content_hash}.parquet"
+        if path.exists():
+            logger.info(f"Reading cached leafy metadata from {path}")
+            return pd.read_parquet(path)
+        leafy_meta = self._build_leafy_meta()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        leafy_meta.to_parquet(path, index=False)
+        return leafy_meta
+
+    def _build_leafy_meta(self: Self) -> pd.DataFrame:
+        """Compile the leafy metadata from the annotated forest.
+
+        Rather than walking the ancestors of and the paths to every leaf, the root(s),
+        path weights and inherited tags of every node in the forest are found in a
+        single pass over the nodes in topological order.
+        """
+        forest = self.annotated_forest
+        root_order = {root: i for i, root in enumerate(self.forest_roots)}
+        path_weights: dict[NodeId, dict[NodeId, set[float]]] = {}
+        inherited_tags: dict[NodeId, dict[str, Any]] = {}
+        for node in nx.topological_sort(forest):
+            parents = list(forest.predecessors(node))
+            if not parents:
+                path_weights[node] = {node: {1.0}}
+            else:
+                path_weights[node] = defaultdict(set)
+                for parent in parents:
+                    edge_weight = forest.edges[parent, node]["weight"]
+                    for root, weights in path_weights[parent].items():
+                        path_weights[node][root] |= {w * edge_weight for w in weights}
+            node_tags = {}
+            for parent in parents:
+                node_tags |= inherited_tags[parent]
+            inherited_tags[node] = node_tags | forest.nodes[node].get("tags", {})
+
+        leaf_to_root_map = {}
+        leaf_rows = []
+        for leaf in self.forest_leaves:
+            # If a leaf descends from several roots, use the last one.
+            root = max(path_weights[leaf], key=root_order.__getitem__)
+            all_leaf_weights = path_weights[leaf][root]
+            if len(all_leaf_weights) != 1:
+                raise ValueError(
+                    f"Paths from {root} to {leaf} have different weights: "
+                    f"{all_leaf_weights}"
+                )
+            leaf_to_root_map[leaf] = root
+            # Construct a dictionary describing each leaf node so that arbitrary tags
+            # can be flattened into columns.
+            leaf_rows.append(
+                {
+                    "table_name": leaf.table_name,
+                    "xbrl_factoid": leaf.xbrl_factoid,
+                    "utility_type": leaf.utility_type,
+                    "plant_status": leaf.plant_status,
+                    "plant_function": leaf.plant_function,
+                    "weight": next(iter(all_leaf_weights)),
+                    "tags": inherited_tags[leaf],
+                }
+            )
         # Construct a dataframe that links the leaf node IDs to their root nodes:
-        leaves = self.forest_leaves
-        roots = self.forest_roots
-        leaf_to_root_map = {
-            leaf: root
-            for leaf in leaves
-            for root in roots
-            if leaf in nx.descendants(self.annotated_forest, root)
-        }
         leaves_df = pd.DataFrame(list(leaf_to_root_map.keys()))
         roots_df = pd.DataFrame(list(leaf_to_root_map.values())).rename(
             columns={col: col + "_root" for col in self.calc_cols}
         )
         leafy_meta = pd.concat([roots_df, leaves_df], axis="columns")
 
-        # Propagate tags and weights to leaf nodes
-        leaf_rows = []
-        for leaf in leaves:
-            leaf_tags = {}
-            ancestors = list(nx.ancestors(self.annotated_forest, leaf)) + [leaf]
-            for node in ancestors:
-                leaf_tags |= self.annotated_forest.nodes[node].get("tags", {})
-            all_leaf_weights = {
-                self._get_path_weight(path, self.annotated_forest)
-                for path in nx.all_simple_paths(
-                    self.annotated_forest, leaf_to_root_map[leaf], leaf
-                )
-            }
-            if len(all_leaf_weights) != 1:
-                raise ValueError(
-                    f"Paths from {leaf_to_root_map[leaf]} to {leaf} have "
-                    f"different weights: {all_leaf_weights}"
-                )
-            leaf_weight = all_leaf_weights.pop()
-
-            # Construct a dictionary describing the leaf node and convert it into a
-            # single row DataFrame. This makes adding arbitrary tags easy.
-            leaf_attrs = {
-                "table_name": leaf.table_name,
-                "xbrl_factoid": leaf.xbrl_factoid,
-                "utility_type": leaf.utility_type,
-                "plant_status": leaf.plant_status,
-                "plant_function": leaf.plant_function,
-                "weight": leaf_weight,
-                "tags": leaf_tags,
-            }
-            leaf_rows.append(pd.json_normalize(leaf_attrs, sep="_"))
-
         # Combine the two dataframes we've constructed above:
         return (
-            pd.merge(leafy_meta, pd.concat(leaf_rows), validate="one_to_one")
+            pd.merge(
+                leafy_meta,
+                pd.json_normalize(leaf_rows, sep="_"),
+                validate="one_to_one",
+            )
             .reset_index(drop=True)
             .convert_dtypes()
         )
@@ -2470,23 +2531,36 @@ def _propagate_tags_leafward(
 ) -> nx.DiGraph:
     """Push a parent's tags down to its descendants.
 
-    Only push the `leafward_inherited_tags` - others will be left alone.
+    Only push the `leafward_inherited_tags` - others will be left alone. Each node
+    inherits from the tagged ancestor that comes last in the node order of the forest,
+    which is found for all nodes in a single topological pass.
     """
     existing_tags = nx.get_node_attributes(annotated_forest, "tags")
-    for node, parent_tags in existing_tags.items():
-        descendants = nx.descendants(annotated_forest, node)
-        descendant_tags = {
-            desc: {
-                "tags": {
-                    tag_name: parent_tags[tag_name]
-                    for tag_name in leafward_inherited_tags
-                    if tag_name in parent_tags
-                }
-                | existing_tags.get(desc, {})
+    tagged_order = {node: i for i, node in enumerate(existing_tags)}
+    last_tagged_ancestor = {}
+    for node in nx.topological_sort(annotated_forest):
+        tagged_ancestors = [
+            ancestor
+            for parent in annotated_forest.predecessors(node)
+            for ancestor in [parent, last_tagged_ancestor.get(parent)]
+            if ancestor in tagged_order
+        ]
+        if tagged_ancestors:
+            last_tagged_ancestor[node] = max(
+                tagged_ancestors, key=tagged_order.__getitem__
+            )
+    descendant_tags = {
+        desc: {
+            "tags": {
+                tag_name: existing_tags[ancestor][tag_name]
+                for tag_name in leafward_inherited_tags
+                if tag_name in existing_tags[ancestor]
             }
-            for desc in descendants
+            | existing_tags.get(desc, {})
         }
-        nx.set_node_attributes(annotated_forest, descendant_tags)
+        for desc, ancestor in last_tagged_ancestor.items()
+    }
+    nx.set_node_attributes(annotated_forest, descendant_tags)
     return annotated_forest
 
 
@@ -2498,20 +2572,14 @@ def _propagate_tag_rootward(
     This function returns the value of a tag, but also sets node attributes
     down the tree when all children of a node share the same tag.
     """
-
-    def _get_tag(annotated_forest, node, tag_name):
-        return annotated_forest.nodes.get(node, {}).get("tags", {}).get(tag_name)
-
-    generations = list(nx.topological_generations(annotated_forest))
-    for gen in reversed(generations):
-        untagged_nodes = {
-            node_id
-            for node_id in gen
-            if _get_tag(annotated_forest, node_id, tag_name) is None
-        }
-        for parent_node in untagged_nodes:
+    tags = nx.get_node_attributes(annotated_forest, "tags")
+    new_tags = {}
+    for gen in reversed(list(nx.topological_generations(annotated_forest))):
+        for parent_node in gen:
+            if tags.get(parent_node, {}).get(tag_name) is not None:
+                continue
             child_tags = {
-                _get_tag(annotated_forest, c, tag_name)
+                tags.get(c, {}).get(tag_name)
                 for c in annotated_forest.successors(parent_node)
                 if not c.xbrl_factoid.endswith("_correction")
             }
@@ -2519,15 +2587,11 @@ def _propagate_tag_rootward(
             # sometimes, all children can share same tag but it's null.
             if len(child_tags) == 1 and non_null_tags:
                 # actually assign the tag here but don't wipe out any other tags
-                new_node_tag = non_null_tags.pop()
-                existing_tags = nx.get_node_attributes(annotated_forest, "tags")
-                node_tags = {
-                    parent_node: {
-                        "tags": {tag_name: new_node_tag}
-                        | existing_tags.get(parent_node, {})
-                    }
-                }
-                nx.set_node_attributes(annotated_forest, node_tags)
+                tags[parent_node] = {tag_name: non_null_tags.pop()} | tags.get(
+                    parent_node, {}
+                )
+                new_tags[parent_node] = {"tags": tags[parent_node]}
+    nx.set_node_attributes(annotated_forest, new_tags)
     return annotated_forest
 
 
@@ -12,6 +12,8 @@ class RuntimeSettings(ConfigurableResource):
 
     xbrl_num_workers: None | int = None
     xbrl_batch_size: int = 50
+    xbrl_incremental: bool = False
+    dbf_num_workers: int = 1
 
 
 @resource(config_schema=create_dagster_config(DatasetsSettings()))
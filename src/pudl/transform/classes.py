@@ -66,14 +66,19 @@ defined in the per-dataset modules under :mod:`pudl.transform.params` e.g.
 
 import enum
 import re
+import resource
+import sys
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from functools import wraps
 from itertools import combinations
+from pathlib import Path
 from typing import Annotated, Any, Protocol, Self
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 from pydantic import (
     BaseModel,
     ConfigDict,
@@ -1022,6 +1027,13 @@ class TableTransformParams(TransformParams):
 #####################################################################################
 # Abstract Table Transformer classes
 #####################################################################################
+def peak_rss_mib() -> float:
+    """The peak resident set size of this process so far, in MiB."""
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in KiB everywhere else.
+    return maxrss / 2**20 if sys.platform == "darwin" else maxrss / 2**10
+
+
 def cache_df(key: str = "main") -> Callable[..., pd.DataFrame]:
     """A decorator for caching dataframes within an :class:`AbstractTableTransformer`.
 
@@ -1041,6 +1053,15 @@ def cache_df(key: str = "main") -> Callable[..., pd.DataFrame]:
     through each step lets you access the last known state it had before an error
     occurred.
 
+    The cached dataframes are snapshots, which are unaffected by any later changes to
+    the dataframe that was returned. If pandas copy-on-write mode is enabled, they're
+    taken without copying any data up front. If the transformer has a ``cache_dir``,
+    they're spilled to disk instead of being held in memory, and can be read back with
+    :meth:`AbstractTableTransformer.get_cached_df`.
+
+    The time taken by each decorated method, and the peak memory used by the process so
+    far, are logged at the debug level.
+
     This decorator requires that the decorated function return a single
     :class:`pd.DataFrame`, but it can take any type of inputs.
 
@@ -1058,7 +1079,12 @@ def cache_df(key: str = "main") -> Callable[..., pd.DataFrame]:
     def _decorator(func: Callable[..., pd.DataFrame]) -> Callable[..., pd.DataFrame]:
         @wraps(func)
         def _wrapper(self: AbstractTableTransformer, *args, **kwargs) -> pd.DataFrame:
+            start = time.perf_counter()
             df = func(self, *args, **kwargs)
+            logger.debug(
+                f"{self.table_id.value}: {func.__name__}() took "
+                f"{time.perf_counter() - start:.2f}s, peak RSS {peak_rss_mib():,.0f} MiB"
+            )
             if not isinstance(df, pd.DataFrame):
                 raise ValueError(
                     f"{self.table_id.value}: The cache_df decorator only works on "
@@ -1070,7 +1096,7 @@ def cache_df(key: str = "main") -> Callable[..., pd.DataFrame]:
                     f"{self.table_id.value}: Caching df to {key=} "
                     f"in {func.__name__}()"
                 )
-                self._cached_dfs[key] = df.copy()
+                self._cache(key, df)
             return df
 
         return _wrapper
@@ -1134,10 +1160,16 @@ class AbstractTableTransformer(ABC):
     clear_cached_dfs: bool = True
     """Determines whether cached dataframes are deleted at the end of the transform."""
 
-    _cached_dfs: dict[str, pd.DataFrame] = {}
+    cache_dir: Path | None = None
+    """Directory to spill cached dataframes to, instead of holding them in memory."""
+
+    _cached_dfs: dict[str, pd.DataFrame | Path]
     """Cached intermediate dataframes for use in development and debugging.
 
     The dictionary keys are the strings passed to the :func:`cache_df` method decorator.
+    The values are paths to parquet files if the dataframes were spilled to
+    ``cache_dir``.
+    Use :meth:`AbstractTableTransformer.get_cached_df` to look them up either way.
     """
 
     parameter_model = TableTransformParams
@@ -1161,6 +1193,7 @@ class AbstractTableTransformer(ABC):
         params: TableTransformParams | None = None,
         cache_dfs: bool = False,
         clear_cached_dfs: bool = True,
+        cache_dir: Path | None = None,
         **kwargs,
     ) -> None:
         """Initialize the table transformer, setting caching flags."""
@@ -1173,6 +1206,8 @@ class AbstractTableTransformer(ABC):
             self.params = params
         self.cache_dfs = cache_dfs
         self.clear_cached_dfs = clear_cached_dfs
+        self.cache_dir = cache_dir
+        self._cached_dfs = {}
 
     ################################################################################
     # Abstract methods that must be defined by subclasses
@@ -1223,19 +1258,56 @@ class AbstractTableTransformer(ABC):
     # Default method implementations which can be used or overridden by subclasses
     def transform(self, *args, **kwargs) -> pd.DataFrame:
         """Apply all specified transformations to the appropriate input dataframes."""
+        start = time.perf_counter()
         df = (
             self.transform_start(*args, **kwargs)
             .pipe(self.transform_main)
             .pipe(self.transform_end)
         )
+        logger.info(
+            f"{self.table_id.value}: Transformed in {time.perf_counter() - start:.1f}s, "
+            f"peak RSS {peak_rss_mib():,.0f} MiB"
+        )
         if self.clear_cached_dfs:
             logger.debug(
                 f"{self.table_id.value}: Clearing cached dfs: "
                 f"{sorted(self._cached_dfs.keys())}"
             )
-            self._cached_dfs.clear()
+            self.clear_cache()
         return df
 
+    def get_cached_df(self, key: str) -> pd.DataFrame:
+        """Look up a cached dataframe, reading it back from disk if it was spilled."""
+        cached = self._cached_dfs[key]
+        if isinstance(cached, Path):
+            return pd.read_parquet(cached)
+        return cached
+
+    def clear_cache(self) -> None:
+        """Delete all cached dataframes, including any that were spilled to disk."""
+        for cached in self._cached_dfs.values():
+            if isinstance(cached, Path):
+                cached.unlink(missing_ok=True)
+        self._cached_dfs.clear()
+
+    def _cache(self, key: str, df: pd.DataFrame) -> None:
+        """Store a snapshot of a dataframe under the given key."""
+        if self.cache_dir is not None:
+            path = Path(self.cache_dir) / f"{self.table_id.value}__{key}.parquet"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                df.to_parquet(path)
+            except (pa.ArrowException, ValueError) as err:
+                logger.warning(
+                    f"{self.table_id.value}: Couldn't spill {key=} to parquet, "
+                    f"caching it in memory instead: {err}"
+                )
+            else:
+                self._cached_dfs[key] = path
+                return
+        # With copy-on-write, a shallow copy is only copied if either is modified.
+        self._cached_dfs[key] = df.copy(deep=pd.options.mode.copy_on_write is not True)
+
     def rename_columns(
         self, df: pd.DataFrame, params: RenameColumns | None = None, **kwargs
     ) -> pd.DataFrame:
@@ -1,6 +1,7 @@
 """Module to perform data cleaning functions on EPA CEMS data tables."""
 
 import datetime
+from collections.abc import Iterable, Iterator
 
 import pandas as pd
 import pytz
@@ -50,12 +51,12 @@ def harmonize_eia_epa_orispl(
     """
     # Make sure the crosswalk does not have multiple plant_id_eia values for each
     # plant_id_epa and emissions_unit_id_epa value before reassigning IDs.
-    one_to_many = crosswalk_df.groupby(
-        ["plant_id_epa", "emissions_unit_id_epa"]
-    ).filter(
-        lambda x: x.plant_id_eia.nunique() > 1  # noqa: PD101
+    one_to_many = (
+        crosswalk_df.groupby(["plant_id_epa", "emissions_unit_id_epa"])
+        .plant_id_eia.nunique()
+        .gt(1)
     )
-    if not one_to_many.empty:
+    if one_to_many.any():
         raise AssertionError(
             "The core_epa__assn_eia_epacamd crosswalk has more than one plant_id_eia value per "
             "plant_id_epa and emissions_unit_id_epa group"
@@ -186,16 +187,50 @@ def transform(
     Returns:
         A single year_quarter of EPA CEMS data
     """
-    # Create all the table inputs used for the subtransform functions below
+    return _transform(
+        raw_df,
+        core_epa__assn_eia_epacamd,
+        _load_plant_utc_offset(core_eia__entity_plants),
+    )
+
+
+def transform_batches(
+    raw_dfs: Iterable[pd.DataFrame],
+    core_epa__assn_eia_epacamd: pd.DataFrame,
+    core_eia__entity_plants: pd.DataFrame,
+) -> Iterator[pd.DataFrame]:
+    """Transform consecutive batches of EPA CEMS hourly data.
+
+    All of the transformations are applied row by row, so transforming each batch of
+    a year_quarter separately gives the same records as transforming it all at once,
+    without needing to hold the whole year_quarter in memory. The plant UTC offsets
+    are only looked up once for all of the batches.
+
+    Args:
+        raw_dfs: Batches of extracted but not yet transformed EPA CEMS data.
+        core_epa__assn_eia_epacamd: The EPA EIA crosswalk table used for harmonizing
+            the ORISPL code with EIA.
+        core_eia__entity_plants: The EIA Plant entities used for aligning timezones.
 
+    Yields:
+        The transformed batches, in the same order.
+    """
+    plant_utc_offset = _load_plant_utc_offset(core_eia__entity_plants)
+    for raw_df in raw_dfs:
+        yield _transform(raw_df, core_epa__assn_eia_epacamd, plant_utc_offset)
+
+
+def _transform(
+    raw_df: pd.DataFrame,
+    core_epa__assn_eia_epacamd: pd.DataFrame,
+    plant_utc_offset: pd.DataFrame,
+) -> pd.DataFrame:
+    """Apply the EPA CEMS transformations given precomputed plant UTC offsets."""
     return (
         raw_df.pipe(apply_pudl_dtypes, group="epacems")
         .pipe(remove_leading_zeros_from_numeric_strings, "emissions_unit_id_epa")
         .pipe(harmonize_eia_epa_orispl, core_epa__assn_eia_epacamd)
-        .pipe(
-            convert_to_utc,
-            plant_utc_offset=_load_plant_utc_offset(core_eia__entity_plants),
-        )
+        .pipe(convert_to_utc, plant_utc_offset=plant_utc_offset)
         .pipe(correct_gross_load_mw)
         .pipe(apply_pudl_dtypes, group="epacems")
     )
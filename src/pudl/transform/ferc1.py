@@ -16,12 +16,16 @@ import re
 from abc import abstractmethod
 from collections import namedtuple
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Annotated, Any, Literal, Self
 
 import numpy as np
 import pandas as pd
+import scipy.sparse
 import sqlalchemy as sa
 from dagster import AssetIn, AssetsDefinition, asset
+from dagster import Field as DagsterField
 from pandas.core.groupby import DataFrameGroupBy
 from pydantic import BaseModel, Field, field_validator
 
@@ -1181,59 +1185,99 @@ def calculate_values_from_components(
         value_col: label of the column in ``data`` that contains the values to apply the
             calculations to (typically ``dollar_value`` or ``ending_balance``).
     """
-    # Merge the reported data and the calculation component metadata to enable
-    # validation of calculated values. Here the data table exploded is supplying the
-    # values associated with individual calculation components, and the table_name
-    # and xbrl_factoid to which we aggregate are coming from the calculation
-    # components table. After merging we use the weights to adjust the reported
-    # values so they can be summed directly. This gives us aggregated calculated
-    # values that can later be compared to the higher level reported values.
-
-    # infer the pks of the data by adding in the util/year
-    data_idx = calc_idx + ["utility_id_ferc1", "report_year"]
-    # we are going to merge the data onto the calc components with the _parent
-    # column names, so the groupby after the merge needs a set of by cols with the
-    # _parent suffix
-    gby_parent = [f"{col}_parent" for col in calc_idx] + [
-        "utility_id_ferc1",
-        "report_year",
-    ]
-    try:
-        calc_df = (
-            pd.merge(
-                calculation_components,
-                data,
-                validate=calc_to_data_merge_validation,
-                on=calc_idx,
-            )
-            # apply the weight from the calc to convey the sign before summing.
-            .assign(calculated_value=lambda x: x[value_col] * x.weight)
-            .groupby(gby_parent, as_index=False, dropna=False)[["calculated_value"]]
-            .sum(min_count=1)
-            .assign(is_calc=True)
-        )
-    except pd.errors.MergeError as err:  # Make debugging easier.
+    # The calculations are compiled into a sparse matrix of weights, with one row for
+    # each parent and one column for each child, both identified by their calc_idx
+    # values. The reported data is arranged into a sparse matrix of values with one
+    # row for each calc_idx and one column for each utility-year. Multiplying the two
+    # calculates every parent for every utility-year at once. This is equivalent to
+    # merging the calculation components onto the data, applying the weights and
+    # summing up each group of components, without materializing the merge.
+    entity_idx = ["utility_id_ferc1", "report_year"]
+    if calc_to_data_merge_validation == "one_to_many" and (
+        calculation_components.duplicated(calc_idx).any()
+    ):
         raise pd.errors.MergeError(
             "Merge failed, duplicated merge keys in left dataset:\n"
             f"{calculation_components[calculation_components.duplicated(calc_idx, keep=False)]}"
-        ) from err
-    # remove the _parent suffix so we can merge these calculated values back onto
-    # the data using the original pks
-    calc_df.columns = calc_df.columns.str.removesuffix("_parent")
-    calculated_df = pd.merge(
-        data,
-        calc_df,
-        on=data_idx,
-        how="outer",
-        validate="1:1",
-        indicator=True,
+        )
+    node_codes, nodes = _factorize_keys(
+        [
+            data[calc_idx],
+            calculation_components[calc_idx],
+            calculation_components[[f"{col}_parent" for col in calc_idx]],
+        ],
+        columns=calc_idx,
+    )
+    data_node, child_node, parent_node = np.split(
+        node_codes, [len(data), len(data) + len(calculation_components)]
     )
+    data_entity, entities = _factorize_keys([data[entity_idx]], columns=entity_idx)
+    data_key = data_node * len(entities) + data_entity
+    if len(np.unique(data_key)) != len(data_key):
+        raise pd.errors.MergeError(
+            "Merge keys are not unique in left dataset; not a one-to-one merge"
+        )
+
+    values = data[value_col].to_numpy(dtype=float, na_value=np.nan)
+    weights = calculation_components["weight"].to_numpy(dtype=float, na_value=np.nan)
+
+    def _calculate(w: np.ndarray, v: np.ndarray) -> scipy.sparse.coo_array:
+        weight_matrix = scipy.sparse.csr_array(
+            (w, (parent_node, child_node)), shape=(len(nodes), len(nodes))
+        )
+        value_matrix = scipy.sparse.csr_array(
+            (v, (data_node, data_entity)), shape=(len(nodes), len(entities))
+        )
+        return (weight_matrix @ value_matrix).tocoo()
+
+    # Every parent-utility-year with any reported component gets a calculated record.
+    is_calc = _calculate(np.ones(len(weights)), np.ones(len(values)))
+    calc_node, calc_entity = is_calc.row, is_calc.col
+    calc_key = calc_node.astype(np.int64) * len(entities) + calc_entity
+
+    def _gather(product: scipy.sparse.coo_array) -> np.ndarray:
+        positions, found = _find(
+            product.row.astype(np.int64) * len(entities) + product.col, calc_key
+        )
+        return np.where(found, np.append(product.data, 0.0)[positions], 0.0)
 
-    assert calculated_df[
-        (calculated_df._merge == "right_only") & (calculated_df[value_col].notnull())
-    ].empty
+    # Like sum(min_count=1), the calculated value is null if every term is null.
+    sums = _gather(_calculate(np.nan_to_num(weights), np.nan_to_num(values)))
+    counts = _gather(_calculate(np.isfinite(weights) * 1.0, np.isfinite(values) * 1.0))
+    calculated_values = np.where(counts > 0, sums, np.nan)
 
-    calculated_df = calculated_df.drop(columns=["_merge"])
+    # Find the reported records that correspond to the calculated ones, if any.
+    match, has_data = _find(data_key, calc_key)
+
+    calculated_value = np.full(len(data), np.nan)
+    calculated_value[match[has_data]] = calculated_values[has_data]
+    is_calc_col = np.zeros(len(data), dtype=bool)
+    is_calc_col[match[has_data]] = True
+    calculated_only = pd.concat(
+        [
+            nodes.iloc[calc_node[~has_data]].reset_index(drop=True),
+            entities.iloc[calc_entity[~has_data]].reset_index(drop=True),
+        ],
+        axis="columns",
+    ).assign(calculated_value=calculated_values[~has_data], is_calc=True)
+    # Merging any calculated values onto the data would turn categorical keys into
+    # objects, so they're converted in the same way.
+    categorical_keys = {
+        col: object
+        for col in calc_idx + entity_idx
+        if isinstance(data[col].dtype, pd.CategoricalDtype) and len(calc_key)
+    }
+    calculated_df = data.astype(categorical_keys).assign(
+        calculated_value=calculated_value, is_calc=is_calc_col
+    )
+    if not calculated_only.empty:
+        # Leave out all-null columns, so they don't affect the concatenated dtypes.
+        calculated_df = pd.concat(
+            [calculated_df, calculated_only.dropna(axis="columns", how="all")],
+            ignore_index=True,
+        )
+    else:
+        calculated_df = calculated_df.reset_index(drop=True)
     # Force value_col to be a float to prevent any hijinks with calculating differences.
     # Data types were very messy here, including pandas Float64 for the
     # calculated_value columns which did not work with the np.isclose(). Not sure
@@ -1263,6 +1307,46 @@ def calculate_values_from_components(
     return calculated_df
 
 
+def _find(keys: np.ndarray, targets: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Find the positions of the target values in an array of unique keys.
+
+    Returns:
+        The position of each target in ``keys``, and whether it was found at all. The
+        positions of targets that weren't found are meaningless.
+    """
+    if len(keys) == 0:
+        return np.zeros(len(targets), dtype=int), np.zeros(len(targets), dtype=bool)
+    sorter = np.argsort(keys)
+    positions = sorter[
+        np.searchsorted(keys, targets, sorter=sorter).clip(max=len(keys) - 1)
+    ]
+    return positions, keys[positions] == targets
+
+
+def _factorize_keys(
+    dfs: list[pd.DataFrame], columns: list[str]
+) -> tuple[np.ndarray, pd.DataFrame]:
+    """Assign the same integer code to the same key values across several dataframes.
+
+    Like :func:`pandas.merge`, null key values are considered equal to each other.
+
+    Args:
+        dfs: Dataframes whose columns are positionally aligned with ``columns``.
+        columns: Names to give the key columns.
+
+    Returns:
+        The codes of all of the rows of ``dfs``, concatenated in order, and a dataframe
+        of the unique keys, whose row number is their code.
+    """
+    keys = pd.concat(
+        [df.set_axis(columns, axis="columns").astype(object) for df in dfs],
+        ignore_index=True,
+    )
+    codes = keys.groupby(columns, dropna=False, sort=False).ngroup().to_numpy()
+    _, first = np.unique(codes, return_index=True)
+    return codes, keys.iloc[first].reset_index(drop=True)
+
+
 def check_calculation_metrics_by_group(
     calculated_df: pd.DataFrame,
     group_metric_checks: GroupMetricChecks,
@@ -1275,6 +1359,16 @@ def check_calculation_metrics_by_group(
     error_frequency), the tolerance for that group/test and a boolean indicating
     whether or not that metric failed to meet the tolerance.
     """
+    # Every metric is computed from the same slim frame, with the string grouping
+    # columns factorized once up front rather than once per metric.
+    calculated_df = calculated_df[
+        [
+            col
+            for col in ErrorMetric.model_fields["required_cols"].default
+            + ["row_type_xbrl"]
+            if col in calculated_df.columns
+        ]
+    ].astype({"table_name": "category", "xbrl_factoid": "category"})
     results_dfs = {}
     # for each groupby grouping: calculate metrics for each test
     # then check if each test is within acceptable tolerance levels
@@ -1394,7 +1488,11 @@ class ErrorMetric(BaseModel):
 
     @abstractmethod
     def metric(self: Self, gb: DataFrameGroupBy) -> pd.Series:
-        """Metric function that will be applied to each group of values being checked."""
+        """Metric calculated for every group of values being checked at once.
+
+        The grouped dataframe includes the ``is_not_close`` and ``abs_reported_value``
+        columns added in :meth:`apply_metric`.
+        """
         ...
 
     def is_not_close(self, df: pd.DataFrame) -> pd.Series:
@@ -1426,15 +1524,20 @@ class ErrorMetric(BaseModel):
         return gb_by
 
     def apply_metric(self: Self, df: pd.DataFrame) -> pd.Series:
-        """Generate the metric values within each group through an apply method.
+        """Generate the metric values within each group.
 
-        This method adds a column ``is_not_close`` into the df before the groupby
-        because that column is used in many of the :meth:`metric`.
+        This method adds the ``is_not_close`` and ``abs_reported_value`` columns into
+        the df before the groupby because they're used in many of the :meth:`metric`.
         """
-        # return a df instead of a series
-        df["is_not_close"] = self.is_not_close(df)
-        return df.groupby(by=self.groupby_cols()).apply(
-            self.metric, include_groups=False
+        gb_cols = self.groupby_cols()
+        return self.metric(
+            df[gb_cols + ["reported_value"]]
+            .assign(
+                is_not_close=self.is_not_close(df),
+                abs_reported_value=df["reported_value"].abs(),
+                abs_diff=df["abs_diff"].abs(),
+            )
+            .groupby(by=gb_cols, observed=True)
         )
 
     def _snake_case_metric_name(self: Self) -> str:
@@ -1454,7 +1557,9 @@ class ErrorMetric(BaseModel):
 
         metric_name = self._snake_case_metric_name()
         df = (
-            pd.DataFrame(self.apply_metric(calculated_df), columns=[metric_name])
+            self.apply_metric(calculated_df)
+            .rename(metric_name)
+            .to_frame()
             .assign(
                 **{  # totolerance_ is just for reporting so you can know of off you are
                     f"tolerance_{metric_name}": self.metric_tolerance,
@@ -1473,16 +1578,7 @@ class ErrorFrequency(ErrorMetric):
 
     def metric(self: Self, gb: DataFrameGroupBy) -> pd.Series:
         """Calculate the frequency with which records are tagged as errors."""
-        try:
-            out = gb[gb.is_not_close].shape[0] / gb.shape[0]
-        except ZeroDivisionError:
-            # Will only occur if all reported values are NaN when calculated values
-            # exist, or vice versa.
-            logger.warning(
-                "Calculated values have no corresponding reported values in this table."
-            )
-            out = np.nan
-        return out
+        return gb["is_not_close"].sum() / gb.size()
 
 
 class RelativeErrorMagnitude(ErrorMetric):
@@ -1490,11 +1586,10 @@ class RelativeErrorMagnitude(ErrorMetric):
 
     def metric(self: Self, gb: DataFrameGroupBy) -> pd.Series:
         """Calculate the mangnitude of the errors relative to total reported value."""
-        gb_value = np.nan
-        denom = gb["reported_value"].abs().sum(min_count=1)
-        if np.isclose(denom, 0) | np.isnan(denom):
-            gb_value = gb.abs_diff.abs().sum(min_count=1) / denom
-        return gb_value
+        denom = gb["abs_reported_value"].sum(min_count=1)
+        return (gb["abs_diff"].sum(min_count=1) / denom).where(
+            np.isclose(denom, 0) | denom.isna()
+        )
 
 
 class AbsoluteErrorMagnitude(ErrorMetric):
@@ -1506,7 +1601,7 @@ class AbsoluteErrorMagnitude(ErrorMetric):
 
     def metric(self: Self, gb: DataFrameGroupBy) -> pd.Series:
         """Calculate the absolute mangnitude of XBRL calculation errors."""
-        return gb.abs_diff.abs().sum()
+        return gb["abs_diff"].sum()
 
 
 class NullCalculatedValueFrequency(ErrorMetric):
@@ -1514,20 +1609,21 @@ class NullCalculatedValueFrequency(ErrorMetric):
 
     def apply_metric(self: Self, df: pd.DataFrame) -> pd.Series:
         """Only apply metric to rows that contain calculated values."""
-        return (
-            df[df.row_type_xbrl == "calculated_value"]
-            .groupby(self.groupby_cols())
-            .apply(self.metric, include_groups=False)
+        gb_cols = self.groupby_cols()
+        df = df[df.row_type_xbrl == "calculated_value"]
+        non_null_reported = df["reported_value"].notnull()
+        return self.metric(
+            df[gb_cols]
+            .assign(
+                non_null_reported=non_null_reported,
+                null_calculated=non_null_reported & df["calculated_value"].isnull(),
+            )
+            .groupby(gb_cols, observed=True)
         )
 
     def metric(self: Self, gb: DataFrameGroupBy) -> pd.Series:
         """Fraction of non-null reported values that have null corresponding calculated values."""
-        non_null_reported = gb["reported_value"].notnull()
-        null_calculated = gb["calculated_value"].isnull()
-        try:
-            return (non_null_reported & null_calculated).sum() / non_null_reported.sum()
-        except ZeroDivisionError:
-            return np.nan
+        return gb["null_calculated"].sum() / gb["non_null_reported"].sum()
 
 
 class NullReportedValueFrequency(ErrorMetric):
@@ -1535,7 +1631,7 @@ class NullReportedValueFrequency(ErrorMetric):
 
     def metric(self: Self, gb: DataFrameGroupBy) -> pd.Series:
         """Frequency with which the reported values are Null."""
-        return gb["reported_value"].isnull().sum() / gb.shape[0]
+        return (gb.size() - gb["reported_value"].count()) / gb.size()
 
 
 def add_corrections(
@@ -1935,6 +2031,12 @@ class Ferc1AbstractTableTransformer(AbstractTableTransformer):
     If ``None``, the calculations have not been instantiated. If the table has been
     instantiated but is an empty table, then there are no calculations for that table.
     """
+    concurrent_branches: bool = False
+    """Whether to process the DBF and XBRL inputs concurrently in separate threads.
+
+    The DBF and XBRL data are processed independently until they are concatenated in
+    :meth:`Ferc1AbstractTableTransformer.transform_start`.
+    """
 
     def __init__(
         self,
@@ -1943,13 +2045,17 @@ class Ferc1AbstractTableTransformer(AbstractTableTransformer):
         params: TableTransformParams | None = None,
         cache_dfs: bool = False,
         clear_cached_dfs: bool = True,
+        cache_dir: Path | None = None,
+        concurrent_branches: bool = False,
     ) -> None:
         """Augment inherited initializer to store XBRL metadata in the class."""
         super().__init__(
             params=params,
             cache_dfs=cache_dfs,
             clear_cached_dfs=clear_cached_dfs,
+            cache_dir=cache_dir,
         )
+        self.concurrent_branches = concurrent_branches
         if xbrl_metadata_json:
             xbrl_metadata_converted = self.convert_xbrl_metadata_json_to_df(
                 xbrl_metadata_json
@@ -1969,8 +2075,17 @@ class Ferc1AbstractTableTransformer(AbstractTableTransformer):
         raw_xbrl_duration: pd.DataFrame,
     ) -> pd.DataFrame:
         """Process the raw data until the XBRL and DBF inputs have been unified."""
-        processed_dbf = self.process_dbf(raw_dbf)
-        processed_xbrl = self.process_xbrl(raw_xbrl_instant, raw_xbrl_duration)
+        if self.concurrent_branches:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                dbf_future = executor.submit(self.process_dbf, raw_dbf)
+                xbrl_future = executor.submit(
+                    self.process_xbrl, raw_xbrl_instant, raw_xbrl_duration
+                )
+                processed_dbf = dbf_future.result()
+                processed_xbrl = xbrl_future.result()
+        else:
+            processed_dbf = self.process_dbf(raw_dbf)
+            processed_xbrl = self.process_xbrl(raw_xbrl_instant, raw_xbrl_duration)
         processed_dbf = self.select_dbf_rows_by_category(processed_dbf, processed_xbrl)
         logger.info(f"{self.table_id.value}: Concatenating DBF + XBRL dataframes.")
         return pd.concat([processed_dbf, processed_xbrl]).reset_index(drop=True)
@@ -6137,11 +6252,37 @@ def ferc1_transform_asset_factory(
 
     table_id = TableIdFerc1(table_name)
 
-    @asset(name=table_name, ins=ins, io_manager_key=io_manager_key)
-    def ferc1_transform_asset(**kwargs: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    @asset(
+        name=table_name,
+        ins=ins,
+        io_manager_key=io_manager_key,
+        config_schema={
+            "concurrent_branches": DagsterField(
+                bool,
+                default_value=False,
+                description=(
+                    "If True, process the DBF and XBRL inputs concurrently in "
+                    "separate threads."
+                ),
+            ),
+            "cache_dir": DagsterField(
+                str,
+                default_value="",
+                description=(
+                    "Directory in which to save the intermediate dataframes of the "
+                    "transform as parquet files, for debugging. They are deleted if "
+                    "the transform succeeds. If empty, nothing is cached."
+                ),
+            ),
+        },
+    )
+    def ferc1_transform_asset(
+        context, **kwargs: dict[str, pd.DataFrame]
+    ) -> pd.DataFrame:
         """Transform a FERC Form 1 table.
 
         Args:
+            context: dagster keyword that provides access to resources and config.
             raw_dbf: raw dbf table.
             raw_xbrl_instant: raw XBRL instant table.
             raw_xbrl_duration: raw XBRL duration table.
@@ -6152,15 +6293,17 @@ def ferc1_transform_asset_factory(
         """
         # TODO: split the key by __, then groupby, then concatenate
         _core_ferc1_xbrl__metadata_json = kwargs["_core_ferc1_xbrl__metadata_json"]
+        cache_dir = context.op_config["cache_dir"]
+        transformer_kwargs = {
+            "xbrl_metadata_json": _core_ferc1_xbrl__metadata_json[table_name],
+            "concurrent_branches": context.op_config["concurrent_branches"],
+            "cache_dfs": bool(cache_dir),
+            "cache_dir": Path(cache_dir) if cache_dir else None,
+        }
         if generic:
-            transformer = tfr_class(
-                xbrl_metadata_json=_core_ferc1_xbrl__metadata_json[table_name],
-                table_id=table_id,
-            )
+            transformer = tfr_class(table_id=table_id, **transformer_kwargs)
         else:
-            transformer = tfr_class(
-                xbrl_metadata_json=_core_ferc1_xbrl__metadata_json[table_name]
-            )
+            transformer = tfr_class(**transformer_kwargs)
 
         raw_dbf = pd.concat(
             [df for key, df in kwargs.items() if key.startswith("raw_ferc1_dbf__")]
@@ -6,9 +6,13 @@ import json
 import pathlib
 import re
 import sys
+import tempfile
+import threading
 import zipfile
 from collections import defaultdict
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Annotated, Any, Self
 from urllib.parse import ParseResult, urlparse
@@ -30,6 +34,12 @@ from pudl.workspace.setup import PudlPaths
 
 logger = pudl.logging_helpers.get_logger(__name__)
 
+DOWNLOAD_CHUNK_SIZE = 2**20
+"""Number of bytes to read from the network at a time when streaming downloads."""
+
+DEFAULT_DOWNLOAD_WORKERS = 4
+"""Default number of resources to download concurrently."""
+
 ZenodoDoi = Annotated[
     str,
     StringConstraints(
@@ -90,15 +100,27 @@ class DatapackageDescriptor:
             total_bytes += res["bytes"]
         return int(total_bytes / 1000000)
 
+    def get_resource_checksum(self, name: str) -> str:
+        """Returns the md5 checksum of the given named resource."""
+        return self._get_resource_metadata(name)["hash"]
+
     def validate_checksum(self, name: str, content: str) -> bool:
         """Returns True if content matches checksum for given named resource."""
-        expected_checksum = self._get_resource_metadata(name)["hash"]
         m = hashlib.md5()  # noqa: S324 Unfortunately md5 is required by Zenodo
         m.update(content)
-        if m.hexdigest() != expected_checksum:
+        self.validate_md5(name, m.hexdigest())
+
+    def validate_md5(self, name: str, md5: str) -> None:
+        """Raises ChecksumMismatchError if md5 doesn't match the named resource's hash.
+
+        This lets callers that hash content incrementally (e.g. while streaming it to
+        disk) validate it without holding it in memory.
+        """
+        expected_checksum = self.get_resource_checksum(name)
+        if md5 != expected_checksum:
             raise ChecksumMismatchError(
                 f"Checksum for resource {name} does not match."
-                f"Expected {expected_checksum}, got {m.hexdigest()}"
+                f"Expected {expected_checksum}, got {md5}"
             )
 
     def _matches(self, res: dict, **filters: Any):
@@ -239,6 +261,7 @@ class ZenodoFetcher:
         self.http.mount("http://", adapter)
         self.http.mount("https://", adapter)
         self._descriptor_cache = {}
+        self._descriptor_lock = threading.Lock()
 
     def get_doi(self: Self, dataset: str) -> ZenodoDoi:
         """Returns DOI for given dataset."""
@@ -269,9 +292,11 @@ class ZenodoFetcher:
             raise ValueError(f"Invalid Zenodo DOI: {doi}")
         return f"{api_root}/records/{zenodo_id}/files"
 
-    def _fetch_from_url(self: Self, url: HttpUrl) -> requests.Response:
+    def _fetch_from_url(
+        self: Self, url: HttpUrl, stream: bool = False
+    ) -> requests.Response:
         logger.info(f"Retrieving {url} from zenodo")
-        response = self.http.get(url, timeout=self.timeout)
+        response = self.http.get(url, timeout=self.timeout, stream=stream)
         if response.status_code == requests.codes.ok:
             logger.debug(f"Successfully downloaded {url}")
             return response
@@ -280,19 +305,22 @@ class ZenodoFetcher:
     def get_descriptor(self: Self, dataset: str) -> DatapackageDescriptor:
         """Returns class:`DatapackageDescriptor` for given dataset."""
         doi = self.get_doi(dataset)
-        if doi not in self._descriptor_cache:
-            dpkg = self._fetch_from_url(self._get_url(doi))
-            for f in dpkg.json()["entries"]:
-                if f["key"] == "datapackage.json":
-                    resp = self._fetch_from_url(f["links"]["content"])
-                    self._descriptor_cache[doi] = DatapackageDescriptor(
-                        resp.json(), dataset=dataset, doi=doi
+        # Resources may be downloaded from several threads at once, and they should
+        # share a single request for the descriptor.
+        with self._descriptor_lock:
+            if doi not in self._descriptor_cache:
+                dpkg = self._fetch_from_url(self._get_url(doi))
+                for f in dpkg.json()["entries"]:
+                    if f["key"] == "datapackage.json":
+                        resp = self._fetch_from_url(f["links"]["content"])
+                        self._descriptor_cache[doi] = DatapackageDescriptor(
+                            resp.json(), dataset=dataset, doi=doi
+                        )
+                        break
+                else:
+                    raise RuntimeError(
+                        f"Zenodo datapackage for {dataset}/{doi} does not contain valid datapackage.json"
                     )
-                    break
-            else:
-                raise RuntimeError(
-                    f"Zenodo datapackage for {dataset}/{doi} does not contain valid datapackage.json"
-                )
         return self._descriptor_cache[doi]
 
     def get_resource(self: Self, res: PudlResourceKey) -> bytes:
@@ -303,6 +331,29 @@ class ZenodoFetcher:
         desc.validate_checksum(res.name, content)
         return content
 
+    def download_resource(self: Self, res: PudlResourceKey, path: Path) -> None:
+        """Stream the contents of a resource from zenodo into a file.
+
+        The response is written to disk in chunks of :data:`DOWNLOAD_CHUNK_SIZE` bytes
+        and hashed as it arrives, so the resource never has to fit in memory.
+
+        Args:
+            res: the resource to download.
+            path: the file to write the resource to.
+
+        Raises:
+            ChecksumMismatchError: if the downloaded file doesn't match the checksum
+                in the datapackage descriptor.
+        """
+        desc = self.get_descriptor(res.dataset)
+        url = desc.get_resource_path(res.name)
+        m = hashlib.md5()  # noqa: S324 Unfortunately md5 is required by Zenodo
+        with self._fetch_from_url(url, stream=True) as response, path.open("wb") as f:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                m.update(chunk)
+                f.write(chunk)
+        desc.validate_md5(res.name, m.hexdigest())
+
 
 class Datastore:
     """Handle connections and downloading of Zenodo Source archives."""
@@ -325,11 +376,16 @@ class Datastore:
             timeout: connection timeouts (in seconds) to use when connecting
                 to Zenodo servers.
         """
+        self._init_args = (local_cache_path, gcs_cache_path, timeout)
         self._cache = resource_cache.LayeredCache()
         self._datapackage_descriptors: dict[str, DatapackageDescriptor] = {}
+        # Downloads are staged next to the local cache so that moving them into it is
+        # a cheap, atomic rename.
+        self._download_dir: Path | None = None
 
         if local_cache_path:
             logger.info(f"Adding local cache layer at {local_cache_path}")
+            self._download_dir = Path(local_cache_path)
             self._cache.add_cache_layer(resource_cache.LocalFileCache(local_cache_path))
         if gcs_cache_path:
             try:
@@ -345,6 +401,14 @@ class Datastore:
 
         self._zenodo_fetcher = ZenodoFetcher(timeout=timeout)
 
+    def __reduce__(self):
+        """Pickle a Datastore as the arguments needed to construct it again.
+
+        GCS clients and HTTP sessions can't be pickled, so a Datastore that is sent to
+        another process (e.g. to extract data in parallel) reconnects to its caches.
+        """
+        return (self.__class__, self._init_args)
+
     def get_known_datasets(self) -> list[str]:
         """Returns list of supported datasets."""
         return self._zenodo_fetcher.get_known_datasets()
@@ -399,11 +463,100 @@ class Datastore:
                     self._cache.add(res, contents)
                 yield (res, contents)
             elif not cached_only:
+                contents = self._download_resource(res, read=True)
                 logger.info(f"Retrieved {res} from zenodo.")
-                contents = self._zenodo_fetcher.get_resource(res)
-                self._cache.add(res, contents)
                 yield (res, contents)
 
+    def _download_resource(
+        self, res: PudlResourceKey, read: bool = False
+    ) -> bytes | None:
+        """Stream a resource from zenodo into the closest writable cache layer.
+
+        Args:
+            res: the resource to download.
+            read: if True, also read the downloaded resource and return its contents.
+        """
+        with self._temporary_path(res) as path:
+            self._zenodo_fetcher.download_resource(res, path)
+            contents = path.read_bytes() if read else None
+            self._cache.add_file(res, path)
+        return contents
+
+    def _copy_cached_resource(self, res: PudlResourceKey) -> None:
+        """Copy a resource from a farther cache layer into the closest writable one.
+
+        The resource is copied through a temporary file and checked against the md5
+        in its datapackage descriptor, so it never has to fit in memory.
+
+        Raises:
+            ChecksumMismatchError: if the cached copy doesn't match the checksum in the
+                datapackage descriptor.
+        """
+        logger.info(f"{res} was not optimally cached yet, adding.")
+        with self._temporary_path(res) as path:
+            self._cache.get_file(res, path)
+            with path.open("rb") as f:
+                md5 = hashlib.file_digest(f, "md5").hexdigest()
+            self.get_datapackage_descriptor(res.dataset).validate_md5(res.name, md5)
+            self._cache.add_file(res, path)
+
+    @contextmanager
+    def _temporary_path(self, res: PudlResourceKey) -> Iterator[Path]:
+        """A temporary path to stage a resource at before adding it to the cache.
+
+        It is next to the local cache if there is one, so that moving the file into it
+        is a cheap, atomic rename.
+        """
+        if self._download_dir:
+            self._download_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(
+            dir=self._download_dir, prefix=".download-"
+        ) as tmp_dir:
+            yield Path(tmp_dir) / res.name
+
+    def _cache_resource(self, res: PudlResourceKey) -> None:
+        """Make sure a resource is in the closest writable cache layer."""
+        if self._cache.contains(res):
+            self._copy_cached_resource(res)
+        else:
+            self._download_resource(res)
+
+    def cache_resources(
+        self,
+        dataset: str,
+        max_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+        **filters: Any,
+    ) -> list[PudlResourceKey]:
+        """Download matching resources that aren't optimally cached yet.
+
+        Unlike :meth:`get_resources`, this doesn't return the contents of the resources,
+        so they are streamed straight from zenodo to disk, several at a time.
+
+        Args:
+            dataset: name of the dataset to query.
+            max_workers: the maximum number of resources to download concurrently.
+            filters (key=val): only cache resources that match the key-value mapping in
+                their metadata["parts"].
+
+        Returns:
+            The resources that were added to the cache.
+        """
+        desc = self.get_datapackage_descriptor(dataset)
+        resources = []
+        for res in desc.get_resources(**filters):
+            if self._cache.is_optimally_cached(res):
+                logger.info(f"{res} is already optimally cached.")
+            else:
+                resources.append(res)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._cache_resource, res): res for res in resources
+            }
+            for future in as_completed(futures):
+                future.result()
+                logger.info(f"Retrieved {futures[future]}.")
+        return resources
+
     def remove_from_cache(self, res: PudlResourceKey) -> None:
         """Remove given resource from the associated cache."""
         self._cache.delete(res)
@@ -421,14 +574,89 @@ class Datastore:
             return content
         raise KeyError(f"Multiple resources found for {dataset}: {filters}")
 
+    def _get_resource_file(self, res: PudlResourceKey) -> Path | io.BytesIO:
+        """Make sure a resource is cached and return something that can be opened.
+
+        If the resource is in the local cache, its path is returned so that it can be
+        read lazily. Otherwise its contents are loaded into memory.
+        """
+        if not self._cache.contains(res):
+            # Without a local cache, there's nowhere to keep the download on disk.
+            contents = self._download_resource(res, read=self._download_dir is None)
+            logger.info(f"Retrieved {res} from zenodo.")
+            if contents is not None:
+                return io.BytesIO(contents)
+        elif not self._cache.is_optimally_cached(res):
+            self._copy_cached_resource(res)
+        if path := self._cache.get_path(res):
+            return path
+        return io.BytesIO(self._cache.get(res))
+
+    def get_resource_files(
+        self, dataset: str, **filters: Any
+    ) -> Iterator[tuple[PudlResourceKey, Path | io.BytesIO]]:
+        """Return files holding the content of the matching resources.
+
+        Unlike :meth:`get_resources`, resources that are in the local cache are not
+        read into memory. Their paths are returned instead, so that they can be opened
+        and read lazily, e.g. by :class:`zipfile.ZipFile`.
+
+        Args:
+            dataset: name of the dataset to query.
+            filters (key=val): only return resources that match the key-value mapping in
+                their metadata["parts"].
+
+        Yields:
+            (PudlResourceKey, pathlib.Path or io.BytesIO) for each matching resource.
+        """
+        desc = self.get_datapackage_descriptor(dataset)
+        for res in desc.get_resources(**filters):
+            yield (res, self._get_resource_file(res))
+
+    def _get_unique_resource_key(self, dataset: str, **filters: Any) -> PudlResourceKey:
+        desc = self.get_datapackage_descriptor(dataset)
+        resources = list(desc.get_resources(**filters))
+        if not resources:
+            raise KeyError(f"No resources found for {dataset}: {filters}")
+        if len(resources) > 1:
+            raise KeyError(f"Multiple resources found for {dataset}: {filters}")
+        return resources[0]
+
+    def get_unique_resource_file(
+        self, dataset: str, **filters: Any
+    ) -> Path | io.BytesIO:
+        """Returns a file holding the only resource that matches the filters."""
+        return self._get_resource_file(
+            self._get_unique_resource_key(dataset, **filters)
+        )
+
+    def get_unique_resource_checksum(self, dataset: str, **filters: Any) -> str:
+        """Returns the md5 checksum of the only resource that matches the filters.
+
+        The checksum comes from the datapackage descriptor, so the resource itself is
+        not retrieved.
+        """
+        res = self._get_unique_resource_key(dataset, **filters)
+        return self.get_datapackage_descriptor(dataset).get_resource_checksum(res.name)
+
     def get_zipfile_resource(self, dataset: str, **filters: Any) -> zipfile.ZipFile:
-        """Retrieves unique resource and opens it as a ZipFile."""
-        resource_bytes = self.get_unique_resource(dataset, **filters)
-        resource = io.BytesIO(resource_bytes)
-        md5sum = hashlib.file_digest(resource, "md5").hexdigest()
+        """Retrieves unique resource and opens it as a ZipFile.
+
+        Resources in the local cache are opened from disk, so only the parts of the
+        archive that are actually read are loaded into memory.
+        """
+        res = self._get_unique_resource_key(dataset, **filters)
+        resource = self._get_resource_file(res)
+        if isinstance(resource, Path):
+            # Read from the checksum recorded when the file was cached.
+            md5sum = self._cache.get_md5(res)
+            size = resource.stat().st_size
+        else:
+            md5sum = hashlib.file_digest(resource, "md5").hexdigest()
+            size = resource.getbuffer().nbytes
         logger.info(
             f"Got resource {dataset=}, {filters=}, {md5sum=}, "
-            f"{len(resource_bytes)} bytes; turning into ZipFile"
+            f"{size} bytes; turning into ZipFile"
         )
         return retry(zipfile.ZipFile, retry_on=(zipfile.BadZipFile), file=resource)
 
@@ -436,7 +664,7 @@ class Datastore:
         self, dataset: str, **filters: Any
     ) -> Iterator[tuple[PudlResourceKey, zipfile.ZipFile]]:
         """Iterates over resources that match filters and opens each as ZipFile."""
-        for resource_key, content in self.get_resources(dataset, **filters):
+        for resource_key, content in self.get_resource_files(dataset, **filters):
             yield (
                 resource_key,
                 retry(zipfile.ZipFile, retry_on=(zipfile.BadZipFile), file=content),
@@ -497,19 +725,15 @@ def fetch_resources(
     dstore: Datastore,
     datasets: list[str],
     partition: dict[str, int | str],
-    gcs_cache_path: str,
-    bypass_local_cache: bool,
+    max_workers: int = DEFAULT_DOWNLOAD_WORKERS,
 ) -> None:
-    """Retrieve all matching resources and store them in the cache."""
+    """Retrieve all matching resources and store them in the cache.
+
+    Resources are copied from the GCS cache into the local cache if they are there, and
+    otherwise downloaded from zenodo, up to ``max_workers`` at a time.
+    """
     for single_ds in datasets:
-        for res, contents in dstore.get_resources(
-            single_ds, skip_optimally_cached=True, **partition
-        ):
-            logger.info(f"Retrieved {res}.")
-            # If the gcs_cache_path is specified and we don't want
-            # to bypass the local cache, populate the local cache.
-            if gcs_cache_path and not bypass_local_cache:
-                dstore._cache.add(res, contents)
+        dstore.cache_resources(single_ds, max_workers=max_workers, **partition)
 
 
 def _parse_key_values(
@@ -596,6 +820,14 @@ def _parse_key_values(
         "project to pay data egress costs."
     ),
 )
+@click.option(
+    "-w",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=DEFAULT_DOWNLOAD_WORKERS,
+    show_default=True,
+    help="Number of resources to download concurrently.",
+)
 @click.option(
     "--logfile",
     help="If specified, write logs to this file.",
@@ -619,6 +851,7 @@ def pudl_datastore(
     partition: dict[str, int | str],
     gcs_cache_path: str,
     bypass_local_cache: bool,
+    workers: int,
     logfile: pathlib.Path,
     loglevel: str,
 ):
@@ -667,8 +900,7 @@ def pudl_datastore(
             dstore=dstore,
             datasets=dataset,
             partition=partition,
-            gcs_cache_path=gcs_cache_path,
-            bypass_local_cache=bypass_local_cache,
+            max_workers=workers,
         )
 
     return 0
@@ -1,5 +1,8 @@
 """Implementations of datastore resource caches."""
 
+import hashlib
+import shutil
+import tempfile
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, NamedTuple
@@ -72,6 +75,36 @@ class AbstractCache(ABC):
     def add(self, resource: PudlResourceKey, content: bytes) -> None:
         """Adds resource to the cache and sets the content."""
 
+    def add_file(self, resource: PudlResourceKey, path: Path) -> None:
+        """Adds resource to the cache, taking its content from a file.
+
+        Caches that can do better than reading the whole file into memory should
+        override this. The file may be moved into the cache, so callers should not
+        expect it to still exist afterwards.
+        """
+        self.add(resource, path.read_bytes())
+
+    def get_path(self, resource: PudlResourceKey) -> Path | None:
+        """Returns a local path holding the content of the resource, if there is one.
+
+        Caches that keep resources on the local filesystem should override this so
+        that readers can open and seek within the file instead of loading it into
+        memory. Other caches return None.
+        """
+        return None
+
+    def get_file(self, resource: PudlResourceKey, path: Path) -> None:
+        """Writes the content of the given resource to a file.
+
+        Caches that can do better than reading the whole resource into memory should
+        override this.
+        """
+        path.write_bytes(self.get(resource))
+
+    def get_md5(self, resource: PudlResourceKey) -> str:
+        """Returns the md5 checksum of the content of the given resource."""
+        return hashlib.md5(self.get(resource)).hexdigest()  # noqa: S324
+
     @abstractmethod
     def delete(self, resource: PudlResourceKey) -> None:
         """Removes the resource from cache."""
@@ -82,7 +115,12 @@ class AbstractCache(ABC):
 
 
 class LocalFileCache(AbstractCache):
-    """Simple key-value store mapping PudlResourceKeys to ByteIO contents."""
+    """Simple key-value store mapping PudlResourceKeys to ByteIO contents.
+
+    Next to each resource, the md5 checksum of its contents is stored in a hidden
+    sidecar file, so that it is computed once when the resource is added rather than
+    every time it is read.
+    """
 
     def __init__(self, cache_root_dir: Path, **kwargs: Any):
         """Constructs LocalFileCache that stores resources under cache_root_dir."""
@@ -92,22 +130,95 @@ class LocalFileCache(AbstractCache):
     def _resource_path(self, resource: PudlResourceKey) -> Path:
         return self.cache_root_dir / resource.get_local_path()
 
+    def _md5_path(self, resource: PudlResourceKey) -> Path:
+        path = self._resource_path(resource)
+        return path.with_name(f".{path.name}.md5")
+
+    def _temporary_path(self, dest: Path) -> Path:
+        """Create an empty temporary file next to dest, to be renamed onto it."""
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=dest.parent, prefix=f".{dest.name}.", delete=False
+        ) as file:
+            return Path(file.name)
+
+    def _install(self, resource: PudlResourceKey, tmp_path: Path) -> None:
+        """Atomically rename a complete file into the cache and record its checksum."""
+        with tmp_path.open("rb") as file:
+            md5 = hashlib.file_digest(file, "md5").hexdigest()
+        # Drop the old checksum first, so it can never describe the new content.
+        self._md5_path(resource).unlink(missing_ok=True)
+        tmp_path.replace(self._resource_path(resource))
+        self._write_md5(resource, md5)
+
+    def _write_md5(self, resource: PudlResourceKey, md5: str) -> None:
+        md5_path = self._md5_path(resource)
+        tmp_path = self._temporary_path(md5_path)
+        tmp_path.write_text(md5)
+        tmp_path.replace(md5_path)
+
     def get(self, resource: PudlResourceKey) -> bytes:
         """Retrieves value associated with a given resource."""
         with self._resource_path(resource).open("rb") as res:
             logger.debug(f"Getting {resource} from local file cache.")
             return res.read()
 
+    def get_file(self, resource: PudlResourceKey, path: Path) -> None:
+        """Copies the cached resource to a file."""
+        shutil.copyfile(self._resource_path(resource), path)
+
+    def get_path(self, resource: PudlResourceKey) -> Path | None:
+        """Returns the path of the cached resource, or None if it isn't cached."""
+        path = self._resource_path(resource)
+        return path if path.exists() else None
+
+    def get_md5(self, resource: PudlResourceKey) -> str:
+        """Returns the md5 checksum of a cached resource.
+
+        The checksum is read from the sidecar file written when the resource was added.
+        Resources cached before sidecar files existed are hashed once, and their
+        checksum is stored for next time unless the cache is read only.
+        """
+        try:
+            return self._md5_path(resource).read_text()
+        except FileNotFoundError:
+            pass
+        with self._resource_path(resource).open("rb") as file:
+            md5 = hashlib.file_digest(file, "md5").hexdigest()
+        if not self.is_read_only():
+            self._write_md5(resource, md5)
+        return md5
+
     def add(self, resource: PudlResourceKey, content: bytes):
         """Adds (or updates) resource to the cache with given value."""
         logger.debug(f"Adding {resource} to {self._resource_path}")
         if self.is_read_only():
             logger.debug(f"Read only cache: ignoring set({resource})")
             return
-        path = self._resource_path(resource)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("wb") as file:
-            file.write(content)
+        tmp_path = self._temporary_path(self._resource_path(resource))
+        try:
+            tmp_path.write_bytes(content)
+            self._install(resource, tmp_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def add_file(self, resource: PudlResourceKey, path: Path):
+        """Moves a file into the cache as the content of the given resource.
+
+        The file is first moved next to its final location in the cache (which copies
+        it if it lives on another filesystem) and then atomically renamed, so readers
+        never see a partially written resource.
+        """
+        logger.debug(f"Moving {path} to {self._resource_path(resource)}")
+        if self.is_read_only():
+            logger.debug(f"Read only cache: ignoring set({resource})")
+            return
+        tmp_path = self._temporary_path(self._resource_path(resource))
+        try:
+            shutil.move(path, tmp_path)
+            self._install(resource, tmp_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
 
     def delete(self, resource: PudlResourceKey):
         """Deletes resource from the cache."""
@@ -115,6 +226,7 @@ class LocalFileCache(AbstractCache):
             logger.debug(f"Read only cache: ignoring delete({resource})")
             return
         self._resource_path(resource).unlink(missing_ok=True)
+        self._md5_path(resource).unlink(missing_ok=True)
 
     def contains(self, resource: PudlResourceKey) -> bool:
         """Returns True if resource is present in the cache."""
@@ -153,11 +265,21 @@ class GoogleCloudStorageCache(AbstractCache):
         logger.debug(f"Getting {resource} from {self._blob.__name__}")
         return self._blob(resource).download_as_bytes(retry=gcs_retry)
 
+    def get_file(self, resource: PudlResourceKey, path: Path) -> None:
+        """Downloads the given resource to a file."""
+        logger.debug(f"Downloading {resource} from {self._blob.__name__}")
+        self._blob(resource).download_to_filename(path, retry=gcs_retry)
+
     def add(self, resource: PudlResourceKey, value: bytes):
         """Adds (or updates) resource to the cache with given value."""
         logger.debug(f"Adding {resource} to {self._blob.__name__}")
         return self._blob(resource).upload_from_string(value)
 
+    def add_file(self, resource: PudlResourceKey, path: Path):
+        """Uploads a file as the content of the given resource."""
+        logger.debug(f"Uploading {path} to {self._blob.__name__}")
+        return self._blob(resource).upload_from_filename(path)
+
     def delete(self, resource: PudlResourceKey):
         """Deletes resource from the cache."""
         self._blob(resource).delete()
@@ -210,6 +332,24 @@ class LayeredCache(AbstractCache):
         logger.debug(f"get:{resource} not found in the layered cache.")
         raise KeyError(f"{resource} not found in the layered cache")
 
+    def _layer_containing(self, resource: PudlResourceKey) -> AbstractCache:
+        for cache in self._caches:
+            if cache.contains(resource):
+                return cache
+        raise KeyError(f"{resource} not found in the layered cache")
+
+    def get_file(self, resource: PudlResourceKey, path: Path) -> None:
+        """Writes the resource from the first layer containing it to a file."""
+        self._layer_containing(resource).get_file(resource, path)
+
+    def get_path(self, resource: PudlResourceKey) -> Path | None:
+        """Returns the local path of the resource from the first layer containing it."""
+        return self._layer_containing(resource).get_path(resource)
+
+    def get_md5(self, resource: PudlResourceKey) -> str:
+        """Returns the md5 checksum of the resource from the first layer containing it."""
+        return self._layer_containing(resource).get_md5(resource)
+
     def add(self, resource: PudlResourceKey, value):
         """Adds (or replaces) resource into the cache with given value."""
         if self.is_read_only():
@@ -225,6 +365,18 @@ class LayeredCache(AbstractCache):
             )
             break
 
+    def add_file(self, resource: PudlResourceKey, path: Path):
+        """Adds (or replaces) resource into the cache, taking its content from a file."""
+        if self.is_read_only():
+            logger.debug(f"Read only cache: ignoring set({resource})")
+            return
+        for cache_layer in self._caches:
+            if cache_layer.is_read_only():
+                continue
+            logger.debug(f"Adding {resource} to cache {cache_layer.__class__.__name__}")
+            cache_layer.add_file(resource, path)
+            break
+
     def delete(self, resource: PudlResourceKey):
         """Removes resource from the cache if the cache is not in the read_only mode."""
         if self.is_read_only():
@@ -460,3 +460,53 @@ def test_identify_retiring_generators():
     )
     out = allocate_gen_fuel.identify_retiring_generators(gena_retiring)
     pd.testing.assert_frame_equal(expected_retiring, out, check_exact=False)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_allocate_gen_fuel_partitions_match(base_case, workers):
+    """Allocating groups of plants separately should give the same results."""
+    inputs = {
+        "gf": base_case.gf_eia923(),
+        "bf": base_case.bf_eia923(),
+        "gen": base_case.gen_eia923(),
+        "bga": base_case.bga_eia860(),
+        "gens": base_case.gens_eia860(),
+    }
+    # Make copies of the base case plant with different IDs and amounts of data
+    inputs = {
+        name: pd.concat(
+            [
+                df.assign(plant_id_eia=df.plant_id_eia + i).pipe(
+                    lambda x, scale=i + 1: x.assign(
+                        **{
+                            col: x[col] * scale
+                            for col in x.columns
+                            if col in allocate_gen_fuel.DATA_COLUMNS
+                        }
+                    )
+                )
+                for i in range(10)
+            ],
+            ignore_index=True,
+        )
+        for name, df in inputs.items()
+    }
+    gf, bf, gen, bga, gens = allocate_gen_fuel.select_input_data(**inputs)
+    allocated = allocate_gen_fuel.allocate_gen_fuel_by_generator_energy_source(
+        gf=gf, bf=bf, gen=gen, bga=bga, gens=gens, freq=base_case.freq
+    )
+    partitioned = allocate_gen_fuel.allocate_gen_fuel_by_generator_energy_source(
+        gf=gf,
+        # A plant's records end up in the same group regardless of the ID dtype.
+        bf=bf.astype({"plant_id_eia": "float64"}),
+        gen=gen,
+        bga=bga,
+        gens=gens,
+        freq=base_case.freq,
+        partitions=4,
+        workers=workers,
+    )
+    assert allocated.plant_id_eia.nunique() == 10
+    pd.testing.assert_frame_equal(
+        allocated.reset_index(drop=True), partitioned.reset_index(drop=True)
+    )
@@ -0,0 +1,153 @@
+"""Tests for the FERC1 to EIA splink record linkage model."""
+
+import jellyfish
+import numpy as np
+import pandas as pd
+import pytest
+
+from pudl.analysis.record_linkage import eia_ferc1_record_linkage as rl
+
+
+@pytest.fixture
+def linkage_inputs() -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Prepared EIA and FERC records of a few synthetic plants, and training labels."""
+    rng = np.random.default_rng(7)
+    syllables = ["ka", "lo", "mi", "ra", "ten", "vo", "su", "pe", "dan", "ri"]
+    plant_names = ["".join(rng.choice(syllables, 3)) for _ in range(40)]
+    utility_names = ["".join(rng.choice(syllables, 2)) for _ in range(10)]
+    df = pd.DataFrame(
+        {
+            "plant": np.tile(np.arange(40), 3),
+            "report_year": np.repeat([2020, 2021, 2022], 40),
+        }
+    ).assign(
+        plant_name=lambda x: x.plant.map(dict(enumerate(plant_names))),
+        utility_name=lambda x: (x.plant % 10).map(dict(enumerate(utility_names))),
+        fuel_type_code_pudl=lambda x: rng.choice(["coal", "gas", "hydro"], len(x)),
+        installation_year=lambda x: pd.to_datetime(1960 + x.plant, format="%Y"),
+        construction_year=lambda x: pd.to_datetime(1958 + x.plant, format="%Y"),
+        capacity_mw=lambda x: 10.0 + x.plant,
+        net_generation_mwh=lambda x: rng.integers(1000, 5000, len(x)).astype(float),
+        plant_id_pudl=lambda x: x.plant,
+        utility_id_pudl=lambda x: x.plant % 10,
+        plant_name_mphone=lambda x: x.plant_name.map(jellyfish.metaphone),
+        utility_name_mphone=lambda x: x.utility_name.map(jellyfish.metaphone),
+    )
+    eia_df = df.assign(
+        record_id="eia_" + df.plant.astype(str) + df.report_year.astype(str)
+    )
+    ferc_df = df.sample(frac=0.5, random_state=0).assign(
+        record_id=lambda x: "ferc_" + x.plant.astype(str) + x.report_year.astype(str)
+    )
+    cols = rl.ID_COL + rl.MATCHING_COLS + rl.EXTRA_COLS
+    train_df = pd.DataFrame(
+        {
+            "record_id_l": "eia_" + ferc_df.record_id.str[5:],
+            "record_id_r": ferc_df.record_id,
+            "source_dataset_r": "ferc_df",
+            "source_dataset_l": "eia_df",
+            "clerical_match_score": 1,
+        }
+    ).head(20)
+    return eia_df[cols], ferc_df[cols].reset_index(drop=True), train_df
+
+
+def _sorted(preds_df: pd.DataFrame) -> pd.DataFrame:
+    return preds_df.sort_values(["record_id_l", "record_id_r"]).reset_index(drop=True)
+
+
+def test_incremental_predictions_with_cached_model(
+    linkage_inputs, tmp_path, monkeypatch
+):
+    """Only changed years should be predicted, matching predictions of all years."""
+    eia_df, ferc_df, train_df = linkage_inputs
+    trained = []
+    # Use the model's default parameters rather than estimating them.
+    monkeypatch.setattr(rl, "_train_model", lambda linker, df: trained.append(df))
+    config = rl.SplinkModelConfig(splink_cache_dir=str(tmp_path), incremental=True)
+
+    first_preds = rl._predict_with_cached_model(config, eia_df, ferc_df, train_df, 0.5)
+    assert not first_preds.empty
+    assert len(list(tmp_path.glob("predictions_*/*.parquet"))) == 3
+
+    changed_eia_df = eia_df.assign(
+        capacity_mw=eia_df.capacity_mw.where(eia_df.report_year != 2022, 1.0)
+    )
+    year_files = {
+        path.name: path.stat().st_mtime_ns
+        for path in tmp_path.glob("predictions_*/*.parquet")
+    }
+    incremental_preds = rl._predict_with_cached_model(
+        config, changed_eia_df, ferc_df, train_df, 0.5
+    )
+    # Only the changed year's predictions were replaced.
+    updated_files = {
+        path.name: path.stat().st_mtime_ns
+        for path in tmp_path.glob("predictions_*/*.parquet")
+    }
+    assert len(updated_files) == 3
+    assert len(set(updated_files.items()) - set(year_files.items())) == 1
+    assert len(trained) == 1
+
+    full_preds = rl._predict_with_cached_model(
+        rl.SplinkModelConfig(splink_cache_dir=str(tmp_path)),
+        changed_eia_df,
+        ferc_df,
+        train_df,
+        0.5,
+    )
+    pd.testing.assert_frame_equal(_sorted(incremental_preds), _sorted(full_preds))
+    assert not _sorted(first_preds).equals(_sorted(full_preds))
+
+    # Changing the training data invalidates the cached model.
+    rl._predict_with_cached_model(config, eia_df, ferc_df, train_df.head(10), 0.5)
+    assert len(trained) == 2
+    assert len(list(tmp_path.glob("splink_model_*.json"))) == 2
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        pytest.param(
+            lambda df: df.assign(
+                fuel_type_code_pudl=df.fuel_type_code_pudl.where(
+                    df.report_year != 2022, "coal"
+                )
+            ),
+            id="term_frequencies",
+        ),
+        pytest.param(
+            lambda df: pd.concat(
+                [df, df[df.report_year == 2022].assign(report_year=2023)]
+            ),
+            id="new_year",
+        ),
+    ],
+)
+def test_incremental_predictions_with_changed_scores(
+    linkage_inputs, tmp_path, monkeypatch, change
+):
+    """Changes that affect the scores of every year should predict every year again."""
+    eia_df, ferc_df, train_df = linkage_inputs
+    monkeypatch.setattr(rl, "_train_model", lambda linker, df: None)
+    config = rl.SplinkModelConfig(splink_cache_dir=str(tmp_path), incremental=True)
+    rl._predict_with_cached_model(config, eia_df, ferc_df, train_df, 0.5)
+
+    changed_eia_df = change(eia_df).assign(
+        record_id=lambda x: "eia_"
+        + x.plant_id_pudl.astype(str)
+        + x.report_year.astype(str)
+    )
+    incremental_preds = rl._predict_with_cached_model(
+        config, changed_eia_df, ferc_df, train_df, 0.5
+    )
+    full_preds = rl._predict_with_cached_model(
+        rl.SplinkModelConfig(splink_cache_dir=str(tmp_path / "full")),
+        changed_eia_df,
+        ferc_df,
+        train_df,
+        0.5,
+    )
+    pd.testing.assert_frame_equal(_sorted(incremental_preds), _sorted(full_preds))
+    # Predictions made with the old term frequencies or prior are cleaned up.
+    assert len(list(tmp_path.glob("predictions_*"))) == 1
@@ -0,0 +1,86 @@
+"""Tests for the cross-year record linkage steps."""
+
+import numpy as np
+import pandas as pd
+import pytest
+import scipy.sparse
+
+from pudl.analysis.ml_tools.experiment_tracking import (
+    ExperimentTracker,
+    ExperimentTrackerConfig,
+)
+from pudl.analysis.record_linkage import link_cross_year
+from pudl.analysis.record_linkage.embed_dataframe import FeatureMatrix
+
+
+@pytest.fixture(scope="module")
+def records() -> tuple[np.ndarray, pd.DataFrame]:
+    """Noisy yearly records of a few dozen synthetic plants."""
+    rng = np.random.default_rng(42)
+    centers = rng.normal(scale=0.6, size=(30, 6))
+    plants = np.repeat(np.arange(30), 12)
+    report_years = np.tile(np.arange(2010, 2022), 30)
+    keep = rng.random(len(plants)) < 0.8
+    features = centers[plants[keep]] + rng.normal(scale=0.2, size=(keep.sum(), 6))
+    return features, pd.DataFrame({"report_year": report_years[keep]})
+
+
+@pytest.mark.parametrize("sparse_features", [False, True])
+def test_sparse_distance_matrix_matches_dense(records, sparse_features):
+    """The sparse backend should compute the same distances the dense one stores."""
+    features, df = records
+    if sparse_features:
+        features = scipy.sparse.csr_matrix(np.where(features > 0, features, 0))
+    config = link_cross_year.PenalizeReportYearDistanceConfig(distance_penalty=100.0)
+    dense = link_cross_year.DistanceMatrix(features, df, config)
+    sparse = link_cross_year.SparseDistanceMatrix(features, df, config)
+
+    np.testing.assert_array_equal(
+        sparse.radius_neighbors_graph(0.5).toarray(),
+        dense.radius_neighbors_graph(0.5).toarray(),
+    )
+    cluster_inds = np.array([3, 17, 40, 41, 200])
+    np.testing.assert_allclose(
+        sparse.cluster_distance_matrix(cluster_inds),
+        dense.cluster_distance_matrix(cluster_inds),
+        rtol=1e-6,
+    )
+    cluster_groups = [np.array([0]), np.array([5, 9, 11]), np.arange(20, 60)]
+    np.testing.assert_allclose(
+        sparse.average_distance_matrix(cluster_groups),
+        dense.average_distance_matrix(cluster_groups),
+        rtol=1e-6,
+    )
+
+
+def test_link_ids_cross_year_sparse(records):
+    """Both distance backends should assign the same IDs."""
+    features, df = records
+    feature_matrix = FeatureMatrix(matrix=features, index=df.index)
+    tracker = ExperimentTracker(
+        tracker_config=ExperimentTrackerConfig(),
+        run_id="",
+        experiment_name="link_cross_year_test",
+    )
+    id_year_dfs = []
+    for sparse in [False, True]:
+        distance_matrix = link_cross_year.compute_distance_with_year_penalty(
+            link_cross_year.PenalizeReportYearDistanceConfig(sparse=sparse),
+            feature_matrix,
+            df,
+        )
+        id_year_df = link_cross_year.cluster_records_dbscan(
+            link_cross_year.DBSCANConfig(), distance_matrix, df, tracker
+        )
+        id_year_df = link_cross_year.split_clusters(
+            link_cross_year.SplitClustersConfig(), distance_matrix, id_year_df, tracker
+        )
+        id_year_dfs.append(
+            link_cross_year.match_orphaned_records(
+                link_cross_year.MatchOrphanedRecordsConfig(),
+                distance_matrix,
+                id_year_df,
+                tracker,
+            )
+        )
+    pd.testing.assert_frame_equal(*id_year_dfs)
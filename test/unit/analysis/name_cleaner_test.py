@@ -0,0 +1,68 @@
+"""Tests for the company and plant name cleaner."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pudl.analysis.record_linkage.name_cleaner import (
+    CLEANING_RULES_DICT,
+    CompanyNameCleaner,
+)
+
+NAMES = [
+    "  The Southern Co  ",
+    "Southern Company, The",
+    "AES Corp.",
+    "Duke Energy (Carolinas) (old)",
+    "Pacific Gas & Electric Co.",
+    "black_hills-power  inc",
+    "Éléctrica del Norte S.A.",
+    "Plant #3 [retired] {unit 2}",
+    "Acme Power L.L.C.",
+    "  ",
+    None,
+    np.nan,
+    12,
+]
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {},
+        {"legal_term_location": 2},
+        {"output_lettercase": "title", "remove_unicode": True},
+        {"normalize_legal_terms": False},
+        {"cleaning_rules_list": list(CLEANING_RULES_DICT)},
+    ],
+)
+def test_apply_name_cleaning_matches_get_clean_data(config):
+    """Cleaning a whole column should match cleaning each of its names separately."""
+    cleaner = CompanyNameCleaner(**config)
+    names = pd.Series(NAMES * 2, index=np.arange(2 * len(NAMES))[::-1], name="name")
+    expected = pd.Series(
+        [cleaner.get_clean_data(name) for name in names],
+        index=names.index,
+        name="name",
+        dtype="object",
+    )
+    # The second pass is served from the cache of cleaned names.
+    for _ in range(2):
+        pd.testing.assert_series_equal(cleaner.apply_name_cleaning(names), expected)
+
+    df = pd.DataFrame({"a": names, "b": names[::-1].to_numpy()})
+    clean_df = cleaner.apply_name_cleaning(df)
+    pd.testing.assert_series_equal(clean_df["a"], expected, check_names=False)
+    pd.testing.assert_frame_equal(
+        cleaner.apply_name_cleaning(df[["a"]], return_as_dframe=True),
+        expected.rename("a").to_frame(),
+    )
+
+
+def test_name_cache_tracks_configuration():
+    """Changing the configuration should not reuse names cleaned the old way."""
+    cleaner = CompanyNameCleaner()
+    names = pd.Series(["Acme Power Company"])
+    assert cleaner.apply_name_cleaning(names).iloc[0] == "acme power company"
+    cleaner.output_lettercase = "title"
+    assert cleaner.apply_name_cleaning(names).iloc[0] == "Acme Power Company"
@@ -668,3 +668,100 @@ def test_one_to_many():
         .set_index("record_id_eia")
     )
     pd.testing.assert_frame_equal(one_to_many_df, plant_gen_one_to_many_expected)
+
+
+OWNED_GENS_MEGA = pd.DataFrame(
+    {
+        "plant_id_eia": 1,
+        "report_date": "2020-01-01",
+        "generator_id": ["a", "b", "c", "a", "b", "c", "c"],
+        "unit_id_pudl": [1, 1, pd.NA, 1, 1, pd.NA, pd.NA],
+        "prime_mover_code": ["CT", "CT", "CA", "CT", "CT", "CA", "CA"],
+        "operational_status": ["existing", "retired", "existing"] * 2 + ["existing"],
+        "operational_status_pudl": "operating",
+        "generator_operating_year": [2001, pd.NA, 1990, 2001, pd.NA, 1990, 1990],
+        "utility_id_eia": [111, 111, 111, 111, 111, 111, 888],
+        "ownership_record_type": ["owned"] * 3 + ["total"] * 4,
+        "capacity_mw": [100.0, 50.0, 25.0, 100.0, 50.0, 100.0, 100.0],
+        "fuel_cost_per_mwh": [10.0, 40.0, pd.NA, 10.0, 40.0, 20.0, 20.0],
+    }
+).astype(
+    {
+        "report_date": "datetime64[s]",
+        "unit_id_pudl": "Int64",
+        "generator_operating_year": "Int64",
+        "fuel_cost_per_mwh": "Float64",
+    }
+)
+
+
+def test_plant_part_aggregator():
+    """Parts aggregated by one shared aggregator should match separate aggregations."""
+    part_names = ["plant", "plant_unit", "plant_prime_mover", "plant_gen"]
+    aggregator = pudl.analysis.plant_parts_eia.PlantPartAggregator(
+        OWNED_GENS_MEGA,
+        part_names,
+        sum_cols=["capacity_mw"],
+        wtavg_dict={"fuel_cost_per_mwh": "capacity_mw"},
+    )
+    for part_name in part_names:
+        part = pudl.analysis.plant_parts_eia.PlantPart(part_name)
+        pd.testing.assert_frame_equal(
+            part.ag_part_by_own_slice(OWNED_GENS_MEGA, aggregator=aggregator),
+            part.ag_part_by_own_slice(
+                OWNED_GENS_MEGA,
+                sum_cols=["capacity_mw"],
+                wtavg_dict={"fuel_cost_per_mwh": "capacity_mw"},
+            ),
+        )
+
+    plant_ag_out = aggregator.aggregate("plant").reset_index(drop=True).convert_dtypes()
+    plant_ag_expected = (
+        pd.DataFrame(
+            {
+                "plant_id_eia": 1,
+                "report_date": "2020-01-01",
+                "operational_status_pudl": "operating",
+                "utility_id_eia": [111, 111, 888],
+                "ownership_record_type": ["owned", "total", "total"],
+                "capacity_mw": [175.0, 250.0, 250.0],
+                # null fuel costs don't count towards the weights
+                "fuel_cost_per_mwh": [20.0, 20.0, 20.0],
+            }
+        )
+        .astype({"report_date": "datetime64[s]"})
+        .convert_dtypes()
+    )
+    pd.testing.assert_frame_equal(plant_ag_out, plant_ag_expected)
+    # generators with a null unit ID aren't part of any unit
+    unit_ag_out = aggregator.aggregate("plant_unit")
+    assert unit_ag_out.capacity_mw.tolist() == [150.0, 150.0]
+
+
+def test_add_attributes():
+    """Consistent, priority and max/min attributes are found in one pass per part."""
+    part_df = pudl.analysis.plant_parts_eia.PlantPart(
+        "plant_unit"
+    ).ag_part_by_own_slice(OWNED_GENS_MEGA, sum_cols=["capacity_mw"], wtavg_dict={})
+    out = pudl.analysis.plant_parts_eia.MakePlantParts().add_attributes(
+        part_df.assign(generator_id=pd.NA),
+        OWNED_GENS_MEGA.assign(
+            technology_description="Natural Gas Fired Combined Cycle",
+            energy_source_code_1="NG",
+            fuel_type_code_pudl="gas",
+            ferc_acct_name="Other",
+            planned_generator_retirement_date=pd.NaT,
+            generator_retirement_date=pd.NaT,
+        ),
+        "plant_unit",
+    )
+    attributes = out.iloc[0]
+    # columns already in the part are left alone
+    assert pd.isna(attributes.generator_id)
+    assert attributes.prime_mover_code == "CT"
+    # the generator operating years are inconsistent because one is null
+    assert pd.isna(attributes.generator_operating_year)
+    # the operational status of the first of the unit's records is used
+    assert attributes.operational_status == "existing"
+    assert attributes.installation_year == 2001
+    assert pd.isna(attributes.construction_year)
@@ -184,6 +184,40 @@ def test_self_union():
     assert_geodataframe_equal(result_two, expected_two)
 
 
+def test_self_union_of_ring():
+    """Test self union of geometries enclosing a hole that is not inside any of them."""
+    gdf = GeoDataFrame(
+        {
+            "geometry": GeoSeries(
+                [
+                    Polygon([(0, 0), (0, 1), (3, 1), (3, 0)]),
+                    Polygon([(2, 0), (2, 3), (3, 3), (3, 0)]),
+                    Polygon([(0, 2), (0, 3), (3, 3), (3, 2)]),
+                    Polygon([(0, 0), (0, 3), (1, 3), (1, 0)]),
+                    Polygon([(5, 5), (5, 6), (6, 6), (6, 5)]),
+                ]
+            ),
+            "y": [3.0, 3.0, 3.0, 3.0, 1.0],
+        }
+    )
+    result = self_union(gdf, ratios=["y"])
+    assert len(result) == 13
+    assert result.area.sum() == 13.0
+    assert result.y.sum() == 13.0
+    assert not result.contains(Polygon([(1, 1), (1, 2), (2, 2), (2, 1)])).any()
+    assert result.index.value_counts().to_dict() == {
+        (0, 1): 2,
+        (0, 3): 2,
+        (1, 2): 2,
+        (2, 3): 2,
+        (0,): 1,
+        (1,): 1,
+        (2,): 1,
+        (3,): 1,
+        (4,): 1,
+    }
+
+
 def test_dissolve():
     """Test mergining of geometries and non-spatial attributes."""
     gdf = GeoDataFrame(
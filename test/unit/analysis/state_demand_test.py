@@ -4,7 +4,10 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from pudl.analysis.state_demand import lookup_state
+from pudl.analysis.state_demand import (
+    impute_ferc714_hourly_demand_matrix,
+    lookup_state,
+)
 
 AK_FIPS = {"name": "Alaska", "code": "AK", "fips": "02"}
 
@@ -34,3 +37,27 @@ AK_FIPS = {"name": "Alaska", "code": "AK", "fips": "02"}
 def test_lookup_state(state: str | int, expected: dict[str, str | int]) -> None:
     """Check that various kinds of state lookups work."""
     assert lookup_state(state) == expected
+
+
+def test_impute_ferc714_hourly_demand_matrix_in_chunks() -> None:
+    """Imputing chunks of years in parallel matches imputing them one at a time."""
+    rng = np.random.default_rng(seed=0)
+    index = pd.date_range("2019-01-01", "2021-12-31 23:00", freq="h")
+    hours = np.arange(len(index))[:, np.newaxis]
+    demand = (2 + np.sin(2 * np.pi * hours / 24 + np.arange(3))) * 1e5
+    df = pd.DataFrame(demand * rng.normal(1, 0.01, size=demand.shape), index=index)
+    mask = rng.random(df.shape) < 0.1
+    # a respondent that doesn't report in one of the years
+    mask[index.year == 2020, 2] = True
+    nulled = df.mask(mask)
+
+    years = [2019, 2020, 2021]
+    imputed = impute_ferc714_hourly_demand_matrix(nulled, years)
+    assert imputed.index.equals(df.index[::-1])
+    assert imputed.loc["2020", 2].isnull().all()
+    pd.testing.assert_frame_equal(
+        impute_ferc714_hourly_demand_matrix(nulled, years, workers=2), imputed
+    )
+    warm_imputed = impute_ferc714_hourly_demand_matrix(nulled, years, warm_start=True)
+    error = (warm_imputed - df).abs() / df
+    assert error[mask].mean().mean() < 0.05
@@ -107,3 +107,35 @@ def test_flags_and_imputes_anomalies(series_seed, anomalies_seed) -> None:
         fit = s.summarize_imputed(imputed, mask)
         # Mean MAPE (mean absolute percent error) is converging
         assert fit["mape"].mean() < fit0["mape"].mean()
+
+
+@pytest.mark.parametrize("shape", [(5, 200), (40, 50), (200, 5)])
+def test_svt_tnn_matches_thresholded_svd(shape) -> None:
+    """Singular value thresholding matches thresholding the full SVD."""
+    rng = np.random.default_rng(seed=0)
+    matrix = rng.normal(size=(shape[0], 3)) @ rng.normal(size=(3, shape[1]))
+    matrix += rng.normal(scale=0.1, size=shape)
+    tau, theta = 1.0, 2
+    u, s, v = np.linalg.svd(matrix, full_matrices=False)
+    s = np.where(np.arange(s.size) < theta, s, s - tau)[s > tau]
+    expected = u[:, : s.size] @ np.diag(s) @ v[: s.size]
+    np.testing.assert_allclose(
+        pudl.analysis.timeseries_cleaning._svt_tnn(matrix, tau=tau, theta=theta),
+        expected,
+        atol=1e-8,
+    )
+
+
+def test_impute_warm_start() -> None:
+    """A warm start from a similar series imputes well from a larger rho0."""
+    x = simulate_series(seed=5)
+    s = pudl.analysis.timeseries_cleaning.Timeseries(x)
+    rng = np.random.default_rng(seed=5)
+    mask = rng.random(x.shape) < 0.2
+    previous = x * rng.normal(1, 0.01, size=x.shape)
+    cold = s.impute(mask=mask, method="tnn", rho0=1, maxiter=10)
+    warm = s.impute(mask=mask, method="tnn", rho0=1, maxiter=10, x0=previous)
+    assert (
+        s.summarize_imputed(warm, mask)["mape"].mean()
+        < s.summarize_imputed(cold, mask)["mape"].mean()
+    )
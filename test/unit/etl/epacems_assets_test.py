@@ -0,0 +1,58 @@
+"""Unit tests for the pudl.etl.epacems_assets module."""
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from pudl.etl.epacems_assets import split_quarter_by_state
+from pudl.metadata.classes import Resource
+
+
+def _write_quarter(path, year_quarter, states, schema, rng):
+    """Write a quarterly partition with random data for the given states."""
+    res = Resource.from_id("core_epacems__hourly_emissions")
+    n_rows = len(states)
+    df = res.format_df(
+        pd.DataFrame(
+            {
+                "plant_id_eia": rng.integers(1, 100, size=n_rows),
+                "plant_id_epa": rng.integers(1, 100, size=n_rows),
+                "emissions_unit_id_epa": rng.integers(1, 10, size=n_rows).astype(str),
+                "operating_datetime_utc": pd.Timestamp(year_quarter[:4])
+                + pd.to_timedelta(np.arange(n_rows), unit="h"),
+                "year": int(year_quarter[:4]),
+                "state": states,
+                "gross_load_mw": rng.normal(size=n_rows),
+            }
+        ).reindex(columns=[field.name for field in res.schema.fields])
+    )
+    pq.write_table(
+        pa.Table.from_pandas(df, schema=schema, preserve_index=False),
+        path / f"epacems-{year_quarter}.parquet",
+    )
+
+
+def test_split_quarter_by_state(tmp_path):
+    """Each quarter-state should match what a filtered read of the quarter returns."""
+    schema = Resource.from_id("core_epacems__hourly_emissions").to_pyarrow()
+    rng = np.random.default_rng(0)
+    states = rng.choice(["CO", "TX", "WY", "ID"], size=50).astype(object)
+    states[:5] = None
+    _write_quarter(tmp_path, "2020q1", states, schema, rng)
+
+    state_tables = list(
+        split_quarter_by_state(tmp_path / "epacems-2020q1.parquet", schema)
+    )
+    assert [t["state"][0].as_py() for t in state_tables] == ["CO", "ID", "TX", "WY"]
+    # Rows without a state are dropped.
+    assert sum(t.num_rows for t in state_tables) == 45
+    for state_table in state_tables:
+        state = state_table["state"][0].as_py()
+        expected = pq.read_table(
+            tmp_path / "epacems-2020q1.parquet",
+            filters=[[("state", "=", state)]],
+            schema=schema,
+        )
+        assert state_table.schema == schema
+        pd.testing.assert_frame_equal(state_table.to_pandas(), expected.to_pandas())
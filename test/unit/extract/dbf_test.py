@@ -0,0 +1,148 @@
+"""Unit tests for pudl.extract.dbf module."""
+
+import io
+import struct
+
+import pandas as pd
+import pytest
+from dbfread import DBF, FieldParser
+
+from pudl.extract.dbf import (
+    FercDbfExtractor,
+    FercFieldParser,
+    PartitionedDataFrame,
+    read_dbf_columns,
+)
+
+FIELDS = [
+    ("NAME", "C", 12),
+    ("AMOUNT", "N", 10),
+    ("COUNT", "N", 6),
+    ("EMPTY", "N", 4),
+    ("DATE", "D", 8),
+    ("FLAG", "L", 1),
+    ("_NullFlags", "0", 1),
+]
+RECORDS = [
+    (b" ", [b"Caf\xe9 du lac", b"   1234.50", b"000012", b"    ", b"20200131", b"T"]),
+    (b" ", [b"  leading", b"         .", b"  0042", b"\x00\x00\x00\x00", b"        "]),
+    (b"*", [b"deleted", b"99", b"99", b"", b"20200101", b"F"]),
+    (b" ", [b"nul\x00\x00", b"\x00\x000012.5", b"     0", b"  * ", b"00000000", b"?"]),
+    (b" ", [b"", b"       1,5", b"  -17 ", b"", b"19991231", b"n"]),
+    (b" ", [b"Caf\xe9 du lac", b"      -0.1", b"     7", b"", b"20200131", b"Y"]),
+]
+
+
+def _dbf_file(fields: list[tuple], records: list[tuple], eof: bool = True) -> bytes:
+    """The contents of a dBase III file with the given fields and records."""
+    header_length = 32 + 32 * len(fields) + 1
+    record_length = 1 + sum(length for _, _, length in fields)
+    header = struct.pack(
+        "<BBBBLHH20x", 0x30, 124, 1, 1, len(records), header_length, record_length
+    )
+    for name, field_type, length in fields:
+        header += struct.pack(
+            "<11scLBB14x", name.encode(), field_type.encode(), 0, length, 0
+        )
+    body = b"".join(
+        flag
+        + b"".join(
+            value.ljust(length) if field_type != "0" else value.ljust(length, b"\x80")
+            for value, (_, field_type, length) in zip(
+                values + [b""] * (len(fields) - len(values)), fields, strict=True
+            )
+        )
+        for flag, values in records
+    )
+    return header + b"\r" + body + (b"\x1a" if eof else b"")
+
+
+def _read_dbf(contents: bytes, parser: type[FieldParser] = FercFieldParser) -> DBF:
+    return DBF(
+        "table.dbf",
+        encoding="latin1",
+        parserclass=parser,
+        ignore_missing_memofile=True,
+        filedata=io.BytesIO(contents),
+    )
+
+
+@pytest.mark.parametrize(
+    "records,parser",
+    [
+        (RECORDS, FercFieldParser),
+        (RECORDS[:1], FercFieldParser),
+        (RECORDS[2:3], FercFieldParser),
+        ([(b" ", [b"a", b"1", b"2"]), (b" ", [b"b", b"00003", b"4"])], FercFieldParser),
+        ([(b" ", [b"a", b"1", b"0"]), (b" ", [b"b", b"2", b"4"])], FercFieldParser),
+        ([], FercFieldParser),
+        ([record for record in RECORDS if record[1][1].strip() != b"."], FieldParser),
+    ],
+)
+@pytest.mark.parametrize("eof", [True, False])
+def test_read_dbf_columns_matches_dbfread(records, parser, eof):
+    """Reading columns should give the same dataframe as reading each record."""
+    contents = _dbf_file(FIELDS, records, eof=eof) + b"garbage after the records"
+    expected = pd.DataFrame(iter(_read_dbf(contents, parser)))
+    pd.testing.assert_frame_equal(
+        read_dbf_columns(_read_dbf(contents, parser)), expected
+    )
+
+
+@pytest.mark.parametrize(
+    "value,parser", [(b"1.2.3", FercFieldParser), (b" .", FieldParser)]
+)
+def test_read_dbf_columns_raises_like_dbfread(value, parser):
+    """Values that the field parser rejects should still raise."""
+    contents = _dbf_file(FIELDS[:2], [(b" ", [b"a", value])])
+    with pytest.raises(ValueError):
+        pd.DataFrame(iter(_read_dbf(contents, parser)))
+    with pytest.raises(ValueError):
+        read_dbf_columns(_read_dbf(contents, parser))
+
+
+class FakeDbfReader:
+    """Loads a small frame for each table and partition, except for some."""
+
+    def get_table_names(self) -> list[str]:
+        return ["a", "b", "c"]
+
+    def load_table_dfs(self, table_name, partitions) -> list[PartitionedDataFrame]:
+        return [
+            PartitionedDataFrame(
+                pd.DataFrame({"table": [table_name], "year": [p["year"]]}), p
+            )
+            for p in partitions
+            if (table_name, p["year"]) != ("b", 2021)
+        ]
+
+
+class FakeDbfExtractor(FercDbfExtractor):
+    DATASET = "fake"
+    DATABASE_NAME = "fake_dbf.sqlite"
+
+    def get_settings(self, global_settings):
+        return global_settings
+
+    def get_dbf_reader(self, datastore):
+        return FakeDbfReader()
+
+
+@pytest.mark.parametrize("workers", [2, 3])
+def test_iter_table_dfs_in_parallel(tmp_path, workers):
+    """Tables loaded in worker processes should come in the same order."""
+    partitions = [{"year": year} for year in range(2018, 2024)]
+
+    def table_dfs(workers: int) -> list[tuple[str, list[pd.DataFrame]]]:
+        extractor = FakeDbfExtractor(None, None, tmp_path, workers=workers)
+        return [
+            (table, [p_df.df for p_df in dfs])
+            for table, dfs in extractor.iter_table_dfs(partitions)
+        ]
+
+    serial = table_dfs(1)
+    parallel = table_dfs(workers)
+    assert [table for table, _ in parallel] == ["a", "b", "c"]
+    assert [len(dfs) for _, dfs in parallel] == [6, 5, 6]
+    for (_, serial_dfs), (_, parallel_dfs) in zip(serial, parallel, strict=True):
+        pd.testing.assert_frame_equal(pd.concat(serial_dfs), pd.concat(parallel_dfs))
@@ -0,0 +1,88 @@
+"""Unit tests for the pudl.extract.epacems module."""
+
+import io
+import zipfile
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+import pudl.extract.epacems as epacems
+
+YEAR_QUARTER = "2022q1"
+
+
+def _cems_csv(n_rows: int) -> str:
+    """Build a small quarterly CEMS CSV with a mix of read and ignored columns."""
+    return pd.DataFrame(
+        {
+            "State": ["CO", "TX", "CO", "WY"] * (n_rows // 4),
+            "Facility Name": "Plant",
+            "Facility ID": [3, 10, 3, 2713] * (n_rows // 4),
+            "Unit ID": ["1", "01A", "1", "2"] * (n_rows // 4),
+            "Associated Stacks": pd.NA,
+            "Date": [f"2022-01-{day % 28 + 1:02}" for day in range(n_rows)],
+            "Hour": [hour % 24 for hour in range(n_rows)],
+            "Operating Time": 1.0,
+            "Gross Load (MW)": [float(i) for i in range(n_rows)],
+            "Steam Load (1000 lb/hr)": pd.NA,
+            "SO2 Mass (lbs)": 0.5,
+            "SO2 Mass Measure Indicator": ["Measured", pd.NA] * (n_rows // 2),
+            "SO2 Rate (lbs/mmBtu)": 0.1,
+            "Heat Input (mmBtu)": 12.0,
+            "Heat Input Measure Indicator": "Calculated",
+            "Primary Fuel Type": "Coal",
+        }
+    ).to_csv(index=False)
+
+
+def _datastore(csv: str) -> MagicMock:
+    """A datastore mock serving a single zipped quarter of CEMS data."""
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr(f"epacems-{YEAR_QUARTER}.csv", csv)
+    ds = MagicMock()
+    ds.get_zipfile_resource.side_effect = lambda *args, **kwargs: zipfile.ZipFile(
+        archive
+    )
+    return ds
+
+
+def test_extract_batches_match_pandas():
+    """Batches read with Arrow should concatenate to what pandas would have read."""
+    csv = _cems_csv(4_000)
+    batches = list(
+        epacems.extract_batches(YEAR_QUARTER, _datastore(csv), block_size=2**14)
+    )
+    assert len(batches) > 1
+
+    expected = pd.read_csv(
+        io.StringIO(csv),
+        usecols=lambda col: col not in epacems.API_IGNORE_COLS,
+        dtype=epacems.API_DTYPE_DICT,
+    )
+    dtypes = {
+        col: dtype
+        for col, dtype in epacems.API_DTYPE_DICT.items()
+        if col in expected.columns
+    }
+    expected = (
+        expected.astype(dtypes)
+        .rename(columns=epacems.API_RENAME_DICT)
+        .assign(year=2022)
+    )
+    pd.testing.assert_frame_equal(
+        epacems.extract(YEAR_QUARTER, _datastore(csv)), expected
+    )
+    pd.testing.assert_frame_equal(
+        epacems._concat_batches(batches), expected, check_categorical=False
+    )
+
+
+def test_extract_missing_quarter():
+    """A quarter that isn't in the datastore yields no batches and an empty frame."""
+    ds = MagicMock()
+    ds.get_zipfile_resource.side_effect = KeyError(YEAR_QUARTER)
+    assert list(epacems.extract_batches(YEAR_QUARTER, ds)) == []
+    df = epacems.extract(YEAR_QUARTER, ds)
+    assert df.empty
+    assert "operating_datetime_utc" in df.columns
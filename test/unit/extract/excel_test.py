@@ -1,6 +1,8 @@
 """Unit tests for pudl.extract.excel module."""
 
+import io
 import unittest
+import zipfile
 from unittest import mock as mock
 
 import pandas as pd
@@ -42,7 +44,7 @@ class FakeExtractor(excel.ExcelExtractor):
         """
         self.METADATA = excel.ExcelMetadata("test")
         self.BLACKLISTED_PAGES = ["shoes"]
-        super().__init__(ds=None)
+        super().__init__(ds=None, **kwargs)
 
     def load_source(self, page, **partition):
         """Returns fake file contents for given page and partition."""
@@ -50,6 +52,14 @@ class FakeExtractor(excel.ExcelExtractor):
         return _fake_data_frames(page_name)
 
 
+class PageFileExtractor(FakeExtractor):
+    """Fake extractor that reads each page from a workbook of its own."""
+
+    def source_filename(self, page, **partition):
+        """Name the workbook after the page."""
+        return f"{page}.xlsx"
+
+
 def _fake_data_frames(page_name, **kwargs):
     """Returns panda.DataFrames.
 
@@ -99,6 +109,42 @@ class TestExtractor(unittest.TestCase):
         }
         assert expected_boxes == res["boxes"].to_dict()
 
+    @staticmethod
+    def test_extract_in_parallel():
+        """Extracting with a process pool gives the same result as extracting serially."""
+        serial = FakeExtractor().extract(year=[2010, 2011])
+        parallel = FakeExtractor(max_workers=2).extract(year=[2010, 2011])
+        assert serial.keys() == parallel.keys()
+        for page, df in serial.items():
+            pd.testing.assert_frame_equal(df, parallel[page])
+
+    @staticmethod
+    def test_extraction_tasks_group_pages_by_workbook():
+        """The pages of each partition are grouped by the workbook they come from."""
+        extractor = FakeExtractor()
+        extractor.BLACKLISTED_PAGES = []
+        tasks = extractor._extraction_tasks(
+            ["books", "boxes", "shoes"], [{"year": 2011}, {"year": 2012}]
+        )
+        assert tasks == [
+            (["books", "boxes"], {"year": 2011}),
+            (["shoes"], {"year": 2011}),
+            (["books", "boxes", "shoes"], {"year": 2012}),
+        ]
+
+    @staticmethod
+    def test_extract_single_partition_in_parallel():
+        """Pages from different workbooks of one partition are extracted in parallel."""
+        extractor = PageFileExtractor(max_workers=2)
+        assert (
+            len(extractor._extraction_tasks(["books", "boxes"], [{"year": 2010}])) == 2
+        )
+        serial = PageFileExtractor().extract(year=2010)
+        parallel = extractor.extract(year=2010)
+        assert serial.keys() == parallel.keys()
+        for page, df in serial.items():
+            pd.testing.assert_frame_equal(df, parallel[page])
+
     # @patch('pudl.extract.excel.pd.read_excel', _fake_data_frames)
     # def test_resulting_dataframes(self):
     #     """Checks that pages across years are merged and columns are translated."""
@@ -120,3 +166,87 @@ class TestExtractor(unittest.TestCase):
 
     # TODO(rousik@gmail.com): need to figure out how to test process_$x methods.
     # TODO(rousik@gmail.com): we should test that empty columns are properly added.
+
+
+def _workbook_zip() -> tuple[bytes, bytes]:
+    """Zip up a workbook with the books and boxes sheets of the test metadata for 2011.
+
+    Returns the zipped archive, and the workbook itself.
+    """
+    rows = pd.DataFrame(
+        {
+            "a": [1, 2, None, 4] * 5,
+            "b": [1.5, None, "x", 2.0] * 5,
+            "c": pd.to_datetime(["2020-01-01", None, "2021-06-30", "2022-02-02"] * 5),
+            "d": ["p", "q", None, "s"] * 5,
+        }
+    )
+    workbook = io.BytesIO()
+    with pd.ExcelWriter(workbook, engine="xlsxwriter") as writer:
+        # Sheet 0 holds books (1 header and 1 footer row to skip), and sheet 1 holds
+        # boxes (10 of each).
+        for sheet, skip in [(0, 1), (1, 10)]:
+            pad = pd.DataFrame({"a": [f"junk {i}" for i in range(skip)]})
+            pad.to_excel(writer, sheet_name=f"sheet{sheet}", index=False, header=False)
+            rows.to_excel(
+                writer, sheet_name=f"sheet{sheet}", startrow=skip, index=False
+            )
+            pad.to_excel(
+                writer,
+                sheet_name=f"sheet{sheet}",
+                startrow=skip + len(rows) + 1,
+                index=False,
+                header=False,
+            )
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("b-file.xlsx", workbook.getvalue())
+    return archive.getvalue(), workbook.getvalue()
+
+
+class TestLoadSource(unittest.TestCase):
+    """Test that ExcelExtractor parses each workbook once per partition."""
+
+    def setUp(self):
+        """Build an extractor whose datastore serves a single test workbook."""
+        archive, self.workbook = _workbook_zip()
+        self.extractor = excel.ExcelExtractor.__new__(excel.ExcelExtractor)
+        self.extractor.METADATA = excel.ExcelMetadata("test")
+        self.extractor.BLACKLISTED_PAGES = ["shoes"]
+        ds = mock.MagicMock()
+        ds.get_zipfile_resource.side_effect = lambda *a, **kw: zipfile.ZipFile(
+            io.BytesIO(archive)
+        )
+        excel.ExcelExtractor.__init__(self.extractor, ds)
+
+    def test_matches_read_excel(self):
+        """Pages read from the cached sheets are the same as reading the workbook."""
+        for page in ["books", "boxes"]:
+            expected = pd.read_excel(
+                io.BytesIO(self.workbook),
+                engine="calamine",
+                sheet_name=self.extractor._metadata.get_sheet_name(page, year=2011),
+                skiprows=self.extractor._metadata.get_skiprows(page, year=2011),
+                skipfooter=self.extractor._metadata.get_skipfooter(page, year=2011),
+            )
+            pd.testing.assert_frame_equal(
+                self.extractor.load_source(page, year=2011), expected
+            )
+
+    def test_workbook_parsed_once_and_released(self):
+        """Both pages come from one parse of the workbook, which is dropped afterwards."""
+        self.extractor.load_source("books", year=2011)
+        self.extractor.load_source("boxes", year=2011)
+        self.assertEqual(1, self.extractor.ds.get_zipfile_resource.call_count)
+        self.assertEqual(2, len(self.extractor._sheet_cache))
+        self.extractor.release_partition(year=2011)
+        self.assertEqual(0, len(self.extractor._sheet_cache))
+        self.assertEqual(0, self.extractor._sheet_cache_bytes)
+
+    def test_cache_evicts_least_recently_used_sheets(self):
+        """Sheets are evicted to stay under the cap, keeping the newest one."""
+        self.extractor.MAX_SHEET_CACHE_BYTES = 1
+        self.extractor.load_source("books", year=2011)
+        self.assertEqual(1, len(self.extractor._sheet_cache))
+        self.extractor.load_source("boxes", year=2011)
+        self.assertEqual(2, self.extractor.ds.get_zipfile_resource.call_count)
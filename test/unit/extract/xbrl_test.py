@@ -1,6 +1,12 @@
 """Tests for xbrl extraction module."""
 
+import json
+import zipfile
+from pathlib import Path
+
+import pandas as pd
 import pytest
+import sqlalchemy as sa
 from dagster import ResourceDefinition
 
 from pudl.extract.xbrl import FercXbrlDatastore, convert_form
@@ -37,18 +43,19 @@ def test_ferc_xbrl_datastore_get_taxonomy(mocker):
 
 def test_ferc_xbrl_datastore_get_filings(mocker):
     datastore_mock = mocker.MagicMock()
-    datastore_mock.get_unique_resource = mocker.MagicMock(
-        return_value=b"Just some bogus bytes"
+    datastore_mock.get_unique_resource_file = mocker.MagicMock(
+        return_value=Path("ferc1-xbrl-2021.zip")
     )
 
     # Call method
     ferc_datastore = FercXbrlDatastore(datastore_mock)
-    ferc_datastore.get_filings(2021, XbrlFormNumber.FORM1)
+    filings = ferc_datastore.get_filings(2021, XbrlFormNumber.FORM1)
 
-    # Check that get_unique_resource was called correctly
-    datastore_mock.get_unique_resource.assert_called_with(
+    # Check that get_unique_resource_file was called correctly
+    datastore_mock.get_unique_resource_file.assert_called_with(
         "ferc1", year=2021, data_format="xbrl"
     )
+    assert filings == Path("ferc1-xbrl-2021.zip")
 
 
 @pytest.mark.parametrize(
@@ -125,6 +132,7 @@ def test_xbrl2sqlite(settings, forms, mocker, tmp_path):
             sql_path=PudlPaths().output_dir / f"ferc{form.value}_xbrl.sqlite",
             batch_size=20,
             workers=10,
+            incremental=False,
         )
 
 
@@ -179,3 +187,132 @@ def test_convert_form(mocker):
             logfile=None,
         )
         extractor_mock.reset_mock()
+
+
+class FakeXbrlDatastore:
+    """Archives of XBRL filings with stand-in checksums."""
+
+    def __init__(self, tmp_path: Path):
+        self.tmp_path = tmp_path
+        self.taxonomy_checksum = "taxonomy"
+        self.filings = {}
+
+    def set_filings(self, year: int, checksum: str, filing_names: list[str]):
+        path = self.tmp_path / f"filings_{year}_{checksum}.zip"
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr("rssfeed", "{}")
+            for name in filing_names:
+                zf.writestr(f"{name}.xbrl", "")
+        self.filings[year] = (path, checksum)
+
+    def get_taxonomy(self, form: XbrlFormNumber):
+        return "taxonomy_archive"
+
+    def get_taxonomy_checksum(self, form: XbrlFormNumber):
+        return self.taxonomy_checksum
+
+    def get_filings(self, year, form: XbrlFormNumber):
+        return self.filings[year][0]
+
+    def get_filings_checksum(self, year, form: XbrlFormNumber):
+        return self.filings[year][1]
+
+
+def _fake_run_main(filings, db_path, datapackage_path, **kwargs):
+    """Write a row for each filing in the archives.
+
+    Like recent releases of ferc_xbrl_extractor, this replaces any existing tables.
+    Filings named ``*_new`` report a fact that the others don't have.
+    """
+    Path(datapackage_path).write_text("{}")
+    names = [
+        Path(name).stem
+        for archive in filings
+        for name in zipfile.ZipFile(archive).namelist()
+        if name.endswith(".xbrl")
+    ]
+    df = pd.DataFrame({"filing_name": names})
+    if any(name.endswith("_new") for name in names):
+        df["new_fact"] = [1.0 if name.endswith("_new") else None for name in names]
+    df.to_sql(
+        "table_duration",
+        sa.create_engine(f"sqlite:///{db_path}"),
+        index=False,
+        if_exists="replace",
+    )
+
+
+def test_convert_form_incrementally(mocker, tmp_path):
+    """Only new and changed archives of filings should be converted again."""
+    run_main = mocker.patch("pudl.extract.xbrl.run_main", side_effect=_fake_run_main)
+    sql_path = tmp_path / "ferc714_xbrl.sqlite"
+    datastore = FakeXbrlDatastore(tmp_path)
+    datastore.set_filings(2021, "a", ["f21_a", "f21_b"])
+    datastore.set_filings(2022, "a", ["f22_a"])
+    datastore.set_filings(2023, "a", ["f23_a"])
+
+    def convert(years: list[int], incremental: bool = True) -> list[Path]:
+        run_main.reset_mock()
+        convert_form(
+            FercGenericXbrlToSqliteSettings(years=years),
+            XbrlFormNumber.FORM714,
+            datastore,
+            output_path=tmp_path,
+            sql_path=sql_path,
+            incremental=incremental,
+        )
+        return [
+            path for call in run_main.call_args_list for path in call.kwargs["filings"]
+        ]
+
+    def filing_names() -> list[str]:
+        return sorted(
+            pd.read_sql(
+                "table_duration", sa.create_engine(f"sqlite:///{sql_path}")
+            ).filing_name
+        )
+
+    assert convert([2021, 2022]) == [
+        datastore.filings[2021][0],
+        datastore.filings[2022][0],
+    ]
+    assert convert([2021, 2022]) == []
+    assert filing_names() == ["f21_a", "f21_b", "f22_a"]
+
+    # Changed, new and dropped years
+    datastore.set_filings(2022, "b", ["f22_a", "f22_b"])
+    assert convert([2022, 2023]) == [
+        datastore.filings[2022][0],
+        datastore.filings[2023][0],
+    ]
+    assert filing_names() == ["f22_a", "f22_b", "f23_a"]
+    state = json.loads((tmp_path / "ferc714_xbrl_conversion.json").read_text())
+    assert state["filings"] == {
+        "2022": {"checksum": "b", "filing_names": ["f22_a", "f22_b"]},
+        "2023": {"checksum": "a", "filing_names": ["f23_a"]},
+    }
+
+    # Facts that only show up in new filings are added to the existing tables.
+    datastore.set_filings(2024, "a", ["f24_new"])
+    assert convert([2022, 2023, 2024]) == [datastore.filings[2024][0]]
+    assert filing_names() == ["f22_a", "f22_b", "f23_a", "f24_new"]
+    df = pd.read_sql("table_duration", sa.create_engine(f"sqlite:///{sql_path}"))
+    new_facts = df.set_index("filing_name").new_fact
+    assert new_facts.isna().to_dict() == {
+        "f22_a": True,
+        "f22_b": True,
+        "f23_a": True,
+        "f24_new": False,
+    }
+    assert new_facts["f24_new"] == 1.0
+
+    # A new taxonomy rebuilds the database from all of the archives.
+    datastore.taxonomy_checksum = "new taxonomy"
+    assert len(convert([2021, 2022, 2023])) == 3
+    assert filing_names() == ["f21_a", "f21_b", "f22_a", "f22_b", "f23_a"]
+
+    # A conversion that isn't incremental forgets about the earlier conversions.
+    sql_path.unlink()
+    assert len(convert([2021], incremental=False)) == 1
+    assert not (tmp_path / "ferc714_xbrl_conversion.json").exists()
+    assert len(convert([2021])) == 1
@@ -5,6 +5,7 @@ from io import StringIO
 import numpy as np
 import pandas as pd
 import pytest
+import sqlalchemy as sa
 from dagster import AssetKey
 from pandas.testing import assert_frame_equal, assert_series_equal
 from pandas.tseries.offsets import BYearEnd
@@ -12,6 +13,7 @@ from pandas.tseries.offsets import BYearEnd
 import pudl
 from pudl.helpers import (
     apply_pudl_dtypes,
+    bulk_load_sqlite,
     convert_col_to_bool,
     convert_df_to_excel_file,
     convert_to_date,
@@ -23,9 +25,12 @@ from pudl.helpers import (
     flatten_list,
     remove_leading_zeros_from_numeric_strings,
     retry,
+    set_sqlite_pragmas,
+    sqlite_pragmas,
     standardize_percentages_ratio,
     zero_pad_numeric_string,
 )
+from pudl.metadata.constants import FIELD_DTYPES_SQL
 from pudl.output.sql.helpers import sql_asset_factory
 
 MONTHLY_GEN_FUEL = pd.DataFrame(
@@ -853,3 +858,77 @@ plant_id_eia,energy_source_code,report_date,fuel_cost_per_mmbtu,fuel_cost_per_mm
         win_type="triang",
     ).round(2)
     pd.testing.assert_frame_equal(test_rolled, out_reordered, check_exact=False)
+
+
+def test_bulk_load_sqlite_matches_to_sql():
+    """The bulk loader stores exactly the same values as DataFrame.to_sql."""
+    md = sa.MetaData()
+    tables = [
+        sa.Table(
+            name,
+            md,
+            sa.Column("date", sa.Date),
+            sa.Column("datetime", FIELD_DTYPES_SQL["datetime"]),
+            sa.Column("flag", sa.Boolean),
+            sa.Column("count", sa.Integer),
+            sa.Column("value", sa.Float),
+            sa.Column("label", sa.Enum("a", "b")),
+            sa.Index(f"{name}_count_idx", "count"),
+        )
+        for name in ["to_sql", "bulk"]
+    ]
+    engine = set_sqlite_pragmas(sa.create_engine("sqlite://"))
+    md.create_all(engine)
+    df = pd.DataFrame(
+        {
+            "date": pd.to_datetime(["2020-01-02", None, "2021-03-04"]),
+            "datetime": pd.to_datetime(
+                ["2020-01-02 03:04:05", None, "2021-12-31 00:00:00"]
+            ),
+            "flag": pd.array([True, None, False], dtype="boolean"),
+            "count": pd.array([1, None, 3], dtype="Int64"),
+            "value": [1.5, np.nan, -2.0],
+            "label": pd.Categorical(["a", None, "b"]),
+        }
+    )
+    with engine.begin() as con:
+        assert con.exec_driver_sql("PRAGMA synchronous").scalar() == 0
+        df.to_sql(
+            "to_sql",
+            con,
+            if_exists="append",
+            index=False,
+            dtype={c.name: c.type for c in tables[0].columns},
+        )
+        bulk_load_sqlite(df, tables[1], con, chunksize=2)
+        expected = con.exec_driver_sql("SELECT * FROM to_sql").fetchall()
+        observed = con.exec_driver_sql("SELECT * FROM bulk").fetchall()
+        assert sa.inspect(con).get_indexes("bulk")
+    assert observed == expected
+
+
+def test_sqlite_pragmas_are_restored(tmp_path):
+    """Bulk load PRAGMAs only apply within the block, even if the load fails."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'test.sqlite'}")
+
+    def pragmas(con: sa.Connection) -> tuple:
+        return tuple(
+            con.exec_driver_sql(f"PRAGMA {name}").scalar()
+            for name in ["journal_mode", "synchronous", "temp_store"]
+        )
+
+    with engine.connect() as con:
+        defaults = pragmas(con)
+        con.exec_driver_sql("CREATE TABLE test (x INTEGER)")
+        con.commit()
+        with (
+            pytest.raises(sa.exc.OperationalError),
+            sqlite_pragmas(con),
+            con.begin(),
+        ):
+            assert pragmas(con) == ("memory", 0, 2)
+            con.exec_driver_sql("INSERT INTO test VALUES (1)")
+            con.exec_driver_sql("INSERT INTO missing VALUES (1)")
+        assert pragmas(con) == defaults
+        assert defaults[:2] == ("delete", 2)
+        assert con.exec_driver_sql("SELECT COUNT(*) FROM test").scalar() == 0
@@ -4,6 +4,7 @@ from pathlib import Path
 
 import alembic.config
 import pandas as pd
+import pyarrow.parquet as pq
 import pytest
 import sqlalchemy as sa
 from dagster import AssetKey, build_input_context, build_output_context
@@ -16,11 +17,14 @@ from pudl.etl.check_foreign_keys import (
 )
 from pudl.io_managers import (
     FercXBRLSQLiteIOManager,
+    PudlParquetIOManager,
     PudlSQLiteIOManager,
     SQLiteIOManager,
+    read_sqlite_table,
 )
 from pudl.metadata import PUDL_PACKAGE
 from pudl.metadata.classes import Package, Resource
+from pudl.workspace.setup import PudlPaths
 
 
 @pytest.fixture
@@ -322,6 +326,154 @@ def test_replace_on_insert(fake_pudl_sqlite_io_manager_fixture):
     pd.testing.assert_frame_equal(new_artist_df, read_df, check_dtype=False)
 
 
+def test_parquet_io_manager_streaming_write():
+    """Streaming writes are sorted by primary key and split into row groups."""
+    table_name = "core_eia__codes_averaging_periods"
+    codes = pd.DataFrame(
+        {
+            "code": ["E", "B", "D", "A", "C"],
+            "label": ["e", "b", "d", "a", "c"],
+            "description": ["Echo", "Bravo", "Delta", "Alpha", "Charlie"],
+        }
+    )
+    manager = PudlParquetIOManager(row_group_size=2)
+    manager.handle_output(build_output_context(asset_key=AssetKey(table_name)), codes)
+
+    parquet_file = pq.ParquetFile(PudlPaths().parquet_path(table_name))
+    assert parquet_file.metadata.num_row_groups == 3
+    assert parquet_file.metadata.row_group(0).num_rows == 2
+    returned_df = manager.load_input(
+        build_input_context(asset_key=AssetKey(table_name))
+    )
+    pd.testing.assert_frame_equal(
+        returned_df,
+        codes.sort_values("code", ignore_index=True),
+        check_dtype=False,
+    )
+
+
+def test_parquet_io_manager_streaming_write_duplicate_across_row_groups():
+    """Duplicate primary keys that straddle two row groups are caught."""
+    codes = pd.DataFrame(
+        {
+            "code": ["B", "A", "B"],
+            "label": ["b", "a", "b"],
+            "description": ["Bravo", "Alpha", "Bravo"],
+        }
+    )
+    output_context = build_output_context(
+        asset_key=AssetKey("core_eia__codes_averaging_periods")
+    )
+    with pytest.raises(ValueError, match="duplicate primary keys"):
+        PudlParquetIOManager(row_group_size=2).handle_output(output_context, codes)
+
+
+def test_parquet_io_manager_load_input_pushdown():
+    """Columns and row filters in the input metadata are applied when reading."""
+    table_name = "core_eia__codes_averaging_periods"
+    codes = pd.DataFrame(
+        {
+            "code": ["A", "B", "C", "D"],
+            "label": ["a", "b", "c", "d"],
+            "description": ["Alpha", "Bravo", "Charlie", "Delta"],
+        }
+    )
+    manager = PudlParquetIOManager(row_group_size=2)
+    manager.handle_output(build_output_context(asset_key=AssetKey(table_name)), codes)
+
+    input_context = build_input_context(
+        asset_key=AssetKey(table_name),
+        metadata={
+            "columns": ["code", "description"],
+            "filters": [[("code", "<", "B")], [("label", "in", ["d"])]],
+        },
+    )
+    returned_df = manager.load_input(input_context)
+    expected = pd.DataFrame(
+        {"code": ["A", "D"], "description": ["Alpha", "Delta"]}
+    ).astype("string")
+    pd.testing.assert_frame_equal(returned_df, expected)
+
+
+def test_pudl_sqlite_io_manager_load_options(fake_pudl_sqlite_io_manager_fixture):
+    """The SQLite IO manager honors the same input metadata as the parquet one."""
+    artist_df = pd.DataFrame(
+        {"artistid": [1, 2, 3], "artistname": ["Co-op Mop", "Cxtxlyst", "Mop Co"]}
+    )
+    fake_pudl_sqlite_io_manager_fixture.handle_output(
+        build_output_context(asset_key=AssetKey("artist")), artist_df
+    )
+    input_context = build_input_context(
+        asset_key=AssetKey("artist"),
+        metadata={"columns": ["artistname"], "filters": [("artistid", ">=", 2)]},
+    )
+    read_df = fake_pudl_sqlite_io_manager_fixture.load_input(input_context)
+    assert read_df.artistname.tolist() == ["Cxtxlyst", "Mop Co"]
+    assert read_df.columns.tolist() == ["artistname"]
+
+
+def test_read_sqlite_table_types_and_duplicates(tmp_path):
+    """Columns come back typed, and duplicate keys split across chunks are caught."""
+    fields = [
+        {"name": "id", "type": "integer", "description": "id"},
+        {"name": "value", "type": "number", "description": "value"},
+        {"name": "flag", "type": "boolean", "description": "flag"},
+        {"name": "date", "type": "date", "description": "date"},
+        {"name": "name", "type": "string", "description": "name"},
+    ]
+    res = Resource(
+        name="things",
+        schema={"fields": fields, "primary_key": ["id"]},
+        description="Things",
+    )
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'things.sqlite'}")
+    with engine.begin() as con:
+        # No primary key constraint, so that the database accepts duplicates.
+        con.exec_driver_sql(
+            "CREATE TABLE things (id INTEGER, value REAL, flag BOOLEAN, date DATE, name TEXT)"
+        )
+        con.exec_driver_sql(
+            "INSERT INTO things VALUES (1, 1.5, 1, '2020-01-01', 'a'), "
+            "(2, NULL, NULL, NULL, NULL), (3, -2.0, 0, '2021-06-30', 'c')"
+        )
+        df = read_sqlite_table(con, res, chunksize=2)
+        expected = res.format_df(
+            pd.DataFrame(
+                {
+                    "id": [1, 2, 3],
+                    "value": [1.5, None, -2.0],
+                    "flag": [True, None, False],
+                    "date": pd.to_datetime(["2020-01-01", None, "2021-06-30"]),
+                    "name": ["a", None, "c"],
+                }
+            )
+        )
+        pd.testing.assert_frame_equal(df, expected)
+
+        con.exec_driver_sql("INSERT INTO things VALUES (1, 0.0, 0, NULL, 'dupe')")
+        with pytest.raises(ValueError, match="duplicate primary keys"):
+            read_sqlite_table(con, res, chunksize=2)
+
+
+@pytest.mark.parametrize("n_rows", [3, 5])
+def test_read_sqlite_table_row_count_changes(tmp_path, mocker, n_rows):
+    """Rows added or removed after they were counted aren't silently misread."""
+    res = Resource(
+        name="things",
+        schema={"fields": [{"name": "id", "type": "integer", "description": "id"}]},
+        description="Things",
+    )
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'things.sqlite'}")
+    with engine.begin() as con:
+        con.exec_driver_sql("CREATE TABLE things (id INTEGER)")
+        con.exec_driver_sql("INSERT INTO things VALUES (1), (2), (3), (4)")
+        count = mocker.MagicMock()
+        count.scalar.return_value = n_rows
+        mocker.patch.object(con, "exec_driver_sql", return_value=count)
+        with pytest.raises(ValueError, match=f"changed from {n_rows}"):
+            read_sqlite_table(con, res, chunksize=2)
+
+
 @pytest.mark.skip(reason="SQLAlchemy is not finding the view. Debug or remove.")
 def test_handling_view_with_metadata(fake_pudl_sqlite_io_manager_fixture):
     """Make sure an users can create and load views when it has metadata."""
@@ -2,6 +2,7 @@
 
 import pandas as pd
 import pandera as pr
+import pydantic
 import pytest
 
 from pudl.metadata import PUDL_PACKAGE
@@ -13,7 +14,7 @@ from pudl.metadata.classes import (
     Resource,
     SnakeCase,
 )
-from pudl.metadata.fields import FIELD_METADATA, apply_pudl_dtypes
+from pudl.metadata.fields import FIELD_METADATA, apply_pudl_dtypes, get_pudl_dtypes
 from pudl.metadata.helpers import format_errors
 from pudl.metadata.resources import RESOURCE_METADATA
 from pudl.metadata.sources import SOURCES
@@ -62,6 +63,35 @@ def test_pyarrow_schemas(resource_name: str):
     _ = PUDL_RESOURCES[resource_name].to_pyarrow()
 
 
+@pytest.mark.parametrize("resource_name", sorted(PUDL_RESOURCES.keys()))
+def test_cached_resources_match_new_resources(resource_name: str):
+    """Cached Resources and their memoized schemas should match newly built ones."""
+    cached = Resource.from_id(resource_name)
+    new = Resource(**Resource.dict_from_id(resource_name))
+    cached.to_pyarrow()
+    assert Resource.from_id(resource_name) is cached
+    assert cached.to_pyarrow().equals(new.to_pyarrow(), check_metadata=True)
+    assert cached.to_pandas_dtypes() == new.to_pandas_dtypes()
+    assert cached.to_pandas_dtypes(compact=True) == new.to_pandas_dtypes(compact=True)
+    assert cached.to_sql().compare(new.to_sql())
+    assert cached.to_sql() is cached.to_sql()
+    assert cached.get_field_names() == [field.name for field in new.schema.fields]
+    for field in cached.schema.fields:
+        assert cached.get_field(field.name) is field
+
+
+def test_cached_resources_are_protected():
+    """Cached Resources can't be modified through their attributes or schemas."""
+    resource = Resource.from_id("core_eia__entity_plants")
+    with pytest.raises(pydantic.ValidationError):
+        resource.name = "core_eia__entity_plants_modified"
+    resource.to_pandas_dtypes()["plant_id_eia"] = "float64"
+    assert resource.to_pandas_dtypes()["plant_id_eia"] == "Int64"
+    with pytest.raises(KeyError, match="not_a_field is not part of"):
+        resource.get_field("not_a_field")
+    assert PUDL_PACKAGE.to_sql() is PUDL_PACKAGE.to_sql()
+
+
 @pytest.mark.parametrize("encoder_name", sorted(PUDL_ENCODERS.keys()))
 def test_encoders(encoder_name: SnakeCase):
     """Verify that Encoders work on the kinds of values they're supposed to."""
@@ -76,6 +106,42 @@ def test_field_definitions(field_name: str):
     _ = Field(name=field_name, **FIELD_METADATA[field_name])
 
 
+@pytest.mark.parametrize("group", [None, "eia", "ferc1", "not_a_group"])
+def test_pudl_dtypes_are_compiled_once(group: str | None):
+    """The PUDL dtypes of each group are shared in a read-only mapping."""
+    dtypes = get_pudl_dtypes(group=group)
+    assert get_pudl_dtypes(group=group) is dtypes
+    assert dtypes == get_pudl_dtypes(group=group, field_meta=dict(FIELD_METADATA))
+    with pytest.raises(TypeError):
+        dtypes["plant_id_eia"] = "float64"
+
+
+def test_get_pudl_dtypes_with_group_overrides():
+    """Group overrides change the dtype without modifying the field metadata."""
+    field_meta = {"a": {"type": "integer"}, "b": {"type": "string"}}
+    by_group = {"g": {"a": {"type": "number"}, "b": {"description": "B"}}}
+    assert get_pudl_dtypes("g", field_meta, by_group) == {"a": "float64", "b": "string"}
+    assert get_pudl_dtypes(None, field_meta, by_group) == {"a": "Int64", "b": "string"}
+    assert field_meta["a"] == {"type": "integer"}
+
+
+def test_apply_pudl_dtypes_only_casts_differing_columns(mocker):
+    """Columns that already have their PUDL dtypes are left alone."""
+    df = pd.DataFrame(
+        {
+            "plant_id_eia": pd.array([1, 2], dtype="Int64"),
+            "capacity_mw": ["1.5", None],
+            "not_a_field": [1, 2],
+        }
+    )
+    astype = mocker.spy(pd.DataFrame, "astype")
+    typed = apply_pudl_dtypes(df)
+    astype.assert_called_once_with(df, {"capacity_mw": "float64"})
+    pd.testing.assert_frame_equal(typed, df.astype({"capacity_mw": "float64"}))
+    with pytest.raises(ValueError, match="not_a_field"):
+        apply_pudl_dtypes(df, strict=True)
+
+
 def test_defined_fields_are_used():
     """Check that all fields which are defined are actually used."""
     used_fields = set()
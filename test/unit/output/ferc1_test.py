@@ -19,8 +19,10 @@ Stuff we are testing:
 """
 
 import logging
+import tempfile
 import unittest
 from io import StringIO
+from pathlib import Path
 
 import networkx as nx
 import pandas as pd
@@ -367,6 +369,60 @@ class TestTagPropagation(TestForestSetup):
         ]:
             assert annotated_tags[post_yes_node]["in_rate_base"] == "yes"
 
+    def test_leafy_meta_weights_and_cache(self):
+        """Leaves get the product of the weights and the tags of their ancestors."""
+        edges = [
+            (self.parent, self.child1),
+            (self.parent, self.child2),
+            (self.child1, self.grand_child11),
+            (self.child1, self.grand_child12),
+        ]
+        exploded_calcs = self._exploded_calcs_from_edges(edges)
+        exploded_calcs.loc[
+            exploded_calcs.xbrl_factoid.isin(["reported_1_1", "reported_1_1_2"]),
+            "weight",
+        ] = -1
+        tags = pd.DataFrame([self.parent, self.grand_child11]).assign(
+            in_rate_base=["yes", "no"], in_root_boose=["yus", pd.NA]
+        )
+        with tempfile.TemporaryDirectory() as cache_dir:
+            forest = XbrlCalculationForestFerc1(
+                exploded_calcs=exploded_calcs,
+                seeds=[self.parent],
+                tags=tags,
+                cache_dir=cache_dir,
+            )
+            leafy_meta = forest.leafy_meta.set_index("xbrl_factoid")
+            assert set(leafy_meta.index) == {
+                "reported_1_2",
+                "reported_1_1_1",
+                "reported_1_1_2",
+            }
+            assert (leafy_meta.xbrl_factoid_root == "reported_1").all()
+            assert leafy_meta.weight.to_dict() == {
+                "reported_1_2": 1,
+                "reported_1_1_1": -1,
+                "reported_1_1_2": 1,
+            }
+            assert leafy_meta.tags_in_rate_base.to_dict() == {
+                "reported_1_2": "yes",
+                "reported_1_1_1": "no",
+                "reported_1_1_2": "yes",
+            }
+            assert (leafy_meta.tags_in_root_boose == "yus").all()
+
+            # A forest with the same contents reads the cached leafy metadata back
+            cached = XbrlCalculationForestFerc1(
+                exploded_calcs=exploded_calcs,
+                seeds=[self.parent],
+                tags=tags,
+                cache_dir=cache_dir,
+            )
+            assert cached.content_hash == forest.content_hash
+            assert len(list(Path(cache_dir).glob("*.parquet"))) == 1
+            pd.testing.assert_frame_equal(cached.leafy_meta, forest.leafy_meta)
+            assert "annotated_forest" not in cached.__dict__
+
 
 def test_get_core_ferc1_asset_description():
     valid_core_ferc1_asset_name = "core_ferc1__yearly_income_statements_sched114"
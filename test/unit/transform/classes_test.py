@@ -1200,3 +1200,76 @@ def test_null_strip_non_numeric_values():
     out_col = strip_non_numeric_values(col)
     if not out_col.isnull().all():
         raise AssertionError("strip_non_numeric_values not nulling non-int values")
+
+
+class StagingTransformer(AbstractTableTransformer):
+    """A TableTransformer that only records which stage the data has passed through."""
+
+    table_id: enum.Enum = TableId.TEST_TABLE
+
+    @cache_df(key="start")
+    def transform_start(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Start the transform."""
+        return df.assign(stage="start")
+
+    @cache_df(key="main")
+    def transform_main(self, df: pd.DataFrame) -> pd.DataFrame:
+        """The main body of the transform."""
+        return df.assign(stage="main")
+
+    @cache_df(key="end")
+    def transform_end(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Finish up the transform."""
+        df["stage"] = "end"
+        return df
+
+
+def test_transform_spills_cached_dfs(tmp_path):
+    """Cached dataframes can be spilled to parquet files and read back."""
+    transformer = StagingTransformer(
+        params=TableTransformParams(),
+        cache_dfs=True,
+        clear_cached_dfs=False,
+        cache_dir=tmp_path,
+    )
+    actual = transformer.transform(STRING_DATA)
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        f"{TableId.TEST_TABLE.value}__{stage}.parquet"
+        for stage in ["end", "main", "start"]
+    ]
+    assert_frame_equal(actual, transformer.get_cached_df("end"))
+    for stage in ["start", "main", "end"]:
+        assert (transformer.get_cached_df(stage)["stage"] == stage).all()
+    transformer.clear_cache()
+    assert not list(tmp_path.iterdir())
+
+
+def test_clear_cache_only_affects_its_own_transformer(tmp_path):
+    """Clearing the cache of one transformer leaves those of others alone."""
+    transformers = [
+        StagingTransformer(
+            params=TableTransformParams(),
+            cache_dfs=True,
+            clear_cached_dfs=False,
+            cache_dir=tmp_path / name,
+        )
+        for name in ["first", "second"]
+    ]
+    for transformer in transformers:
+        transformer.transform(STRING_DATA)
+    transformers[0].clear_cache()
+    assert not list((tmp_path / "first").iterdir())
+    assert len(list((tmp_path / "second").iterdir())) == 3
+    assert (transformers[1].get_cached_df("main")["stage"] == "main").all()
+
+
+def test_cached_dfs_are_snapshots():
+    """Changes to a dataframe after it was cached should not leak into the cache."""
+    transformer = StagingTransformer(
+        params=TableTransformParams(), cache_dfs=True, clear_cached_dfs=False
+    )
+    actual = transformer.transform(STRING_DATA)
+    # transform_end modifies the dataframe returned by transform_main in place.
+    assert (transformer.get_cached_df("main")["stage"] == "main").all()
+    actual["stage"] = "changed"
+    assert (transformer.get_cached_df("end")["stage"] == "end").all()
@@ -38,3 +38,41 @@ def test_harmonize_eia_epa_orispl():
     )
     actual_df = epacems.harmonize_eia_epa_orispl(cems_test_df, crosswalk_test_df)
     pd.testing.assert_frame_equal(expected_df, actual_df, check_dtype=False)
+
+
+def test_transform_batches_match_transform():
+    """Transforming a quarter in batches should give the same records as all at once."""
+    raw_df = pd.DataFrame(
+        {
+            "state": ["CO", "TX", "CO", "TX", "CO", "TX"],
+            "plant_id_epa": [2713, 10, 2713, 10, 2713, 10],
+            "emissions_unit_id_epa": ["01A", "02", "01A", "02", "01A", "02"],
+            "op_date": ["2022-01-01"] * 6,
+            "op_hour": [0, 0, 1, 1, 2, 2],
+            "gross_load_mw": [100.0, 2500.0, 110.0, 90.0, 120.0, 95.0],
+            "year": 2022,
+        }
+    )
+    crosswalk = pd.DataFrame(
+        {
+            "plant_id_epa": [2713, 10],
+            "plant_id_eia": [58697, 10],
+            "emissions_unit_id_epa": ["01A", "2"],
+        }
+    )
+    plants = pd.DataFrame(
+        {
+            "plant_id_eia": [58697, 10],
+            "timezone": ["America/Denver", "America/Chicago"],
+        }
+    )
+    expected = epacems.transform(raw_df, crosswalk, plants)
+    batches = [raw_df.iloc[:2], raw_df.iloc[2:5], raw_df.iloc[5:]]
+    actual = pd.concat(
+        epacems.transform_batches(batches, crosswalk, plants), ignore_index=True
+    )
+    pd.testing.assert_frame_equal(actual, expected)
+    assert (
+        expected.operating_datetime_utc.iloc[0]
+        == pd.Timestamp("2022-01-01 07:00")  # Denver is UTC-7 in January
+    )
@@ -2,6 +2,7 @@
 
 import datetime
 import itertools
+import threading
 from io import StringIO
 
 import hypothesis
@@ -559,6 +560,43 @@ books,big_fact,earth,12.0,44,2312,{3+4+5}
     )
 
 
+def test_calculate_values_from_components_weights_and_nulls():
+    """Weighted sums skip null components and yield parents that have no data."""
+    calculation_components = pd.DataFrame(
+        {
+            "table_name_parent": "books",
+            "xbrl_factoid_parent": ["net", "net", "net", "gross", "gross"],
+            "table_name": "books",
+            "xbrl_factoid": ["income", "expense", "missing", "bonus", "other"],
+            "weight": [1.0, -1.0, 1.0, 1.0, 1.0],
+        }
+    )
+    data = pd.DataFrame(
+        {
+            "table_name": "books",
+            "xbrl_factoid": ["income", "expense", "bonus", "other", "net", "income"],
+            "value": [10.0, 4.0, 7.0, np.nan, 6.0, 3.0],
+            "utility_id_ferc1": [1, 1, 1, 1, 1, 2],
+            "report_year": 2021,
+        }
+    )
+    actual = calculate_values_from_components(
+        calculation_components=calculation_components,
+        data=data,
+        calc_idx=["table_name", "xbrl_factoid"],
+        value_col="value",
+    ).set_index(["xbrl_factoid", "utility_id_ferc1"])
+    # Reported components keep a null calculated value
+    assert pd.isna(actual.loc[("income", 1), "calculated_value"])
+    # Null and absent components are left out of the sums
+    assert actual.loc[("net", 1), "calculated_value"] == 6.0
+    assert actual.loc[("net", 2), "calculated_value"] == 3.0
+    # Calculated values are added even if the parent was never reported
+    assert actual.loc[("gross", 1), "calculated_value"] == 7.0
+    assert pd.isna(actual.loc[("gross", 1), "value"])
+    assert len(actual) == len(data) + 2
+
+
 TABLE_NAME = "table_a"
 FACT_NAME = "my_cool_fact"
 VALUE_COL = "value"
@@ -1317,3 +1355,38 @@ def test_filter_for_freshest_data_xbrl(df):
     hypothesis.note(f"The freshest data:\n{deduped}")
     hypothesis.note(f"Paired by context:\n{paired_by_context}")
     assert (paired_by_context._merge == "both").all()
+
+
+@pytest.mark.parametrize("concurrent_branches", [False, True])
+def test_transform_start_concurrent_branches(concurrent_branches):
+    """The DBF and XBRL branches give the same result whether or not they overlap."""
+    barrier = threading.Barrier(2, timeout=5)
+
+    class FakeTransformer(Ferc1AbstractTableTransformer):
+        table_id = TableIdFerc1.STEAM_PLANTS_FUEL
+
+        def process_dbf(self, raw_dbf):
+            if self.concurrent_branches:
+                barrier.wait()  # Only passes if the XBRL branch is running too
+            return raw_dbf.assign(source="dbf")
+
+        def process_xbrl(self, raw_xbrl_instant, raw_xbrl_duration):
+            if self.concurrent_branches:
+                barrier.wait()
+            return pd.concat([raw_xbrl_instant, raw_xbrl_duration]).assign(
+                source="xbrl"
+            )
+
+    raw_dbf = pd.DataFrame({"report_year": [2019, 2020]})
+    raw_xbrl_instant = pd.DataFrame({"report_year": [2021]})
+    raw_xbrl_duration = pd.DataFrame({"report_year": [2022]})
+    actual = FakeTransformer(concurrent_branches=concurrent_branches).transform_start(
+        raw_dbf, raw_xbrl_instant, raw_xbrl_duration
+    )
+    expected = pd.DataFrame(
+        {
+            "report_year": [2019, 2020, 2021, 2022],
+            "source": ["dbf", "dbf", "xbrl", "xbrl"],
+        }
+    )
+    pd.testing.assert_frame_equal(actual, expected)
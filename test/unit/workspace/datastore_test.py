@@ -1,8 +1,12 @@
 """Unit tests for Datastore module."""
 
+import hashlib
+import http.server
 import io
 import json
+import pickle
 import re
+import threading
 import unittest
 import zipfile
 from typing import Any
@@ -10,7 +14,7 @@ from typing import Any
 import pytest
 import responses
 
-from pudl.workspace import datastore
+from pudl.workspace import datastore, resource_cache
 from pudl.workspace.resource_cache import PudlResourceKey
 
 
@@ -340,7 +344,8 @@ class TestZenodoFetcher(unittest.TestCase):
 
 def test_get_zipfile_resource_failure(mocker):
     ds = datastore.Datastore()
-    ds.get_unique_resource = mocker.MagicMock(return_value=b"")
+    ds._get_unique_resource_key = mocker.MagicMock()
+    ds._get_resource_file = mocker.MagicMock(return_value=io.BytesIO(b""))
     sleep_mock = mocker.MagicMock()
     with (
         mocker.patch("time.sleep", sleep_mock),
@@ -357,7 +362,8 @@ def test_get_zipfile_resource_eventual_success(mocker):
         a_zipfile.writestr("file_name", file_contents)
 
     ds = datastore.Datastore()
-    ds.get_unique_resource = mocker.MagicMock(return_value=b"")
+    ds._get_unique_resource_key = mocker.MagicMock()
+    ds._get_resource_file = mocker.MagicMock(return_value=io.BytesIO(b""))
     with (
         mocker.patch("time.sleep"),
         mocker.patch(
@@ -381,7 +387,7 @@ def test_get_zipfile_resources_eventual_success(mocker):
         a_zipfile.writestr("file_name", file_contents)
 
     ds = datastore.Datastore()
-    ds.get_resources = mocker.MagicMock(
+    ds.get_resource_files = mocker.MagicMock(
         return_value=iter(
             [
                 (
@@ -415,4 +421,182 @@ def test_get_zipfile_resources_eventual_success(mocker):
                 assert test_file.read().decode(encoding="utf-8") == file_contents
 
 
+@pytest.fixture
+def http_stub():
+    """Serve a dict of path -> bytes from a local HTTP server running in a thread."""
+    files: dict[str, bytes] = {}
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            body = files.get(self.path)
+            if body is None:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", files
+    server.shutdown()
+    server.server_close()
+
+
+def _stub_datastore(tmp_path, base_url, files, resources):
+    """Datastore with a local cache whose zenodo fetcher points at the stub server."""
+    doi = datastore.ZenodoDoiSettings().epacems
+    for name, content, _ in resources:
+        files[f"/{name}"] = content
+    desc = datastore.DatapackageDescriptor(
+        {
+            "resources": [
+                {"name": name, "path": f"{base_url}/{name}", "hash": md5}
+                for name, _, md5 in resources
+            ]
+        },
+        dataset="epacems",
+        doi=doi,
+    )
+    ds = datastore.Datastore(local_cache_path=tmp_path)
+    ds._zenodo_fetcher = MockableZenodoFetcher(descriptors={doi: desc})
+    return ds, doi
+
+
+def test_cache_resources_streams_into_local_cache(tmp_path, http_stub):
+    """Resources are downloaded concurrently and moved whole into the local cache."""
+    base_url, files = http_stub
+    contents = {f"part{i}.zip": bytes([i]) * (3 * 2**20 + i) for i in range(5)}
+    ds, doi = _stub_datastore(
+        tmp_path,
+        base_url,
+        files,
+        [(n, c, hashlib.md5(c).hexdigest()) for n, c in contents.items()],  # noqa: S324
+    )
+    cached = ds.cache_resources("epacems", max_workers=3)
+    assert sorted(res.name for res in cached) == sorted(contents)
+    for name, content in contents.items():
+        res = PudlResourceKey("epacems", doi, name)
+        assert (tmp_path / res.get_local_path()).read_bytes() == content
+    # No partial downloads are left behind, and nothing is downloaded twice.
+    assert not list(tmp_path.glob(".download-*"))
+    assert ds.cache_resources("epacems") == []
+
+
+def test_download_with_bad_checksum_is_not_cached(tmp_path, http_stub):
+    """A download that doesn't match its checksum never shows up in the cache."""
+    base_url, files = http_stub
+    ds, doi = _stub_datastore(
+        tmp_path, base_url, files, [("bad.zip", b"wrongContent", "0" * 32)]
+    )
+    with pytest.raises(datastore.ChecksumMismatchError):
+        ds.cache_resources("epacems")
+    assert not ds._cache.contains(PudlResourceKey("epacems", doi, "bad.zip"))
+    assert not list(tmp_path.glob(".download-*"))
+
+
+def test_get_resources_downloads_through_cache(tmp_path, http_stub):
+    """get_resources() still yields the content of resources it downloads."""
+    base_url, files = http_stub
+    ds, doi = _stub_datastore(
+        tmp_path,
+        base_url,
+        files,
+        [("first", b"blah", "6f1ed002ab5595859014ebf0951522d9")],
+    )
+    assert ds.get_unique_resource("epacems", name="first") == b"blah"
+    assert ds._cache.contains(PudlResourceKey("epacems", doi, "first"))
+
+
+def test_get_zipfile_resource_reads_from_local_cache(tmp_path, http_stub, mocker):
+    """Locally cached archives are opened from disk, not loaded into memory."""
+    base_url, files = http_stub
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("data.csv", "a,b\n1,2\n")
+    content = archive.getvalue()
+    ds, _ = _stub_datastore(
+        tmp_path,
+        base_url,
+        files,
+        [("archive.zip", content, hashlib.md5(content).hexdigest())],  # noqa: S324
+    )
+    ds.cache_resources("epacems")
+    get = mocker.spy(ds._cache, "get")
+    with ds.get_zipfile_resource("epacems", name="archive.zip") as zf:
+        assert zf.read("data.csv") == b"a,b\n1,2\n"
+        assert not isinstance(zf.fp, io.BytesIO)
+    get.assert_not_called()
+
+
+def test_cache_resources_copies_from_read_only_layer(tmp_path, http_stub, mocker):
+    """Resources in a farther cache layer are copied file to file, not via memory."""
+    base_url, files = http_stub
+    content = b"cachedContent"
+    ds, doi = _stub_datastore(
+        tmp_path / "local",
+        base_url,
+        files,
+        [("part.zip", content, hashlib.md5(content).hexdigest())],  # noqa: S324
+    )
+    res = PudlResourceKey("epacems", doi, "part.zip")
+    shared = resource_cache.LocalFileCache(tmp_path / "shared")
+    shared.add(res, content)
+    shared._read_only = True
+    ds._cache.add_cache_layer(shared)
+    get = mocker.spy(ds._cache, "get")
+    download = mocker.spy(ds._zenodo_fetcher, "download_resource")
+
+    assert ds.cache_resources("epacems") == [res]
+    assert (tmp_path / "local" / res.get_local_path()).read_bytes() == content
+    assert ds._cache.is_optimally_cached(res)
+    get.assert_not_called()
+    download.assert_not_called()
+
+
+def test_corrupt_copy_in_read_only_layer_is_not_cached(tmp_path, http_stub):
+    """Copies from farther cache layers are checked against the datapackage md5."""
+    base_url, files = http_stub
+    ds, doi = _stub_datastore(
+        tmp_path / "local", base_url, files, [("bad.zip", b"content", "0" * 32)]
+    )
+    res = PudlResourceKey("epacems", doi, "bad.zip")
+    shared = resource_cache.LocalFileCache(tmp_path / "shared")
+    shared.add(res, b"content")
+    shared._read_only = True
+    ds._cache.add_cache_layer(shared)
+    with pytest.raises(datastore.ChecksumMismatchError):
+        ds.cache_resources("epacems")
+    assert not ds._cache.is_optimally_cached(res)
+    assert not list((tmp_path / "local").glob(".download-*"))
+
+
+def test_get_unique_resource_checksum_does_not_download(tmp_path, http_stub):
+    """Checksums come from the datapackage descriptor, not the resources."""
+    base_url, files = http_stub
+    ds, doi = _stub_datastore(
+        tmp_path,
+        base_url,
+        files,
+        [("first", b"blah", "6f1ed002ab5595859014ebf0951522d9")],
+    )
+    checksum = ds.get_unique_resource_checksum("epacems", name="first")
+    assert checksum == "6f1ed002ab5595859014ebf0951522d9"
+    assert not ds._cache.contains(PudlResourceKey("epacems", doi, "first"))
+
+
+def test_datastore_pickles_to_the_same_caches(tmp_path):
+    """A pickled Datastore is reconstructed with the same cache configuration."""
+    res = PudlResourceKey("epacems", "doi", "file.zip")
+    ds = datastore.Datastore(local_cache_path=tmp_path)
+    ds._cache.add(res, b"blah")
+    clone = pickle.loads(pickle.dumps(ds))  # noqa: S301
+    assert clone._cache.get(res) == b"blah"
+
+
 # TODO(rousik): add unit tests for Datasource class as well
@@ -60,6 +60,40 @@ class TestLocalFileCache(unittest.TestCase):
         self.assertTrue(second_cache.contains(res))
         self.assertEqual(b"testContents", second_cache.get(res))
 
+    def test_add_file(self):
+        """Adding a file moves it into the cache without leaving temporary files."""
+        res = PudlResourceKey("ds", "doi", "file.zip")
+        src = Path(tempfile.mkdtemp()) / "download.zip"
+        src.write_bytes(b"zipContents")
+        self.cache.add_file(res, src)
+        self.assertFalse(src.exists())
+        self.assertEqual(b"zipContents", self.cache.get(res))
+        self.assertEqual(
+            [".file.zip.md5", "file.zip"],
+            sorted(p.name for p in (Path(self.test_dir) / "ds" / "doi").iterdir()),
+        )
+        shutil.rmtree(src.parent)
+
+    def test_checksum_sidecar(self):
+        """Checksums are recorded when resources are added and kept up to date."""
+        res = PudlResourceKey("ds", "doi", "file.zip")
+        self.cache.add(res, b"blah")
+        self.assertEqual("6f1ed002ab5595859014ebf0951522d9", self.cache.get_md5(res))
+        self.assertEqual(
+            Path(self.test_dir) / "ds" / "doi" / "file.zip", self.cache.get_path(res)
+        )
+        # Re-adding the resource replaces its checksum.
+        self.cache.add(res, b"")
+        self.assertEqual("d41d8cd98f00b204e9800998ecf8427e", self.cache.get_md5(res))
+        # Resources cached without a sidecar get one the first time it's needed.
+        sidecar = Path(self.test_dir) / "ds" / "doi" / ".file.zip.md5"
+        sidecar.unlink()
+        self.assertEqual("d41d8cd98f00b204e9800998ecf8427e", self.cache.get_md5(res))
+        self.assertTrue(sidecar.exists())
+        self.cache.delete(res)
+        self.assertFalse(sidecar.exists())
+        self.assertIsNone(self.cache.get_path(res))
+
     def test_deletion(self):
         """Deleting resources has expected effect on later get() / contains() calls."""
         res = PudlResourceKey("a", "b", "c")